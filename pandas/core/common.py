@@ -2681,6 +2681,84 @@ def _get_handle(path, mode, encoding=None, compression=None):
     return f
 
 
+def _is_binary_stream(f):
+    """ whether f only accepts bytes, as opposed to a text handle """
+    if not compat.PY3:
+        return False
+    import io
+    if isinstance(f, io.TextIOBase):
+        return False
+    if isinstance(f, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+    return 'b' in getattr(f, 'mode', '')
+
+
+class CompressedWriter(object):
+
+    """
+    Writable sink for text which is encoded and passed through an
+    incremental compressor before being written to the binary handle "f".
+
+    Nothing is buffered beyond what the compressor keeps internally, so the
+    output can go to any stream with a ``write`` method (a socket file, the
+    stdin of a process, ...). ``close`` writes the end of the compressed
+    stream but leaves "f" open.
+
+    Parameters
+    ----------
+    f : binary file-like object
+    compression : {'gzip', 'bz2', None}
+        None passes the encoded text through unchanged
+    encoding : string, default 'utf-8'
+        encoding of text written on python 3, python 2 str is written as is
+    """
+
+    def __init__(self, f, compression=None, encoding=None):
+        self.f = f
+        self.encoding = encoding or 'utf-8'
+        self.compression = compression
+        if compression is None:
+            self.compressor = None
+        elif compression == 'gzip':
+            import zlib
+            # wbits offset of 16 selects the gzip container
+            self.compressor = zlib.compressobj(9, zlib.DEFLATED,
+                                               16 + zlib.MAX_WBITS)
+        elif compression == 'bz2':
+            import bz2
+            self.compressor = bz2.BZ2Compressor()
+        else:
+            raise ValueError('Unrecognized compression type: %s' %
+                             compression)
+        self.closed = False
+
+    def write(self, s):
+        if isinstance(s, compat.text_type):
+            s = s.encode(self.encoding)
+        if self.compressor is not None:
+            s = self.compressor.compress(s)
+        if s:
+            self.f.write(s)
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+    def flush(self):
+        if hasattr(self.f, 'flush'):
+            self.f.flush()
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        if self.compressor is not None:
+            tail = self.compressor.flush()
+            if tail:
+                self.f.write(tail)
+        self.flush()
+
+
 if compat.PY3:  # pragma: no cover
     def UnicodeReader(f, dialect=csv.excel, encoding="utf-8", **kwds):
         # ignore encoding
@@ -19,7 +19,9 @@ from pandas.tslib import iNaT, Timestamp, Timedelta
 import numpy as np
 
 import itertools
+import heapq
 import csv
+import re
 
 from pandas.tseries.period import PeriodIndex, DatetimeIndex
 
@@ -1162,6 +1164,11 @@ def _get_level_lengths(levels, sentinel=''):
     return result
 
 
+# float_format / date_format specs CSVWriter can expand natively
+_native_float_format_re = re.compile(r'^%[-+ #0]*\d{0,3}(\.\d{1,3})?[eEfFgG]$')
+_native_date_format_re = re.compile(r'^(?:[^%]|%[YmdHMSf%])*$')
+
+
 class CSVFormatter(object):
 
     def __init__(self, obj, path_or_buf=None, sep=",", na_rep='', float_format=None,
@@ -1169,11 +1176,19 @@ class CSVFormatter(object):
                  mode='w', nanRep=None, encoding=None, quoting=None,
                  line_terminator='\n', chunksize=None, engine=None,
                  tupleize_cols=False, quotechar='"', date_format=None,
-                 doublequote=True, escapechar=None):
+                 doublequote=True, escapechar=None, compression=None):
 
         self.engine = engine  # remove for 0.13
         self.obj = obj
 
+        if compression not in (None, 'gzip', 'bz2'):
+            raise ValueError('Unrecognized compression type: %s' %
+                             compression)
+        if compression is not None and path_or_buf is None:
+            raise ValueError('compression requires a path or a writable '
+                             'stream to write to')
+        self.compression = compression
+
         if path_or_buf is None:
             path_or_buf = StringIO()
 
@@ -1201,6 +1216,7 @@ class CSVFormatter(object):
         self.escapechar = escapechar
 
         self.line_terminator = line_terminator
+        self.native_writer = None
 
         self.date_format = date_format
 
@@ -1368,13 +1384,24 @@ class CSVFormatter(object):
     def save(self):
         # create the writer & save
         if hasattr(self.path_or_buf, 'write'):
-            f = self.path_or_buf
+            handle = self.path_or_buf
             close = False
+        elif self.compression is not None:
+            mode = self.mode if 'b' in self.mode else self.mode + 'b'
+            handle = open(self.path_or_buf, mode)
+            close = True
         else:
-            f = com._get_handle(self.path_or_buf, self.mode,
-                                encoding=self.encoding)
+            handle = com._get_handle(self.path_or_buf, self.mode,
+                                     encoding=self.encoding)
             close = True
 
+        # compressed output, and text for binary streams, is encoded and
+        # written as each row / chunk is produced
+        f = handle
+        if self.compression is not None or com._is_binary_stream(handle):
+            f = com.CompressedWriter(handle, compression=self.compression,
+                                     encoding=self.encoding)
+
         try:
             writer_kwargs = dict(lineterminator=self.line_terminator,
                                  delimiter=self.sep, quoting=self.quoting,
@@ -1387,6 +1414,18 @@ class CSVFormatter(object):
             else:
                 self.writer = csv.writer(f, **writer_kwargs)
 
+            # rows are formatted natively unless the dialect or the
+            # formats need the csv module
+            self.native_writer = None
+            if self.engine != 'python' and self._can_write_native():
+                self.native_writer = lib.CSVWriter(
+                    f, delimiter=self.sep, quotechar=self.quotechar,
+                    quoting=self.quoting, doublequote=self.doublequote,
+                    escapechar=self.escapechar,
+                    lineterminator=self.line_terminator, na_rep=self.na_rep,
+                    float_format=self._native_float_format,
+                    date_format=self.date_format)
+
             if self.engine == 'python':
                 # to be removed in 0.13
                 self._helper_csv(self.writer, na_rep=self.na_rep,
@@ -1399,9 +1438,55 @@ class CSVFormatter(object):
             else:
                 self._save()
 
+            if f is not handle:
+                f.close()
         finally:
             if close:
-                f.close()
+                handle.close()
+
+    def _can_write_native(self):
+        # py2 with an encoding goes through UnicodeWriter, whose conversion
+        # rules differ from the csv module's
+        if not compat.PY3 and self.encoding is not None:
+            return False
+        if self.quoting not in (csv.QUOTE_MINIMAL, csv.QUOTE_ALL,
+                                csv.QUOTE_NONNUMERIC, csv.QUOTE_NONE):
+            return False
+
+        def _is_ascii_char(c, allow_none=False):
+            if c is None:
+                return allow_none
+            return (isinstance(c, compat.string_types) and len(c) == 1 and
+                    ord(c) < 128)
+
+        if not (_is_ascii_char(self.sep) and
+                _is_ascii_char(self.quotechar, allow_none=True) and
+                _is_ascii_char(self.escapechar, allow_none=True)):
+            return False
+        if not isinstance(self.line_terminator, compat.string_types):
+            return False
+        if not isinstance(self.na_rep, compat.string_types):
+            return False
+
+        # date formats other than the simple strftime subset handled
+        # natively make the whole frame go through the csv module
+        date_format = self.date_format
+        if date_format is not None:
+            if not (isinstance(date_format, compat.string_types) and
+                    len(date_format) <= 64 and
+                    _native_date_format_re.match(date_format)):
+                return False
+        return True
+
+    @property
+    def _native_float_format(self):
+        # a plain printf-style float spec can be expanded in C, anything
+        # else is applied through FloatBlock.to_native_types
+        float_format = self.float_format
+        if (float_format and isinstance(float_format, compat.string_types)
+                and _native_float_format_re.match(float_format)):
+            return float_format
+        return None
 
     def _save_header(self):
 
@@ -1501,6 +1586,9 @@ class CSVFormatter(object):
 
     def _save_chunk(self, start_i, end_i):
 
+        if self.native_writer is not None:
+            return self._save_chunk_native(start_i, end_i)
+
         data_index = self.data_index
 
         # create the data for a chunk
@@ -1521,6 +1609,47 @@ class CSVFormatter(object):
 
         lib.write_csv_rows(self.data, ix, self.nlevels, self.cols, self.writer)
 
+    def _save_chunk_native(self, start_i, end_i):
+
+        slicer = slice(start_i, end_i)
+        kinds = [None] * len(self.data)
+        native_floats = (not self.float_format or
+                         self._native_float_format is not None)
+
+        for b in self.blocks:
+            if b.is_float and b.dtype == np.float64 and native_floats:
+                kind, dtype = 'f', np.float64
+            elif (b.is_integer and not b.is_timedelta and
+                  (b.dtype.kind == 'i' or b.dtype.itemsize < 8)):
+                kind, dtype = 'i', np.int64
+            elif b.is_bool:
+                kind, dtype = 'b', np.uint8
+            elif b.is_datetime:
+                kind, dtype = 'M', np.int64
+            else:
+                kind, dtype = 'O', None
+
+            if kind == 'O':
+                d = b.to_native_types(slicer=slicer, na_rep=self.na_rep,
+                                      float_format=self.float_format,
+                                      date_format=self.date_format)
+            else:
+                values = b.values[:, slicer]
+                if b.is_bool or b.is_datetime:
+                    values = values.view(dtype)
+                d = [np.ascontiguousarray(v, dtype=dtype) for v in values]
+
+            for col_loc, col in zip(b.mgr_locs, d):
+                self.data[col_loc] = col
+                kinds[col_loc] = kind
+
+        ix = self.data_index.to_native_types(slicer=slicer,
+                                             na_rep=self.na_rep,
+                                             float_format=self.float_format,
+                                             date_format=self.date_format)
+
+        self.native_writer.write_rows(self.data, kinds, ix, self.nlevels)
+
 # from collections import namedtuple
 # ExcelCell = namedtuple("ExcelCell",
 #                        'row, col, val, style, mergestart, mergeend')
@@ -1689,19 +1818,20 @@ class ExcelFormatter(object):
                 self.rowcounter += 1
         return itertools.chain(gen, gen2)
 
-    def _format_body(self):
+    def _format_body(self, row_major=False):
 
         if isinstance(self.df.index, MultiIndex):
-            return self._format_hierarchical_rows()
+            return self._format_hierarchical_rows(row_major)
         else:
-            return self._format_regular_rows()
+            return self._format_regular_rows(row_major)
 
-    def _format_regular_rows(self):
+    def _format_regular_rows(self, row_major=False):
         has_aliases = isinstance(self.header, (tuple, list, np.ndarray, Index))
         if has_aliases or self.header:
             self.rowcounter += 1
 
         coloffset = 0
+        index_cells = []
         # output index and index_label?
         if self.index:
             # chek aliases
@@ -1734,24 +1864,18 @@ class ExcelFormatter(object):
                 index_values = self.df.index.to_timestamp()
 
             coloffset = 1
-            for idx, idxval in enumerate(index_values):
-                yield ExcelCell(self.rowcounter + idx, 0, idxval, header_style)
-
-        # Get a frame that will account for any duplicates in the column names.
-        col_mapped_frame = self.df.loc[:, self.columns]
+            index_cells.append(self._format_index_values(index_values, 0))
 
-        # Write the body of the frame data series by series.
-        for colidx in range(len(self.columns)):
-            series = col_mapped_frame.iloc[:, colidx]
-            for i, val in enumerate(series):
-                yield ExcelCell(self.rowcounter + i, colidx + coloffset, val)
+        for cell in self._format_data(index_cells, coloffset, row_major):
+            yield cell
 
-    def _format_hierarchical_rows(self):
+    def _format_hierarchical_rows(self, row_major=False):
         has_aliases = isinstance(self.header, (tuple, list, np.ndarray, Index))
         if has_aliases or self.header:
             self.rowcounter += 1
 
         gcolidx = 0
+        index_cells = []
 
         if self.index:
             index_labels = self.df.index.names
@@ -1784,46 +1908,115 @@ class ExcelFormatter(object):
                                                  self.df.index.levels,
                                                  self.df.index.labels):
                     values = levels.take(labels)
-                    for i in spans:
-                        if spans[i] > 1:
-                            yield ExcelCell(self.rowcounter + i,
-                                            gcolidx,
-                                            values[i],
-                                            header_style,
-                                            self.rowcounter + i + spans[i] - 1,
-                                            gcolidx)
-                        else:
-                            yield ExcelCell(self.rowcounter + i,
-                                            gcolidx,
-                                            values[i],
-                                            header_style)
+                    index_cells.append(
+                        self._format_index_spans(spans, values, gcolidx))
                     gcolidx += 1
 
             else:
                 # Format hierarchical rows with non-merged values.
                 for indexcolvals in zip(*self.df.index):
-                    for idx, indexcolval in enumerate(indexcolvals):
-                        yield ExcelCell(self.rowcounter + idx,
-                                        gcolidx,
-                                        indexcolval,
-                                        header_style)
+                    index_cells.append(
+                        self._format_index_values(indexcolvals, gcolidx))
                     gcolidx += 1
 
+        for cell in self._format_data(index_cells, gcolidx, row_major):
+            yield cell
+
+    def _format_index_values(self, values, colidx):
+        rowcounter = self.rowcounter
+        for idx, idxval in enumerate(values):
+            yield ExcelCell(rowcounter + idx, colidx, idxval, header_style)
+
+    def _format_index_spans(self, spans, values, colidx):
+        rowcounter = self.rowcounter
+        for i in sorted(spans):
+            if spans[i] > 1:
+                yield ExcelCell(rowcounter + i,
+                                colidx,
+                                values[i],
+                                header_style,
+                                rowcounter + i + spans[i] - 1,
+                                colidx)
+            else:
+                yield ExcelCell(rowcounter + i,
+                                colidx,
+                                values[i],
+                                header_style)
+
+    def _format_data(self, index_cells, coloffset, row_major=False):
+        """
+        Yield the cells of the index columns (a list of generators, one per
+        index column) and of the frame data. The data is yielded series by
+        series, or with row_major row by row, and the cells of the index
+        columns are then merged in by row.
+        """
         # Get a frame that will account for any duplicates in the column names.
         col_mapped_frame = self.df.loc[:, self.columns]
+        rowcounter = self.rowcounter
+
+        if row_major:
+            data_cells = self._format_data_rows(col_mapped_frame, rowcounter,
+                                                coloffset)
+            for cell in _merge_cells_by_row(index_cells + [data_cells]):
+                yield cell
+            return
+
+        for cell in itertools.chain(*index_cells):
+            yield cell
 
         # Write the body of the frame data series by series.
         for colidx in range(len(self.columns)):
             series = col_mapped_frame.iloc[:, colidx]
             for i, val in enumerate(series):
-                yield ExcelCell(self.rowcounter + i, gcolidx + colidx, val)
+                yield ExcelCell(rowcounter + i, colidx + coloffset, val)
+
+    def _format_data_rows(self, frame, rowcounter, coloffset, chunksize=1000):
+        # Write the body of the frame data row by row, taking the values of
+        # a chunk of rows at a time from each series
+        ncols = len(self.columns)
+        for start in range(0, len(frame), chunksize):
+            chunk = frame.iloc[start:start + chunksize]
+            values = [list(chunk.iloc[:, colidx]) for colidx in range(ncols)]
+            for i, row in enumerate(zip(*values)):
+                for colidx, val in enumerate(row):
+                    yield ExcelCell(rowcounter + start + i, colidx + coloffset,
+                                    val)
+
+    def get_formatted_cells(self, row_major=False):
+        """
+        Yield the ExcelCells of the frame
 
-    def get_formatted_cells(self):
-        for cell in itertools.chain(self._format_header(),
-                                    self._format_body()):
+        Parameters
+        ----------
+        row_major : boolean, default False
+            Yield the cells in row order, as needed by the streaming
+            writers. By default the frame data is yielded column by column.
+        """
+        header = self._format_header()
+        if row_major:
+            # the header cells are few, the body is generated in row order
+            header = sorted(header, key=lambda cell: cell.row)
+
+        for cell in itertools.chain(header, self._format_body(row_major)):
             cell.val = self._format_value(cell.val)
             yield cell
 
+
+def _merge_cells_by_row(cell_iters):
+    """
+    Merge iterables of ExcelCells that are each ordered by row into one
+    iterator ordered by row. Within a row the cells keep the order of the
+    iterables.
+    """
+    def _decorate(n, cells):
+        for i, cell in enumerate(cells):
+            yield cell.row, n, i, cell
+
+    merged = heapq.merge(*[_decorate(n, cells)
+                           for n, cells in enumerate(cell_iters)])
+    for row, n, i, cell in merged:
+        yield cell
+
 # ----------------------------------------------------------------------
 # Array formatters
 
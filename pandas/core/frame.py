@@ -1105,14 +1105,15 @@ class DataFrame(NDFrame):
                mode='w', encoding=None, quoting=None,
                quotechar='"', line_terminator='\n', chunksize=None,
                tupleize_cols=False, date_format=None, doublequote=True,
-               escapechar=None, **kwds):
+               escapechar=None, compression=None, **kwds):
         r"""Write DataFrame to a comma-separated values (csv) file
 
         Parameters
         ----------
         path_or_buf : string or file handle, default None
             File path or object, if None is provided the result is returned as
-            a string.
+            a string. Any object with a ``write`` method is accepted; binary
+            streams are written encoded text.
         sep : character, default ","
             Field delimiter for the output file.
         na_rep : string, default ''
@@ -1157,6 +1158,9 @@ class DataFrame(NDFrame):
             or new (expanded format) if False)
         date_format : string, default None
             Format string for datetime objects
+        compression : {'gzip', 'bz2', None}, default None
+            Compress the output while it is written. A path is opened in
+            binary mode, a stream receives the compressed bytes.
         cols : kwarg only alias of columns [deprecated]
         """
 
@@ -1172,7 +1176,8 @@ class DataFrame(NDFrame):
                                      tupleize_cols=tupleize_cols,
                                      date_format=date_format,
                                      doublequote=doublequote,
-                                     escapechar=escapechar)
+                                     escapechar=escapechar,
+                                     compression=compression)
         formatter.save()
 
         if path_or_buf is None:
@@ -1255,7 +1260,9 @@ class DataFrame(NDFrame):
                                        index_label=index_label,
                                        merge_cells=merge_cells,
                                        inf_rep=inf_rep)
-        formatted_cells = formatter.get_formatted_cells()
+        # streaming writers need the cells in row order
+        row_major = getattr(excel_writer, 'streaming', False)
+        formatted_cells = formatter.get_formatted_cells(row_major=row_major)
         excel_writer.write_cells(formatted_cells, sheet_name,
                                  startrow=startrow, startcol=startcol)
         if need_save:
@@ -1299,6 +1306,22 @@ class DataFrame(NDFrame):
                              write_index=write_index)
         writer.write_file()
 
+    def to_blockfile(self, path):
+        """
+        Write the blocks of the DataFrame to a blockfile, a binary layout
+        that ``read_blockfile`` memory maps back without parsing or copying
+
+        THIS IS AN EXPERIMENTAL LIBRARY and the storage format
+        may not be stable until a future release.
+
+        Parameters
+        ----------
+        path : string
+            File path
+        """
+        from pandas.io.blockfile import to_blockfile
+        return to_blockfile(self, path)
+
     @Appender(fmt.docstring_to_string, indents=1)
     def to_string(self, buf=None, columns=None, col_space=None, colSpace=None,
                   header=True, index=True, na_rep='NaN', formatters=None,
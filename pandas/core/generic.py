@@ -788,7 +788,7 @@ class NDFrame(PandasObject):
 
     def to_json(self, path_or_buf=None, orient=None, date_format='epoch',
                 double_precision=10, force_ascii=True, date_unit='ms',
-                default_handler=None):
+                default_handler=None, lines=False):
         """
         Convert the object to a JSON string.
 
@@ -836,6 +836,10 @@ class NDFrame(PandasObject):
             Handler to call if object cannot otherwise be converted to a
             suitable format for JSON. Should receive a single argument which is
             the object to convert and return a serialisable object.
+        lines : boolean, default False
+            Write line-delimited JSON, one record per line. Only valid with
+            orient='records' (which is the default when lines=True). Rows are
+            encoded and written in blocks rather than as one string.
 
         Returns
         -------
@@ -851,7 +855,8 @@ class NDFrame(PandasObject):
             double_precision=double_precision,
             force_ascii=force_ascii,
             date_unit=date_unit,
-            default_handler=default_handler)
+            default_handler=default_handler,
+            lines=lines)
 
     def to_hdf(self, path_or_buf, key, **kwargs):
         """ activate the HDFStore
@@ -917,7 +922,7 @@ class NDFrame(PandasObject):
         return packers.to_msgpack(path_or_buf, self, **kwargs)
 
     def to_sql(self, name, con, flavor='sqlite', schema=None, if_exists='fail',
-               index=True, index_label=None, chunksize=None):
+               index=True, index_label=None, chunksize=None, method=None):
         """
         Write records stored in a DataFrame to a SQL database.
 
@@ -949,12 +954,23 @@ class NDFrame(PandasObject):
         chunksize : int, default None
             If not None, then rows will be written in batches of this size at a
             time.  If None, all rows will be written at once.
+        method : {None, 'multi', callable}, default None
+            Controls the SQL insertion clause used:
+
+            - None : Uses standard SQL ``INSERT`` clause (one per row).
+            - 'multi': Pass multiple values in a single ``INSERT`` clause,
+              with as many rows per statement as the parameter limit of the
+              database allows.
+            - callable with signature ``(pd_table, conn, keys, data_iter)``,
+              e.g. to use a bulk loader of the database driver. See
+              ``pandas.io.sql.to_sql`` for details.
 
         """
         from pandas.io import sql
         sql.to_sql(
             self, name, con, flavor=flavor, schema=schema, if_exists=if_exists,
-            index=index, index_label=index_label, chunksize=chunksize)
+            index=index, index_label=index_label, chunksize=chunksize,
+            method=method)
 
     def to_pickle(self, path):
         """
@@ -2314,7 +2314,7 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
     def to_csv(self, path, index=True, sep=",", na_rep='',
                float_format=None, header=False,
                index_label=None, mode='w', nanRep=None, encoding=None,
-               date_format=None):
+               date_format=None, compression=None):
         """
         Write Series to a comma-separated values (csv) file
 
@@ -2342,6 +2342,8 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
             non-ascii, for python versions prior to 3
         date_format: string, default None
             Format string for datetime objects.
+        compression : {'gzip', 'bz2', None}, default None
+            Compress the output while it is written
         """
         from pandas.core.frame import DataFrame
         df = DataFrame(self)
@@ -2349,7 +2351,8 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
         result = df.to_csv(path, index=index, sep=sep, na_rep=na_rep,
                   float_format=float_format, header=header,
                   index_label=index_label, mode=mode, nanRep=nanRep,
-                  encoding=encoding, date_format=date_format)
+                  encoding=encoding, date_format=date_format,
+                  compression=compression)
         if path is None:
             return result
 
@@ -12,4 +12,5 @@ from pandas.io.sql import read_sql, read_sql_table, read_sql_query
 from pandas.io.stata import read_stata
 from pandas.io.pickle import read_pickle, to_pickle
 from pandas.io.packers import read_msgpack, to_msgpack
+from pandas.io.blockfile import read_blockfile, to_blockfile
 from pandas.io.gbq import read_gbq
@@ -0,0 +1,377 @@
+"""
+Blockfile: a binary layout of the blocks of a DataFrame that can be memory
+mapped back without parsing or copying.
+
+The file starts with a magic string and is followed by one segment per
+array, each aligned on a page boundary. The header describing the axes, the
+blocks and the string dictionaries is JSON and comes last, followed by its
+length and the magic string again:
+
+    MAGIC | segments ... | header | header length (uint64 LE) | MAGIC
+
+Numeric, boolean, datetime and timedelta blocks are stored as their raw
+values. Object blocks holding strings are stored as integer codes into a
+string dictionary, and categoricals as their codes and categories.
+
+THIS IS AN EXPERIMENTAL LIBRARY and the storage format may not be stable
+until a future release.
+"""
+
+import struct
+
+import numpy as np
+
+import pandas.json as _json
+from pandas import compat
+from pandas.compat import lzip
+from pandas import (Index, Int64Index, Float64Index, MultiIndex,
+                    DatetimeIndex, PeriodIndex, TimedeltaIndex, DataFrame,
+                    Categorical)
+from pandas.core.internals import (BlockManager, make_block, IntBlock,
+                                   FloatBlock, ComplexBlock, BoolBlock,
+                                   DatetimeBlock, TimeDeltaBlock, ObjectBlock,
+                                   CategoricalBlock)
+import pandas.core.algorithms as algos
+import pandas.core.common as com
+import pandas.tslib as tslib
+
+_MAGIC = b'PDBLOCK1'
+_VERSION = 1
+
+# every segment starts on a page boundary
+_ALIGNMENT = 4096
+
+_BLOCK_CLASSES = dict((klass.__name__, klass)
+                      for klass in [IntBlock, FloatBlock, ComplexBlock,
+                                    BoolBlock, DatetimeBlock, TimeDeltaBlock,
+                                    ObjectBlock, CategoricalBlock])
+
+_INDEX_CLASSES = dict((klass.__name__, klass)
+                      for klass in [Index, Int64Index, Float64Index])
+
+
+def to_blockfile(obj, path):
+    """
+    Write the blocks of a DataFrame to a blockfile
+
+    Parameters
+    ----------
+    obj : DataFrame
+    path : string
+        File path
+    """
+    if not isinstance(obj, DataFrame):
+        raise TypeError('blockfile can only store a DataFrame')
+
+    with open(path, 'wb') as fh:
+        writer = _BlockFileWriter(fh)
+        writer.write_frame(obj)
+
+
+def read_blockfile(path, mmap_mode='c'):
+    """
+    Load a DataFrame from a blockfile
+
+    The values of the numeric, boolean, datetime and timedelta blocks of the
+    returned frame's BlockManager are ``np.memmap`` views of the file, so
+    they are only paged in as they are used. String and categorical blocks
+    are decoded into memory.
+
+    Parameters
+    ----------
+    path : string
+        File path
+    mmap_mode : {None, 'r', 'r+', 'c'}, default 'c'
+        Mode of the memory maps, as in ``numpy.load``. 'c' (copy-on-write)
+        keeps changes to the values in memory, 'r' maps the values read-only
+        and 'r+' writes changes through to the file. If None, the values are
+        read into memory instead.
+
+    Returns
+    -------
+    frame : DataFrame
+    """
+    if mmap_mode not in (None, 'r', 'r+', 'c'):
+        raise ValueError("mmap_mode must be one of None, 'r', 'r+' or 'c', "
+                         "got %r" % (mmap_mode,))
+
+    with open(path, 'rb') as fh:
+        reader = _BlockFileReader(fh, path, mmap_mode)
+        return reader.read_frame()
+
+
+def _encode_name(name):
+    # the JSON header has no tuples, they are restored from lists
+    if isinstance(name, tuple):
+        return list(name)
+    return name
+
+
+def _decode_name(name):
+    if isinstance(name, list):
+        return tuple(name)
+    return name
+
+
+def _string_kind(values):
+    """ the kind of a string dictionary, raising for non-string values """
+    if all(isinstance(x, compat.text_type) for x in values):
+        return 'text'
+    elif all(isinstance(x, compat.binary_type) for x in values):
+        return 'bytes'
+    elif (not compat.PY3 and
+            all(isinstance(x, compat.string_types) for x in values)):
+        return 'text'
+
+    kinds = set(type(x).__name__ for x in values
+                if not isinstance(x, compat.string_types))
+    raise TypeError('blockfile can only store object values that are '
+                    'strings, got %s' % ', '.join(sorted(kinds)))
+
+
+class _BlockFileWriter(object):
+
+    def __init__(self, fh):
+        self.fh = fh
+        self.strings = []
+
+    def write_frame(self, frame):
+        mgr = frame._data
+        self.fh.write(_MAGIC)
+
+        axes = [self.write_index(ax) for ax in mgr.axes]
+        blocks = [self.write_block(blk) for blk in mgr.blocks]
+
+        header = {'version': _VERSION,
+                  'axes': axes,
+                  'blocks': blocks,
+                  'strings': self.strings}
+        header = _json.dumps(header, double_precision=15).encode('utf-8')
+        self.fh.write(header)
+        self.fh.write(struct.pack('<Q', len(header)))
+        self.fh.write(_MAGIC)
+
+    def _align(self):
+        pos = self.fh.tell()
+        pad = -pos % _ALIGNMENT
+        if pad:
+            self.fh.write(b'\x00' * pad)
+        return pos + pad
+
+    def write_array(self, values):
+        offset = self._align()
+        # tofile writes in C order straight from the array, without
+        # building a copy of it as bytes
+        if values.size:
+            values.tofile(self.fh)
+        return {'offset': offset,
+                'dtype': values.dtype.str,
+                'shape': list(values.shape)}
+
+    def write_bytes(self, data):
+        offset = self._align()
+        self.fh.write(data)
+        return {'offset': offset, 'nbytes': len(data)}
+
+    def write_strings(self, values):
+        """ write a string dictionary, returning its position """
+        kind = _string_kind(values)
+        encoded = [x if isinstance(x, compat.binary_type)
+                   else x.encode('utf-8') for x in values]
+
+        lengths = np.array([len(x) for x in encoded], dtype=np.int64)
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+
+        self.strings.append({'kind': kind,
+                             'offsets': self.write_array(offsets),
+                             'data': self.write_bytes(b''.join(encoded))})
+        return len(self.strings) - 1
+
+    def write_objects(self, values):
+        codes, uniques = algos.factorize(values.ravel())
+        dictionary = self.write_strings(uniques)
+        codes = com._coerce_indexer_dtype(codes, uniques).reshape(values.shape)
+        return {'kind': 'strings',
+                'codes': self.write_array(codes),
+                'dictionary': dictionary}
+
+    def write_values(self, values):
+        if com.is_categorical_dtype(values):
+            return {'kind': 'categorical',
+                    'codes': self.write_array(values.codes),
+                    'categories': self.write_index(values.categories),
+                    'ordered': bool(values.ordered),
+                    'name': _encode_name(values.name)}
+        elif values.dtype == np.object_:
+            return self.write_objects(values)
+        return {'kind': 'array', 'data': self.write_array(values)}
+
+    def write_block(self, block):
+        klass = block.__class__.__name__
+        if klass not in _BLOCK_CLASSES:
+            raise TypeError('blockfile cannot store a %s' % klass)
+
+        return {'klass': klass,
+                'placement': block.mgr_locs.as_array.tolist(),
+                'values': self.write_values(block.values)}
+
+    def write_index(self, index):
+        if isinstance(index, MultiIndex):
+            return {'klass': 'MultiIndex',
+                    'names': [_encode_name(n) for n in index.names],
+                    'levels': [self.write_index(lev) for lev in index.levels],
+                    'labels': [self.write_array(lab) for lab in index.labels]}
+
+        desc = {'klass': index.__class__.__name__,
+                'name': _encode_name(index.name)}
+        if isinstance(index, PeriodIndex):
+            desc.update(freq=index.freqstr, data=self.write_array(index.asi8))
+        elif isinstance(index, DatetimeIndex):
+            # the values are stored as UTC
+            tz = index.tz
+            if tz is not None:
+                tz = tslib.get_timezone(tz)
+            desc.update(freq=index.freqstr, tz=tz,
+                        data=self.write_array(index.asi8))
+        elif isinstance(index, TimedeltaIndex):
+            desc.update(freq=index.freqstr,
+                        data=self.write_array(index.values))
+        elif desc['klass'] in _INDEX_CLASSES:
+            values = index.values
+            if values.dtype == np.object_:
+                desc['data'] = self.write_objects(values)
+            else:
+                desc['data'] = {'kind': 'array',
+                                'data': self.write_array(values)}
+        else:
+            raise TypeError('blockfile cannot store a %s' % desc['klass'])
+        return desc
+
+
+class _BlockFileReader(object):
+
+    def __init__(self, fh, path, mmap_mode):
+        self.fh = fh
+        self.path = path
+        self.mmap_mode = mmap_mode
+        self.header = self._read_header()
+        self._strings = {}
+
+    def _read_header(self):
+        footer = len(_MAGIC) + 8
+        magic = self.fh.read(len(_MAGIC))
+        self.fh.seek(0, 2)
+        size = self.fh.tell()
+        if magic != _MAGIC or size < len(_MAGIC) + footer:
+            raise ValueError('%s is not a blockfile' % self.path)
+
+        self.fh.seek(size - footer)
+        tail = self.fh.read(footer)
+        if tail[8:] != _MAGIC:
+            raise ValueError('%s is not a blockfile' % self.path)
+        length, = struct.unpack('<Q', tail[:8])
+
+        self.fh.seek(size - footer - length)
+        header = _json.loads(self.fh.read(length).decode('utf-8'),
+                             precise_float=True)
+        if header['version'] > _VERSION:
+            raise ValueError('blockfile version %s is not supported'
+                             % header['version'])
+        return header
+
+    def read_frame(self):
+        header = self.header
+        axes = [self.read_index(ax) for ax in header['axes']]
+        blocks = [self.read_block(blk) for blk in header['blocks']]
+        return DataFrame(BlockManager(blocks, axes))
+
+    def read_array(self, desc):
+        dtype = np.dtype(str(desc['dtype']))
+        shape = tuple(desc['shape'])
+        count = int(np.prod(shape))
+
+        if self.mmap_mode is None or count == 0:
+            self.fh.seek(desc['offset'])
+            values = np.fromfile(self.fh, dtype=dtype, count=count)
+            return values.reshape(shape)
+        return np.memmap(self.path, dtype=dtype, mode=self.mmap_mode,
+                         offset=desc['offset'], shape=shape)
+
+    def read_bytes(self, desc):
+        self.fh.seek(desc['offset'])
+        return self.fh.read(desc['nbytes'])
+
+    def read_strings(self, i):
+        """ the i-th string dictionary, as an object array """
+        if i not in self._strings:
+            desc = self.header['strings'][i]
+            offsets = np.asarray(self.read_array(desc['offsets'])).tolist()
+            data = self.read_bytes(desc['data'])
+
+            strings = [data[start:stop]
+                       for start, stop in lzip(offsets[:-1], offsets[1:])]
+            if desc['kind'] == 'text':
+                strings = [x.decode('utf-8') for x in strings]
+
+            values = np.empty(len(strings), dtype=object)
+            values[:] = strings
+            self._strings[i] = values
+        return self._strings[i]
+
+    def read_values(self, desc):
+        kind = desc['kind']
+        if kind == 'array':
+            return self.read_array(desc['data'])
+        elif kind == 'strings':
+            uniques = self.read_strings(desc['dictionary'])
+            codes = self.read_array(desc['codes'])
+            values = com.take_1d(uniques, np.asarray(codes).ravel(),
+                                 fill_value=np.nan)
+            return values.reshape(codes.shape)
+        elif kind == 'categorical':
+            codes = np.asarray(self.read_array(desc['codes']))
+            categories = self.read_index(desc['categories'])
+            return Categorical(codes, categories=categories,
+                               ordered=desc['ordered'],
+                               name=_decode_name(desc['name']),
+                               fastpath=True)
+        raise ValueError('unknown kind of values %r' % kind)
+
+    def read_block(self, desc):
+        klass = _BLOCK_CLASSES[desc['klass']]
+        return make_block(self.read_values(desc['values']),
+                          placement=desc['placement'], klass=klass)
+
+    def read_index(self, desc):
+        klass = desc['klass']
+        if klass == 'MultiIndex':
+            levels = [self.read_index(lev) for lev in desc['levels']]
+            labels = [np.asarray(self.read_array(lab))
+                      for lab in desc['labels']]
+            names = [_decode_name(n) for n in desc['names']]
+            return MultiIndex(levels=levels, labels=labels, names=names,
+                              verify_integrity=False)
+
+        name = _decode_name(desc['name'])
+        if klass == 'PeriodIndex':
+            data = np.asarray(self.read_array(desc['data']))
+            return PeriodIndex(data, name=name, freq=desc['freq'])
+        elif klass == 'DatetimeIndex':
+            data = np.asarray(self.read_array(desc['data']))
+            result = DatetimeIndex(data, name=name, freq=desc['freq'],
+                                   verify_integrity=False)
+
+            # reverse tz conversion
+            tz = desc['tz']
+            if tz is not None:
+                result = result.tz_localize('UTC').tz_convert(tz)
+            return result
+        elif klass == 'TimedeltaIndex':
+            data = np.asarray(self.read_array(desc['data']))
+            return TimedeltaIndex(data, name=name, freq=desc['freq'],
+                                  verify_integrity=False)
+        elif klass in _INDEX_CLASSES:
+            data = np.asarray(self.read_values(desc['data']))
+            return _INDEX_CLASSES[klass](data, name=name, fastpath=True)
+        raise ValueError('unknown index class %r' % klass)
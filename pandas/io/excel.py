@@ -13,7 +13,7 @@ from pandas.io.parsers import TextParser
 from pandas.io.common import _is_url, _urlopen
 from pandas.tseries.period import Period
 from pandas import json
-from pandas.compat import map, zip, reduce, range, lrange, u, add_metaclass
+from pandas.compat import map, reduce, range, lrange, u, add_metaclass
 from pandas.core import config
 from pandas.core.common import pprint_thing
 import pandas.compat as compat
@@ -275,72 +275,57 @@ class ExcelFile(object):
                      parse_dates=False, date_parser=None, na_values=None,
                      thousands=None, chunksize=None, convert_float=True,
                      **kwds):
-        import xlrd
-        from xlrd import (xldate, XL_CELL_DATE,
-                          XL_CELL_ERROR, XL_CELL_BOOLEAN,
+        from xlrd import (XL_CELL_DATE, XL_CELL_ERROR, XL_CELL_BOOLEAN,
                           XL_CELL_NUMBER)
 
         epoch1904 = self.book.datemode
 
-        # xlrd >= 0.9.3 can return datetime objects directly.
-        if LooseVersion(xlrd.__VERSION__) >= LooseVersion("0.9.3"):
-            xlrd_0_9_3 = True
-        else:
-            xlrd_0_9_3 = False
-
         if isinstance(sheetname, compat.string_types):
             sheet = self.book.sheet_by_name(sheetname)
         else:  # assume an integer if not a string
             sheet = self.book.sheet_by_index(sheetname)
 
-        data = []
-        should_parse = {}
-        for i in range(sheet.nrows):
-            row = []
-            for j, (value, typ) in enumerate(zip(sheet.row_values(i),
-                                                 sheet.row_types(i))):
-                if parse_cols is not None and j not in should_parse:
-                    should_parse[j] = self._should_parse(j, parse_cols)
-
-                if parse_cols is None or should_parse[j]:
-                    if typ == XL_CELL_DATE:
-                        if xlrd_0_9_3:
-                            # Use the newer xlrd datetime handling.
-                            value = xldate.xldate_as_datetime(value, epoch1904)
-
-                            # Excel doesn't distinguish between dates and time,
-                            # so we treat dates on the epoch as times only.
-                            # Also, Excel supports 1900 and 1904 epochs.
-                            year = (value.timetuple())[0:3]
-                            if ((not epoch1904 and year == (1899, 12, 31))
-                                    or (epoch1904 and year == (1904, 1, 1))):
-                                value = datetime.time(value.hour,
-                                                      value.minute,
-                                                      value.second,
-                                                      value.microsecond)
-                        else:
-                            # Use the xlrd <= 0.9.2 date handling.
-                            dt = xldate.xldate_as_tuple(value, epoch1904)
-
-                            if dt[0] < datetime.MINYEAR:
-                                value = datetime.time(*dt[3:])
-                            else:
-                                value = datetime.datetime(*dt)
-
-                    elif typ == XL_CELL_ERROR:
-                        value = np.nan
-                    elif typ == XL_CELL_BOOLEAN:
-                        value = bool(value)
-                    elif convert_float and typ == XL_CELL_NUMBER:
-                        # GH5394 - Excel 'numbers' are always floats
-                        # it's a minimal perf hit and less suprising
-                        val = int(value)
-                        if val == value:
-                            value = val
-
-                    row.append(value)
-
-            data.append(row)
+        # convert the sheet a column at a time, skipping the columns that are
+        # not parsed
+        columns = []
+        for j in range(sheet.ncols):
+            if parse_cols is not None and not self._should_parse(j,
+                                                                 parse_cols):
+                continue
+
+            values = np.empty(sheet.nrows, dtype=object)
+            values[:] = sheet.col_values(j)
+            types = np.asarray(sheet.col_types(j))
+
+            mask = types == XL_CELL_DATE
+            if mask.any():
+                values[mask] = _xldates_to_datetime(values[mask], epoch1904)
+
+            mask = types == XL_CELL_ERROR
+            if mask.any():
+                values[mask] = np.nan
+
+            mask = types == XL_CELL_BOOLEAN
+            if mask.any():
+                values[mask] = values[mask].astype(bool).astype(object)
+
+            mask = types == XL_CELL_NUMBER
+            if convert_float and mask.any():
+                # GH5394 - Excel 'numbers' are always floats
+                # it's a minimal perf hit and less suprising
+                numbers = values[mask].astype(np.float64)
+                is_int = ((numbers == np.floor(numbers)) &
+                          (np.abs(numbers) < 2 ** 63))
+                numbers = numbers.astype(object)
+                numbers[is_int] = numbers[is_int].astype(np.int64)
+                values[mask] = numbers
+
+            columns.append(values)
+
+        if columns:
+            data = np.column_stack(columns).tolist()
+        else:
+            data = [[] for i in range(sheet.nrows)]
 
         if header is not None:
             data[header] = _trim_excel_header(data[header])
@@ -374,6 +359,38 @@ class ExcelFile(object):
         self.close()
 
 
+def _xldates_to_datetime(values, epoch1904):
+    """
+    Convert an array of Excel serial dates to datetime.datetime objects, the
+    values on the epoch day become datetime.time objects (Excel doesn't
+    distinguish between dates and times). Matches xlrd's xldate_as_datetime.
+    """
+    values = values.astype(np.float64)
+
+    # The integer part is the number of days since the epoch and the
+    # fractional part the time of the day, in Excel's millisecond
+    # resolution. Excel also supports 1900 and 1904 epochs.
+    if epoch1904:
+        epoch = np.datetime64('1904-01-01', 'ms')
+        epochs = np.repeat(epoch, len(values))
+    else:
+        epoch = np.datetime64('1899-12-31', 'ms')
+        # workaround Excel 1900 leap year bug by adjusting the epoch
+        epochs = np.where(values < 60, epoch,
+                          epoch - np.timedelta64(1, 'D'))
+
+    days = values.astype(np.int64)
+    milliseconds = np.round((values - days) * 86400000.0).astype(np.int64)
+    dates = (epochs + days.astype('m8[D]').astype('m8[ms]') +
+             milliseconds.astype('m8[ms]'))
+
+    result = dates.astype('M8[us]').astype(object)
+    is_time = dates.astype('M8[D]') == epoch.astype('M8[D]')
+    if is_time.any():
+        result[is_time] = [value.time() for value in result[is_time]]
+    return result
+
+
 def _trim_excel_header(row):
     # trim header row so auto-index inference works
     # xlrd uses '' , openpyxl None
@@ -415,6 +432,13 @@ class ExcelWriter(object):
     datetime_format : string, default None
         Format string for datetime objects written into Excel files
         (e.g. 'YYYY-MM-DD HH:MM:SS')
+    streaming : boolean, default False
+        Write the cells out row by row as they are formatted instead of
+        keeping the workbook in memory, so that memory use stays flat for
+        large frames. Supported by the xlsxwriter (``constant_memory``) and
+        openpyxl (write-only worksheets) engines. The rows of a sheet have to
+        be written in order. Merged cells spanning several rows are written
+        unmerged, and openpyxl doesn't write the cell styles.
     """
     # Defining an ExcelWriter implementation (see abstract methods for more...)
 
@@ -433,6 +457,9 @@ class ExcelWriter(object):
     # - Optional:
     #   - ``__init__(self, path, engine=None, **kwargs)`` --> always called
     #     with path as first argument.
+    #   - ``supports_streaming`` - set to True if the engine can write the
+    #     cells as they come when ``streaming=True``; the cells are then passed
+    #     to ``write_cells`` in row order.
 
     # You also need to register the class with ``register_writer()``.
     # Technically, ExcelWriter implementations don't need to subclass
@@ -455,6 +482,8 @@ class ExcelWriter(object):
     book = None
     curr_sheet = None
     path = None
+    streaming = False
+    supports_streaming = False
 
     @abc.abstractproperty
     def supported_extensions(self):
@@ -490,14 +519,22 @@ class ExcelWriter(object):
         pass
 
     def __init__(self, path, engine=None,
-                 date_format=None, datetime_format=None, **engine_kwargs):
+                 date_format=None, datetime_format=None, streaming=False,
+                 **engine_kwargs):
         # validate that this engine can handle the extension
         ext = os.path.splitext(path)[-1]
         self.check_extension(ext)
 
+        if streaming and not self.supports_streaming:
+            raise ValueError("Engine '%s' doesn't support streaming"
+                             % self.engine)
+
         self.path = path
         self.sheets = {}
         self.cur_sheet = None
+        self.streaming = streaming
+        # the first row of each sheet that can still be written when streaming
+        self._stream_rows = {}
 
         if date_format is None:
             self.date_format = 'YYYY-MM-DD'
@@ -516,6 +553,12 @@ class ExcelWriter(object):
                              'cur_sheet property')
         return sheet_name
 
+    def _check_stream_row(self, sheet_name, row):
+        if row < self._stream_rows.get(sheet_name, 0):
+            raise ValueError("Row %d of sheet '%s' was already written, a "
+                             "streaming writer must write the rows of a "
+                             "sheet in order" % (row, sheet_name))
+
     @classmethod
     def check_extension(cls, ext):
         """checks that path's extension against the Writer's supported
@@ -544,6 +587,7 @@ class ExcelWriter(object):
 class _Openpyxl1Writer(ExcelWriter):
     engine = 'openpyxl1'
     supported_extensions = ('.xlsx', '.xlsm')
+    supports_streaming = True
     openpyxl_majorver = 1
 
     def __init__(self, path, engine=None, **engine_kwargs):
@@ -552,34 +596,81 @@ class _Openpyxl1Writer(ExcelWriter):
                              'time. Use {0}.x.y.'
                              .format(self.openpyxl_majorver))
         # Use the openpyxl module as the Excel writer.
+        import openpyxl
         from openpyxl.workbook import Workbook
 
         super(_Openpyxl1Writer, self).__init__(path, **engine_kwargs)
 
-        # Create workbook object with default optimized_write=True.
-        self.book = Workbook()
+        if self.streaming:
+            # write-only worksheets, which can only append rows
+            if LooseVersion(openpyxl.__version__) >= '2.4.0':
+                self.book = Workbook(write_only=True)
+            else:
+                self.book = Workbook(optimized_write=True)
+        else:
+            self.book = Workbook()
         # Openpyxl 1.6.1 adds a dummy sheet. We remove it.
         if self.book.worksheets:
             self.book.remove_sheet(self.book.worksheets[0])
 
+        self._style_cache = {}
+
     def save(self):
         """
         Save workbook to disk.
         """
         return self.book.save(self.path)
 
-    def write_cells(self, cells, sheet_name=None, startrow=0, startcol=0):
-        # Write the frame cells using openpyxl.
-        from openpyxl.cell import get_column_letter
-
-        sheet_name = self._get_sheet_name(sheet_name)
-
+    def _get_sheet(self, sheet_name):
         if sheet_name in self.sheets:
             wks = self.sheets[sheet_name]
         else:
             wks = self.book.create_sheet()
             wks.title = sheet_name
             self.sheets[sheet_name] = wks
+        return wks
+
+    def _write_cells_streaming(self, cells, sheet_name, startrow, startcol):
+        # Append the cells, which come in row order, to a write-only sheet a
+        # row at a time. Write-only sheets have no cell styles or merges.
+        wks = self._get_sheet(sheet_name)
+        next_row = self._stream_rows.get(sheet_name, 0)
+
+        row = None
+        values = []
+        for cell in cells:
+            cell_row = startrow + cell.row
+            if cell_row != row:
+                if row is not None:
+                    wks.append(values)
+                    next_row = row + 1
+                    self._stream_rows[sheet_name] = next_row
+                self._check_stream_row(sheet_name, cell_row)
+                for i in range(next_row, cell_row):
+                    wks.append([])
+                row = cell_row
+                values = []
+
+            col = startcol + cell.col
+            if col >= len(values):
+                values.extend([None] * (col + 1 - len(values)))
+            values[col] = _conv_value(cell.val)
+
+        if row is not None:
+            wks.append(values)
+            self._stream_rows[sheet_name] = row + 1
+
+    def write_cells(self, cells, sheet_name=None, startrow=0, startcol=0):
+        # Write the frame cells using openpyxl.
+        sheet_name = self._get_sheet_name(sheet_name)
+
+        if self.streaming:
+            return self._write_cells_streaming(cells, sheet_name, startrow,
+                                               startcol)
+
+        from openpyxl.cell import get_column_letter
+
+        wks = self._get_sheet(sheet_name)
 
         for cell in cells:
             colletter = get_column_letter(startcol + cell.col + 1)
@@ -587,7 +678,12 @@ class _Openpyxl1Writer(ExcelWriter):
             xcell.value = _conv_value(cell.val)
             style = None
             if cell.style:
-                style = self._convert_to_style(cell.style)
+                stylekey = json.dumps(cell.style)
+                if stylekey in self._style_cache:
+                    style = self._style_cache[stylekey]
+                else:
+                    style = self._convert_to_style(cell.style)
+                    self._style_cache[stylekey] = style
                 for field in style.__fields__:
                     xcell.style.__setattr__(field,
                                             style.__getattribute__(field))
@@ -664,33 +760,45 @@ class _Openpyxl2Writer(_Openpyxl1Writer):
 
     def write_cells(self, cells, sheet_name=None, startrow=0, startcol=0):
         # Write the frame cells using openpyxl.
-        from openpyxl.cell import get_column_letter
-
         sheet_name = self._get_sheet_name(sheet_name)
 
-        if sheet_name in self.sheets:
-            wks = self.sheets[sheet_name]
-        else:
-            wks = self.book.create_sheet()
-            wks.title = sheet_name
-            self.sheets[sheet_name] = wks
+        if self.streaming:
+            return self._write_cells_streaming(cells, sheet_name, startrow,
+                                               startcol)
+
+        from openpyxl.cell import get_column_letter
+
+        wks = self._get_sheet(sheet_name)
 
         for cell in cells:
             colletter = get_column_letter(startcol + cell.col + 1)
             xcell = wks.cell("%s%s" % (colletter, startrow + cell.row + 1))
             xcell.value = _conv_value(cell.val)
-            style_kwargs = {}
 
-            # Apply format codes before cell.style to allow override
+            num_format_str = None
             if isinstance(cell.val, datetime.datetime):
-                style_kwargs.update(self._convert_to_style_kwargs({
-                        'number_format':{'format_code': self.datetime_format}}))
+                num_format_str = self.datetime_format
             elif isinstance(cell.val, datetime.date):
-                style_kwargs.update(self._convert_to_style_kwargs({
-                        'number_format':{'format_code': self.date_format}}))
+                num_format_str = self.date_format
 
-            if cell.style:
-                style_kwargs.update(self._convert_to_style_kwargs(cell.style))
+            stylekey = json.dumps(cell.style)
+            if num_format_str:
+                stylekey += num_format_str
+
+            if stylekey in self._style_cache:
+                style_kwargs = self._style_cache[stylekey]
+            else:
+                style_kwargs = {}
+
+                # Apply format codes before cell.style to allow override
+                if num_format_str:
+                    style_kwargs.update(self._convert_to_style_kwargs({
+                        'number_format': {'format_code': num_format_str}}))
+
+                if cell.style:
+                    style_kwargs.update(
+                        self._convert_to_style_kwargs(cell.style))
+                self._style_cache[stylekey] = style_kwargs
 
             if style_kwargs:
                 xcell.style = xcell.style.copy(**style_kwargs)
@@ -1196,18 +1304,28 @@ register_writer(_XlwtWriter)
 class _XlsxWriter(ExcelWriter):
     engine = 'xlsxwriter'
     supported_extensions = ('.xlsx',)
+    supports_streaming = True
 
     def __init__(self, path, engine=None,
-                 date_format=None, datetime_format=None, **engine_kwargs):
+                 date_format=None, datetime_format=None, streaming=False,
+                 **engine_kwargs):
         # Use the xlsxwriter module as the Excel writer.
         import xlsxwriter
 
         super(_XlsxWriter, self).__init__(path, engine=engine,
                                           date_format=date_format,
                                           datetime_format=datetime_format,
+                                          streaming=streaming,
                                           **engine_kwargs)
 
+        if streaming:
+            # each row is flushed to a temporary file when the next one starts
+            options = dict(engine_kwargs.pop('options', None) or {})
+            options['constant_memory'] = True
+            engine_kwargs['options'] = options
+
         self.book = xlsxwriter.Workbook(path, **engine_kwargs)
+        self._style_cache = {}
 
     def save(self):
         """
@@ -1226,7 +1344,9 @@ class _XlsxWriter(ExcelWriter):
             wks = self.book.add_worksheet(sheet_name)
             self.sheets[sheet_name] = wks
 
-        style_dict = {}
+        # the formats are kept for the workbook, so that each style is only
+        # added once
+        style_dict = self._style_cache
 
         for cell in cells:
             num_format_str = None
@@ -1245,6 +1365,15 @@ class _XlsxWriter(ExcelWriter):
                 style = self._convert_to_style(cell.style, num_format_str)
                 style_dict[stylekey] = style
 
+            if self.streaming:
+                # constant_memory only keeps the current row
+                row = startrow + cell.row
+                self._check_stream_row(sheet_name, row)
+                self._stream_rows[sheet_name] = row
+                if cell.mergestart is not None and cell.mergestart > cell.row:
+                    wks.write(row, startcol + cell.col, cell.val, style)
+                    continue
+
             if cell.mergestart is not None and cell.mergeend is not None:
                 wks.merge_range(startrow + cell.row,
                                 startcol + cell.col,
@@ -16,7 +16,8 @@ import numpy as np
 from pandas.io.common import _is_url, urlopen, parse_url
 from pandas.io.parsers import TextParser
 from pandas.compat import (lrange, lmap, u, string_types, iteritems,
-                           raise_with_traceback, binary_type)
+                           raise_with_traceback, binary_type, text_type,
+                           BytesIO)
 from pandas.core import common as com
 from pandas import Series
 
@@ -458,6 +459,42 @@ def _build_xpath_expr(attrs):
 _re_namespace = {'re': 'http://exslt.org/regular-expressions'}
 _valid_schemes = 'http', 'file', 'ftp'
 
+# the whitespace of XPath's normalize-space()
+_XML_WHITESPACE = ' \t\r\n'
+
+
+class _StreamingNotSupported(Exception):
+    """ the document can't be parsed by _LxmlFrameParser._iterparse_tables """
+    pass
+
+
+class _StreamedTable(object):
+    """ the state of a table while it is parsed by iterparse """
+
+    def __init__(self, attrs_match):
+        self.attrs_match = attrs_match
+        self.matched = False
+        # element -> its first text node, taken from the tail of a child
+        # before the child is deleted
+        self.first_text = {}
+        self.n_tbody = 0
+        self.in_tbody = False
+        self.in_thead = 0
+        self.in_tfoot = 0
+        self.in_tr = False
+        self.cells = []
+        # (in the first tbody, row)
+        self.rows = []
+        self.header = []
+        self.footer = []
+
+    def get_table(self):
+        if self.n_tbody:
+            body = [row for in_tbody, row in self.rows if in_tbody]
+        else:
+            body = [row for in_tbody, row in self.rows]
+        return self.header, body, self.footer
+
 
 class _LxmlFrameParser(_HtmlFrameParser):
     """HTML to DataFrame parser that uses lxml under the hood.
@@ -479,6 +516,159 @@ class _LxmlFrameParser(_HtmlFrameParser):
     def __init__(self, *args, **kwargs):
         super(_LxmlFrameParser, self).__init__(*args, **kwargs)
 
+    def parse_tables(self):
+        from lxml.etree import XMLSyntaxError
+
+        # documents that are not urls are streamed through iterparse, the
+        # others (and the documents that iterparse can't handle) are parsed
+        # into a tree
+        if not _is_url(self.io):
+            try:
+                return self._iterparse_tables()
+            except (_StreamingNotSupported, XMLSyntaxError):
+                pass
+        return super(_LxmlFrameParser, self).parse_tables()
+
+    def _iterparse_source(self):
+        """ return the source and encoding to stream the document from """
+        encoding = self.encoding
+        io = self.io
+        if hasattr(io, 'read'):
+            # keep the text so the tree parser can fall back on it
+            io = self.io = io.read()
+        elif not isinstance(io, char_types):
+            raise _StreamingNotSupported()
+
+        try:
+            if os.path.isfile(io):
+                return io, encoding
+        except (TypeError, ValueError):
+            pass
+
+        if isinstance(io, text_type):
+            io, encoding = io.encode('utf-8'), 'utf-8'
+        return BytesIO(io), encoding
+
+    def _iterparse_tables(self):
+        """Parse the tables while streaming the document with lxml's
+        iterparse, with the same results as the tree parser.
+
+        The text of each cell is taken when the cell ends and each row is
+        cleared once it is parsed, so the document is never held in memory.
+
+        Raises
+        ------
+        _StreamingNotSupported
+            * If the document contains nested tables.
+        """
+        from lxml.etree import iterparse, tostring
+
+        source, encoding = self._iterparse_source()
+
+        attrs = dict(self.attrs or {})
+        if 'class_' in attrs:
+            attrs['class'] = attrs.pop('class_')
+
+        match = self.match
+        tables = []
+        table = None
+        context = iterparse(source, events=('start', 'end'), html=True,
+                            recover=False, encoding=encoding)
+        for event, elem in context:
+            tag = elem.tag
+            if not isinstance(tag, string_types):
+                continue
+
+            if event == 'start':
+                if tag == 'table':
+                    if table is not None:
+                        raise _StreamingNotSupported()
+                    attrs_match = all(elem.get(k) == v
+                                      for k, v in iteritems(attrs))
+                    table = _StreamedTable(attrs_match)
+                elif table is None:
+                    pass
+                elif tag == 'tr':
+                    table.in_tr = True
+                    table.cells = []
+                elif tag == 'tbody':
+                    table.n_tbody += 1
+                    table.in_tbody = table.n_tbody == 1
+                elif tag == 'thead':
+                    table.in_thead += 1
+                elif tag == 'tfoot':
+                    table.in_tfoot += 1
+                continue
+
+            if table is None:
+                # outside of the tables
+                elem.clear()
+                continue
+
+            if tag == 'table':
+                if table.matched and table.attrs_match:
+                    tables.append(table.get_table())
+                table = None
+                elem.clear()
+                continue
+
+            # the tables with a descendant whose first text node matches
+            if not table.matched:
+                text = elem.text
+                if text is None:
+                    text = table.first_text.pop(elem, None)
+                if text is None:
+                    for child in elem:
+                        if child.tail is not None:
+                            text = child.tail
+                            break
+                table.matched = match.search(text or '') is not None
+
+            if tag in ('td', 'th'):
+                text = tostring(elem, method='text', encoding=text_type,
+                                with_tail=False)
+                if table.in_tr:
+                    table.cells.append(_remove_whitespace(text))
+                if tag == 'th':
+                    if table.in_thead:
+                        table.header.append(_remove_whitespace(text))
+                    if table.in_tfoot:
+                        table.footer.append(_remove_whitespace(text))
+            elif tag == 'tr':
+                text = tostring(elem, method='text', encoding=text_type,
+                                with_tail=False)
+                if text.strip(_XML_WHITESPACE):
+                    table.rows.append((table.in_tbody, table.cells))
+                table.in_tr = False
+                table.cells = []
+
+                # drop the row and the rows before it, keeping the first
+                # text node of their parent for the match
+                elem.clear()
+                parent = elem.getparent()
+                if parent is not None:
+                    if (not table.matched and parent.text is None and
+                            parent not in table.first_text):
+                        for child in parent:
+                            if child is elem:
+                                break
+                            if child.tail is not None:
+                                table.first_text[parent] = child.tail
+                                break
+                    while elem.getprevious() is not None:
+                        del parent[0]
+            elif tag == 'tbody':
+                table.in_tbody = False
+            elif tag == 'thead':
+                table.in_thead -= 1
+            elif tag == 'tfoot':
+                table.in_tfoot -= 1
+
+        if not tables:
+            raise ValueError("No tables found matching regex %r" %
+                             match.pattern)
+        return tables
+
     def _text_getter(self, obj):
         return obj.text_content()
 
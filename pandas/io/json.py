@@ -2,12 +2,13 @@
 
 import os
 import copy
-from collections import defaultdict
+import itertools
 import numpy as np
 
 import pandas.json as _json
+import pandas.lib as lib
 from pandas.tslib import iNaT
-from pandas.compat import long, u
+from pandas.compat import long, u, StringIO
 from pandas import compat, isnull
 from pandas import Series, DataFrame, to_datetime
 from pandas.io.common import get_filepath_or_buffer
@@ -20,35 +21,58 @@ dumps = _json.dumps
 
 def to_json(path_or_buf, obj, orient=None, date_format='epoch',
             double_precision=10, force_ascii=True, date_unit='ms',
-            default_handler=None):
+            default_handler=None, lines=False):
 
     if isinstance(obj, Series):
-        s = SeriesWriter(
-            obj, orient=orient, date_format=date_format,
-            double_precision=double_precision, ensure_ascii=force_ascii,
-            date_unit=date_unit, default_handler=default_handler).write()
+        klass = SeriesWriter
     elif isinstance(obj, DataFrame):
-        s = FrameWriter(
-            obj, orient=orient, date_format=date_format,
-            double_precision=double_precision, ensure_ascii=force_ascii,
-            date_unit=date_unit, default_handler=default_handler).write()
+        klass = FrameWriter
     else:
         raise NotImplementedError
 
+    kwargs = dict(orient=orient, date_format=date_format,
+                  double_precision=double_precision, ensure_ascii=force_ascii,
+                  date_unit=date_unit, default_handler=default_handler)
+
+    if lines:
+        if orient is None:
+            orient = kwargs['orient'] = 'records'
+        if orient != 'records':
+            raise ValueError("'lines' keyword only valid when "
+                             "'orient' is records")
+        # encode a block of rows at a time, one record per line
+        chunks = (klass(chunk, lines=True, **kwargs).write() + '\n'
+                  for chunk in _iter_row_chunks(obj))
+    else:
+        chunks = [klass(obj, **kwargs).write()]
+
     if isinstance(path_or_buf, compat.string_types):
         with open(path_or_buf, 'w') as fh:
-            fh.write(s)
+            for s in chunks:
+                fh.write(s)
     elif path_or_buf is None:
-        return s
+        return ''.join(chunks)
     else:
-        path_or_buf.write(s)
+        for s in chunks:
+            path_or_buf.write(s)
+
+
+def _iter_row_chunks(obj, chunksize=None):
+    """ yield row slices of obj of about 100000 values each """
+    if chunksize is None:
+        ncols = obj.shape[1] if obj.ndim > 1 else 1
+        chunksize = (100000 // (ncols or 1)) or 1
+    nrows = len(obj)
+    for start in range(0, nrows, chunksize):
+        yield obj.iloc[start:start + chunksize]
 
 
 class Writer(object):
 
     def __init__(self, obj, orient, date_format, double_precision,
-                 ensure_ascii, date_unit, default_handler=None):
+                 ensure_ascii, date_unit, default_handler=None, lines=False):
         self.obj = obj
+        self.lines = lines
 
         if orient is None:
             orient = self._default_orient
@@ -74,7 +98,8 @@ class Writer(object):
             ensure_ascii=self.ensure_ascii,
             date_unit=self.date_unit,
             iso_dates=self.date_format == 'iso',
-            default_handler=self.default_handler)
+            default_handler=self.default_handler,
+            lines=self.lines)
 
 
 class SeriesWriter(Writer):
@@ -103,7 +128,8 @@ class FrameWriter(Writer):
 
 def read_json(path_or_buf=None, orient=None, typ='frame', dtype=True,
               convert_axes=True, convert_dates=True, keep_default_dates=True,
-              numpy=False, precise_float=False, date_unit=None):
+              numpy=False, precise_float=False, date_unit=None, lines=False,
+              chunksize=None):
     """
     Convert a JSON string to pandas object
 
@@ -165,13 +191,39 @@ def read_json(path_or_buf=None, orient=None, typ='frame', dtype=True,
         is to try and detect the correct precision, but if this is not desired
         then pass one of 's', 'ms', 'us' or 'ns' to force parsing only seconds,
         milliseconds, microseconds or nanoseconds respectively.
+    lines : boolean, default False
+        Read the file as line-delimited JSON, one record per line, as
+        written by ``to_json(orient='records', lines=True)``. The records
+        are decoded in batches rather than as a single document.
+    chunksize : int, default None
+        With ``lines=True``, return a JsonLineReader yielding objects of
+        ``chunksize`` records instead of reading the whole file.
 
     Returns
     -------
-    result : Series or DataFrame
+    result : Series or DataFrame, or JsonLineReader if chunksize is given
     """
 
-    filepath_or_buffer, _ = get_filepath_or_buffer(path_or_buf)
+    filepath_or_buffer, encoding = get_filepath_or_buffer(path_or_buf)
+
+    if lines:
+        if orient is None:
+            orient = 'records'
+        if orient != 'records':
+            raise ValueError("'lines' keyword only valid when "
+                             "'orient' is records")
+        kwds = dict(typ=typ, dtype=dtype, convert_axes=convert_axes,
+                    convert_dates=convert_dates,
+                    keep_default_dates=keep_default_dates, numpy=numpy,
+                    precise_float=precise_float, date_unit=date_unit)
+        reader = JsonLineReader(filepath_or_buffer, chunksize=chunksize,
+                                encoding=encoding, **kwds)
+        if chunksize is not None:
+            return reader
+        return reader.read()
+    elif chunksize is not None:
+        raise ValueError("chunksize can only be passed if lines=True")
+
     if isinstance(filepath_or_buffer, compat.string_types):
         try:
             exists = os.path.exists(filepath_or_buffer)
@@ -207,6 +259,107 @@ def read_json(path_or_buf=None, orient=None, typ='frame', dtype=True,
     return obj
 
 
+class JsonLineReader(object):
+    """
+    Iterate over line-delimited JSON, decoding ``chunksize`` records at a
+    time into a DataFrame (or Series with ``typ='series'``). The rows of
+    each chunk are numbered on from the previous one.
+
+    Each batch of lines is decoded with a single call to the JSON decoder
+    and converted to column arrays before the next batch is read, so the
+    whole document is never held in memory as one string. Lines read as
+    bytes are decoded with ``encoding`` (utf-8 by default).
+    """
+
+    _default_chunksize = 10000
+
+    def __init__(self, filepath_or_buffer, chunksize=None, typ='frame',
+                 encoding=None, **kwds):
+        if chunksize is not None:
+            chunksize = int(chunksize)
+            if chunksize < 1:
+                raise ValueError("chunksize must be an integer >= 1")
+        self.chunksize = chunksize
+        self.typ = typ
+        self.encoding = encoding or 'utf-8'
+        self.kwds = kwds
+        self.nrows_seen = 0
+        self._close = False
+
+        f = filepath_or_buffer
+        if isinstance(f, compat.string_types):
+            try:
+                exists = os.path.exists(f)
+            except (TypeError, ValueError):
+                exists = False
+            if exists:
+                f = open(f, 'r')
+                self._close = True
+            else:
+                f = StringIO(f)
+        self.f = f
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        size = self.chunksize or self._default_chunksize
+        lines = []
+        for line in self.f:
+            if line.strip():
+                lines.append(line)
+                if len(lines) >= size:
+                    break
+
+        if not lines:
+            self.close()
+            raise StopIteration
+
+        obj = self._parse(lines)
+        obj.index = np.arange(self.nrows_seen, self.nrows_seen + len(obj))
+        self.nrows_seen += len(obj)
+        return obj
+
+    next = __next__
+
+    def _parse(self, lines):
+        # the batch is decoded as one records document
+        lines = [line.decode(self.encoding) if isinstance(line, bytes)
+                 else line for line in lines]
+        json = u('[') + u(',').join(lines) + u(']')
+        kwds = self.kwds
+        args = ('records', kwds['dtype'], kwds['convert_axes'],
+                kwds['convert_dates'], kwds['keep_default_dates'],
+                kwds['numpy'], kwds['precise_float'], kwds['date_unit'])
+
+        if self.typ == 'series':
+            dtype = kwds['dtype']
+            if not isinstance(dtype, bool):
+                args = ('records', dict(data=dtype)) + args[2:]
+            return SeriesParser(json, *args).parse()
+        return FrameParser(json, *args).parse()
+
+    def read(self):
+        """ read the remaining records into a single object """
+        from pandas.tools.merge import concat
+        chunks = list(self)
+        if not chunks:
+            return Series() if self.typ == 'series' else DataFrame()
+        if len(chunks) == 1:
+            return chunks[0]
+        return concat(chunks)
+
+    def get_chunk(self, size=None):
+        if size is not None:
+            self.chunksize = size
+        return next(self)
+
+    def close(self):
+        if self._close:
+            self.f.close()
+            self._close = False
+
+
 class Parser(object):
 
     _STAMP_UNITS = ('s', 'ms', 'us', 'ns')
@@ -619,6 +772,16 @@ def nested_to_record(ds, prefix="", level=0):
     return new_ds
 
 
+def _columns_to_frame(keys, arrays):
+    """
+    Build a DataFrame from the object columns produced by
+    lib.normalize_records / lib.normalize_json, inferring their dtypes
+    """
+    from pandas.core.frame import _convert_object_array
+    arrays, keys = _convert_object_array(arrays, keys)
+    return DataFrame(dict(zip(keys, arrays)), columns=keys)
+
+
 def json_normalize(data, record_path=None, meta=None,
                    meta_prefix=None,
                    record_prefix=None):
@@ -668,16 +831,6 @@ def json_normalize(data, record_path=None, meta=None,
     -------
     frame : DataFrame
     """
-    def _pull_field(js, spec):
-        result = js
-        if isinstance(spec, list):
-            for field in spec:
-                result = result[field]
-        else:
-            result = result[spec]
-
-        return result
-
     # A bit of a hackjob
     if isinstance(data, dict):
         data = [data]
@@ -691,7 +844,10 @@ def json_normalize(data, record_path=None, meta=None,
             #
             # TODO: handle record value which are lists, at least error
             #       reasonably
-            data = nested_to_record(data)
+            columns = lib.normalize_records(data, True)
+            if columns is None:
+                return DataFrame(nested_to_record(data))
+            return _columns_to_frame(*columns)
         return DataFrame(data)
     elif not isinstance(record_path, list):
         record_path = [record_path]
@@ -705,47 +861,26 @@ def json_normalize(data, record_path=None, meta=None,
         if not isinstance(x, list):
             meta[i] = [x]
 
-    # Disastrously inefficient for now
-    records = []
-    lengths = []
-
-    meta_vals = defaultdict(list)
     meta_keys = ['.'.join(val) for val in meta]
 
-    def _recursive_extract(data, path, seen_meta, level=0):
-        if len(path) > 1:
-            for obj in data:
-                for val, key in zip(meta, meta_keys):
-                    if level + 1 == len(val):
-                        seen_meta[key] = _pull_field(obj, val[-1])
+    # the records are gathered straight into columns while walking the path
+    columns, record_lists, meta_vals, lengths = lib.normalize_json(
+        data, record_path, meta, meta_keys)
 
-                _recursive_extract(obj[path[0]], path[1:],
-                                   seen_meta, level=level+1)
-        else:
-            for obj in data:
-                recs = _pull_field(obj, path[0])
-
-                # For repeating the metadata later
-                lengths.append(len(recs))
-
-                for val, key in zip(meta, meta_keys):
-                    if level + 1 > len(val):
-                        meta_val = seen_meta[key]
-                    else:
-                        meta_val = _pull_field(obj, val[level:])
-                    meta_vals[key].append(meta_val)
-
-                records.extend(recs)
-
-    _recursive_extract(data, record_path, {}, level=0)
-
-    result = DataFrame(records)
+    if columns is not None:
+        result = _columns_to_frame(*columns)
+    else:
+        result = DataFrame(list(itertools.chain(*record_lists)))
 
     if record_prefix is not None:
         result.rename(columns=lambda x: record_prefix + x, inplace=True)
 
     # Data types, a problem
-    for k, v in compat.iteritems(meta_vals):
+    for k in meta_keys:
+        if k not in meta_vals:
+            continue
+        v = meta_vals[k]
+
         if meta_prefix is not None:
             k = meta_prefix + k
 
@@ -41,12 +41,14 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
 import os
+import mmap as _mmap
 from datetime import datetime, date, timedelta
+from functools import partial
 from dateutil.parser import parse
 
 import numpy as np
 from pandas import compat
-from pandas.compat import u, PY3
+from pandas.compat import u, PY3, lrange
 from pandas import (
     Timestamp, Period, Series, DataFrame, Panel, Panel4D,
     Index, MultiIndex, Int64Index, PeriodIndex, DatetimeIndex, Float64Index,
@@ -60,7 +62,8 @@ from pandas.io.common import get_filepath_or_buffer
 from pandas.core.internals import BlockManager, make_block
 import pandas.core.internals as internals
 
-from pandas.msgpack import Unpacker as _Unpacker, Packer as _Packer
+from pandas.msgpack import (Unpacker as _Unpacker, Packer as _Packer,
+                            unpack_from as _unpack_from)
 import zlib
 
 try:
@@ -69,9 +72,22 @@ try:
 except:
     _BLOSC = False
 
-# until we can pass this into our conversion functions,
-# this is pretty hacky
-compressor = None
+# with n_jobs, compressed data is split in chunks of this many bytes, which
+# are compressed and decompressed concurrently; without, an array is a
+# single chunk as in earlier versions
+_COMPRESS_CHUNK_SIZE = 1 << 20
+
+# with to_msgpack(..., mmap=True) the array data is written uncompressed
+# after this prefix, and the arrays are marked with this compressor; this
+# lets read_msgpack(..., mmap=True) find the data in the file and return
+# views of it
+_RAW_VIEW_PREFIX = b'\x00\x93PDRAWVIEW\x00\x01\x02\xff'
+_RAW_VIEW = 'raw_view'
+
+# the data after the prefix starts at a multiple of this many bytes in the
+# file: the prefix is followed by a byte holding the number of padding
+# bytes before the data, and the data by the rest of the padding
+_RAW_VIEW_ALIGNMENT = 64
 
 
 def to_msgpack(path_or_buf, *args, **kwargs):
@@ -90,31 +106,56 @@ def to_msgpack(path_or_buf, *args, **kwargs):
              (default is False)
     compress : type of compressor (zlib or blosc), default to None (no
                compression)
+    n_jobs : number of threads compressing the arrays concurrently; with
+             more than one, compressed arrays are split in chunks, which
+             pandas versions before 0.15.2 cannot read (default is None, a
+             single thread writing each array as one chunk)
+    mmap : boolean, if True write the arrays so that
+           read_msgpack(..., mmap=True) can return views of the file
+           instead of copies; such files cannot be read by pandas
+           versions before 0.15.2 (default is False)
     """
-    global compressor
-    compressor = kwargs.pop('compress', None)
+    compress = kwargs.pop('compress', None)
+    n_jobs = kwargs.pop('n_jobs', None)
     append = kwargs.pop('append', None)
+    mmap = kwargs.pop('mmap', False)
     if append:
         mode = 'a+b'
     else:
         mode = 'wb'
 
+    _validate_compress(compress)
+    if mmap:
+        if compress is not None:
+            raise ValueError("mmap cannot be used with compression")
+        compress = _RAW_VIEW
+    pool = _get_pool(n_jobs if compress not in (None, _RAW_VIEW) else None)
+
     def writer(fh):
         for a in args:
-            fh.write(pack(a, **kwargs))
-
-    if isinstance(path_or_buf, compat.string_types):
-        with open(path_or_buf, mode) as fh:
-            writer(fh)
-    elif path_or_buf is None:
-        buf = compat.BytesIO()
-        writer(buf)
-        return buf.getvalue()
-    else:
-        writer(path_or_buf)
+            packed = pack(a, compress=compress, pool=pool, **kwargs)
+            if compress == _RAW_VIEW:
+                packed = _align_raw_views(packed, _tell(fh))
+            fh.write(packed)
+
+    try:
+        if isinstance(path_or_buf, compat.string_types):
+            with open(path_or_buf, mode) as fh:
+                # appended objects are written at the end of the file
+                fh.seek(0, os.SEEK_END)
+                writer(fh)
+        elif path_or_buf is None:
+            buf = compat.BytesIO()
+            writer(buf)
+            return buf.getvalue()
+        else:
+            writer(path_or_buf)
+    finally:
+        _close_pool(pool)
 
 
-def read_msgpack(path_or_buf, iterator=False, **kwargs):
+def read_msgpack(path_or_buf, iterator=False, mmap=False, read_only=False,
+                 n_jobs=None, **kwargs):
     """
     Load msgpack pandas object from the specified
     file path
@@ -127,6 +168,14 @@ def read_msgpack(path_or_buf, iterator=False, **kwargs):
     path_or_buf : string File path, BytesIO like or string
     iterator : boolean, if True, return an iterator to the unpacker
                (default is False)
+    mmap : boolean, if True and path_or_buf is a file path, memory map the
+           file and return the arrays written with to_msgpack(..., mmap=True)
+           as views of it instead of copies (default is False)
+    read_only : boolean, with mmap, map the file read-only so the arrays
+                cannot be modified; otherwise modifications are private
+                copy-on-write pages (default is False)
+    n_jobs : number of threads decompressing the chunks of the arrays
+             concurrently (default is None, a single thread)
 
     Returns
     -------
@@ -137,8 +186,21 @@ def read_msgpack(path_or_buf, iterator=False, **kwargs):
     if iterator:
         return Iterator(path_or_buf)
 
+    pool = _get_pool(n_jobs)
+    try:
+        return _read_msgpack(path_or_buf, mmap, read_only, pool)
+    finally:
+        _close_pool(pool)
+
+
+def _read_msgpack(path_or_buf, mmap, read_only, pool):
+
+    object_hook = decode
+    if pool is not None:
+        object_hook = partial(decode, pool=pool)
+
     def read(fh):
-        l = list(unpack(fh))
+        l = list(unpack(fh, object_hook=object_hook))
         if len(l) == 1:
             return l[0]
         return l
@@ -152,6 +214,13 @@ def read_msgpack(path_or_buf, iterator=False, **kwargs):
             exists = False
 
         if exists:
+            if mmap and os.path.getsize(path_or_buf):
+                l = read_mapped(path_or_buf, read_only=read_only,
+                                object_hook=object_hook)
+                if len(l) == 1:
+                    return l[0]
+                return l
+
             with open(path_or_buf, 'rb') as fh:
                 return read(fh)
 
@@ -167,6 +236,143 @@ def read_msgpack(path_or_buf, iterator=False, **kwargs):
     # a buffer like
     return read(path_or_buf)
 
+def _tell(fh):
+    """ the position of fh, or 0 if it has none """
+    try:
+        return fh.tell()
+    except (AttributeError, IOError, OSError):
+        return 0
+
+
+def _pad_raw_view(data):
+    """ the raw view value of data, with room for its padding """
+    return (_RAW_VIEW_PREFIX + b'\x00' + data +
+            b'\x00' * (_RAW_VIEW_ALIGNMENT - 1))
+
+
+def _align_raw_views(packed, position):
+    """
+    Move the data of each raw view in packed, which is written at position
+    in the file, so that it starts on a multiple of _RAW_VIEW_ALIGNMENT
+    bytes; the length of the packed object does not change
+    """
+    views = []
+
+    def object_hook(obj):
+        if obj.get('compress') == _RAW_VIEW:
+            views.extend(v for k, v in compat.iteritems(obj)
+                         if k in ('data', 'values') and
+                         isinstance(v, _RawView))
+        return obj
+
+    _unpack_from(packed, 0, object_hook=object_hook, use_list=False,
+                 encoding='latin1', raw_view_hook=partial(_RawView, packed),
+                 raw_view_prefix=_RAW_VIEW_PREFIX)
+    if not views:
+        return packed
+
+    result = bytearray(packed)
+    for view in views:
+        start = view.offset + 1
+        nbytes = view.length - _RAW_VIEW_ALIGNMENT
+        padding = -(position + start) % _RAW_VIEW_ALIGNMENT
+        result[view.offset] = padding
+        result[start:start + padding] = b'\x00' * padding
+        result[start + padding:start + padding + nbytes] = \
+            packed[start:start + nbytes]
+    return bytes(result)
+
+
+def _unpad_raw_view(value):
+    """ the data of the raw view value, without prefix and padding """
+    start = len(_RAW_VIEW_PREFIX) + 1
+    padding = bytearray(value[start - 1:start])[0]
+    return value[start + padding:
+                 len(value) - (_RAW_VIEW_ALIGNMENT - 1 - padding)]
+
+
+class _RawView(object):
+
+    """ the location of prefixed raw data in a memory mapped file """
+
+    __slots__ = ['buf', 'offset', 'length']
+
+    def __init__(self, buf, offset, length):
+        self.buf = buf
+        self.offset = offset
+        self.length = length
+
+    def array(self):
+        """ a uint8 view of the data, skipping its padding """
+        nbytes = self.length - _RAW_VIEW_ALIGNMENT
+        if nbytes <= 0:
+            return np.empty(0, dtype=np.uint8)
+        padding = np.frombuffer(self.buf, dtype=np.uint8, count=1,
+                                offset=self.offset)[0]
+        return np.frombuffer(self.buf, dtype=np.uint8, count=nbytes,
+                             offset=self.offset + 1 + padding)
+
+    def raw(self):
+        """ the value as it is unpacked without views """
+        start = self.offset - len(_RAW_VIEW_PREFIX)
+        return self.buf[start:self.offset + self.length].decode('latin1')
+
+
+def _restore_raw(obj):
+    if isinstance(obj, _RawView):
+        return obj.raw()
+    return obj
+
+
+def _mapped_list_hook(l):
+    """ values of lists are never array data """
+    if any(isinstance(x, _RawView) for x in l):
+        l = type(l)(_restore_raw(x) for x in l)
+    return l
+
+
+def _mapped_object_hook(obj, object_hook):
+    """
+    keep the views only for the data of the arrays written with mmap=True,
+    so that other values which happen to start with the prefix are
+    unpacked as they were written
+    """
+    if obj.get('compress') == _RAW_VIEW:
+        keep = ('data', 'values')
+    else:
+        keep = ()
+
+    if any(isinstance(k, _RawView) or
+           (isinstance(v, _RawView) and k not in keep)
+           for k, v in compat.iteritems(obj)):
+        obj = dict((_restore_raw(k), v if k in keep else _restore_raw(v))
+                   for k, v in compat.iteritems(obj))
+    return object_hook(obj)
+
+
+def read_mapped(path, read_only=False, object_hook=None):
+    """
+    Memory map the file path and unpack all of its objects; the arrays
+    that were written with to_msgpack(..., mmap=True) are views of the map.
+    """
+    if object_hook is None:
+        object_hook = decode
+
+    access = _mmap.ACCESS_READ if read_only else _mmap.ACCESS_COPY
+    with open(path, 'rb') as fh:
+        buf = _mmap.mmap(fh.fileno(), 0, access=access)
+
+    objs, offset = [], 0
+    while offset < len(buf):
+        obj, offset = _unpack_from(
+            buf, offset,
+            object_hook=partial(_mapped_object_hook, object_hook=object_hook),
+            list_hook=_mapped_list_hook, use_list=False, encoding='latin1',
+            raw_view_hook=partial(_RawView, buf),
+            raw_view_prefix=_RAW_VIEW_PREFIX)
+        objs.append(_restore_raw(obj))
+    return objs
+
 dtype_dict = {21: np.dtype('M8[ns]'),
               u('datetime64[ns]'): np.dtype('M8[ns]'),
               u('datetime64[us]'): np.dtype('M8[us]'),
@@ -198,69 +404,180 @@ def c2f(r, i, ctype_name):
     return np.typeDict[ctype_name](ftype(r) + 1j * ftype(i))
 
 
-def convert(values):
-    """ convert the numpy values to a list """
+def _validate_compress(compress):
+    if compress not in (None, 'zlib', 'blosc'):
+        raise ValueError("compress must be one of None, 'zlib' or 'blosc'")
+    if compress == 'blosc' and not _BLOSC:
+        raise ImportError("blosc compression requires the blosc package")
 
-    dtype = values.dtype
-    if needs_i8_conversion(dtype):
-        values = values.view('i8')
-    v = values.ravel()
 
-    # convert object
-    if dtype == np.object_:
-        return v.tolist()
+def _get_pool(n_jobs):
+    """ return a thread pool of n_jobs threads, or None for a single one """
+    if n_jobs is None or n_jobs <= 1:
+        return None
+    from multiprocessing.pool import ThreadPool
+    return ThreadPool(n_jobs)
 
-    if compressor == 'zlib':
 
-        # return string arrays like they are
-        if dtype == np.object_:
-            return v.tolist()
+def _close_pool(pool):
+    if pool is not None:
+        pool.close()
+        pool.join()
+
 
-        # convert to a bytes array
-        v = v.tostring()
-        return zlib.compress(v)
+def _map(func, args, pool=None):
+    if pool is not None and len(args) > 1:
+        return pool.map(func, args)
+    return [func(a) for a in args]
 
-    elif compressor == 'blosc' and _BLOSC:
 
-        # return string arrays like they are
+def _compress_chunk(chunk, compress):
+    """ compress the bytes of an array """
+    if compress == 'zlib':
+        return zlib.compress(chunk.tostring())
+    return blosc.compress(chunk.tostring(), typesize=chunk.dtype.itemsize)
+
+
+def _decompress_chunk(data, compress):
+    """ decompress the bytes of a chunk """
+
+    # raw data is unpacked as latin1 text
+    if isinstance(data, compat.text_type):
+        data = data.encode('latin1')
+
+    if compress == 'zlib':
+        return zlib.decompress(data)
+    elif compress == 'blosc':
+        if not _BLOSC:
+            raise Exception("cannot uncompress w/o blosc")
+        return blosc.decompress(data)
+    raise ValueError("unknown compression [%s]" % compress)
+
+
+def convert_arrays(arrays, compress=None, pool=None):
+    """
+    convert numpy arrays to packable values: a list for object arrays,
+    otherwise the bytes; if a pool is given compressed data is split in
+    chunks, which are compressed on the pool and stored as a list when there
+    is more than one
+    """
+
+    results = [None] * len(arrays)
+    chunks = []
+    for i, values in enumerate(arrays):
+        dtype = values.dtype
+        if needs_i8_conversion(dtype):
+            values = values.view('i8')
+        v = values.ravel()
+
+        # convert object
         if dtype == np.object_:
-            return v.tolist()
+            results[i] = v.tolist()
 
-        # convert to a bytes array
-        v = v.tostring()
-        return blosc.compress(v, typesize=dtype.itemsize)
+        # ndarray (on original dtype), prefixed to be found in mapped files
+        # and padded to be aligned in them
+        elif compress == _RAW_VIEW:
+            results[i] = _pad_raw_view(v.tostring())
 
-    # ndarray (on original dtype)
-    return v.tostring()
+        elif compress:
+            if pool is None:
+                step = max(1, len(v))
+            else:
+                step = max(1, _COMPRESS_CHUNK_SIZE // v.dtype.itemsize)
+            for start in lrange(0, len(v), step) or [0]:
+                chunks.append((i, v[start:start + step]))
 
+        # ndarray (on original dtype)
+        else:
+            results[i] = v.tostring()
+
+    if chunks:
+        compressed = _map(partial(_compress_chunk, compress=compress),
+                          [c for _, c in chunks], pool)
+        for (i, _), data in zip(chunks, compressed):
+            if results[i] is None:
+                results[i] = [data]
+            else:
+                results[i].append(data)
 
-def unconvert(values, dtype, compress=None):
+        # a single chunk is stored as it is
+        for i, _ in chunks:
+            if len(results[i]) == 1:
+                results[i] = results[i][0]
 
-    if dtype == np.object_:
-        return np.array(values, dtype=object)
+    return results
 
-    if compress == 'zlib':
 
-        values = zlib.decompress(values)
-        return np.frombuffer(values, dtype=dtype)
+def convert(values, compress=None, pool=None):
+    """ convert the numpy values to a list """
+    return convert_arrays([values], compress=compress, pool=pool)[0]
 
-    elif compress == 'blosc':
 
-        if not _BLOSC:
-            raise Exception("cannot uncompress w/o blosc")
+def unconvert_arrays(items, pool=None):
+    """
+    convert the packed (values, dtype, compress) items back to numpy arrays;
+    the chunks of the compressed values are decompressed on the pool if
+    given
+    """
+
+    results = [None] * len(items)
+    chunks = []
+    for i, (values, dtype, compress) in enumerate(items):
+
+        if dtype == np.object_:
+            results[i] = np.array(values, dtype=object)
 
-        # decompress
-        values = blosc.decompress(values)
+        elif compress == _RAW_VIEW:
+            # a view of the data in a memory mapped file
+            if isinstance(values, _RawView):
+                results[i] = values.array().view(dtype)
+            else:
+                values = _unpad_raw_view(values.encode('latin1'))
+                if len(values):
+                    results[i] = np.frombuffer(values, dtype=dtype).copy()
+                else:
+                    results[i] = np.empty(0, dtype=dtype)
 
-        return np.frombuffer(values, dtype=dtype)
+        elif compress:
+            if isinstance(values, (list, tuple)):
+                chunks.extend((i, c, compress) for c in values)
+            else:
+                chunks.append((i, values, compress))
 
-    # from a string
-    return np.fromstring(values.encode('latin1'), dtype=dtype)
+        # from a string
+        else:
+            results[i] = np.fromstring(values.encode('latin1'), dtype=dtype)
 
+    if chunks:
+        data = _map(lambda c: _decompress_chunk(c[1], c[2]), chunks, pool)
 
-def encode(obj):
+        pieces = dict()
+        for (i, _, _), d in zip(chunks, data):
+            pieces.setdefault(i, []).append(d)
+
+        for i, p in compat.iteritems(pieces):
+            dtype = items[i][1]
+            if len(p) == 1:
+                results[i] = np.frombuffer(p[0], dtype=dtype)
+            else:
+                values = np.empty(sum(len(d) for d in p), dtype=np.uint8)
+                start = 0
+                for d in p:
+                    values[start:start + len(d)] = np.frombuffer(d, np.uint8)
+                    start += len(d)
+                results[i] = values.view(dtype)
+
+    return results
+
+
+def unconvert(values, dtype, compress=None, pool=None):
+    return unconvert_arrays([(values, dtype, compress)], pool=pool)[0]
+
+
+def encode(obj, compress=None, pool=None):
     """
-    Data encoder
+    Data encoder; compress is the compressor of the arrays, whose chunks are
+    compressed on the thread pool if given
     """
 
     tobj = type(obj)
@@ -271,7 +588,8 @@ def encode(obj):
                     'name': getattr(obj, 'name', None),
                     'freq': getattr(obj, 'freqstr', None),
                     'dtype': obj.dtype.num,
-                    'data': convert(obj.asi8)}
+                    'data': convert(obj.asi8, compress, pool),
+                    'compress': compress}
         elif isinstance(obj, DatetimeIndex):
             tz = getattr(obj, 'tz', None)
 
@@ -283,21 +601,24 @@ def encode(obj):
                     'klass': obj.__class__.__name__,
                     'name': getattr(obj, 'name', None),
                     'dtype': obj.dtype.num,
-                    'data': convert(obj.asi8),
+                    'data': convert(obj.asi8, compress, pool),
                     'freq': getattr(obj, 'freqstr', None),
-                    'tz': tz}
+                    'tz': tz,
+                    'compress': compress}
         elif isinstance(obj, MultiIndex):
             return {'typ': 'multi_index',
                     'klass': obj.__class__.__name__,
                     'names': getattr(obj, 'names', None),
                     'dtype': obj.dtype.num,
-                    'data': convert(obj.values)}
+                    'data': convert(obj.values, compress, pool),
+                    'compress': compress}
         else:
             return {'typ': 'index',
                     'klass': obj.__class__.__name__,
                     'name': getattr(obj, 'name', None),
                     'dtype': obj.dtype.num,
-                    'data': convert(obj.values)}
+                    'data': convert(obj.values, compress, pool),
+                    'compress': compress}
     elif isinstance(obj, Series):
         if isinstance(obj, SparseSeries):
             raise NotImplementedError(
@@ -308,8 +629,8 @@ def encode(obj):
             #     'dtype': obj.dtype.num,
             #     'index': obj.index,
             #     'sp_index': obj.sp_index,
-            #     'sp_values': convert(obj.sp_values),
-            #     'compress': compressor}
+            #     'sp_values': convert(obj.sp_values, compress, pool),
+            #     'compress': compress}
             #for f in ['name', 'fill_value', 'kind']:
             #    d[f] = getattr(obj, f, None)
             #return d
@@ -319,8 +640,8 @@ def encode(obj):
                     'name': getattr(obj, 'name', None),
                     'index': obj.index,
                     'dtype': obj.dtype.num,
-                    'data': convert(obj.values),
-                    'compress': compressor}
+                    'data': convert(obj.values, compress, pool),
+                    'compress': compress}
     elif issubclass(tobj, NDFrame):
         if isinstance(obj, SparseDataFrame):
             raise NotImplementedError(
@@ -353,16 +674,18 @@ def encode(obj):
                 data = data.consolidate()
 
            # the block manager
+            values = convert_arrays([b.values for b in data.blocks],
+                                    compress=compress, pool=pool)
             return {'typ': 'block_manager',
                     'klass': obj.__class__.__name__,
                     'axes': data.axes,
                     'blocks': [{'items': data.items.take(b.mgr_locs),
-                                'values': convert(b.values),
+                                'values': v,
                                 'shape': b.values.shape,
                                 'dtype': b.dtype.num,
                                 'klass': b.__class__.__name__,
-                                'compress': compressor
-                                } for b in data.blocks]}
+                                'compress': compress
+                                } for b, v in zip(data.blocks, values)]}
 
     elif isinstance(obj, (datetime, date, np.datetime64, timedelta,
                           np.timedelta64)):
@@ -413,8 +736,8 @@ def encode(obj):
                 'shape': obj.shape,
                 'ndim': obj.ndim,
                 'dtype': obj.dtype.num,
-                'data': convert(obj),
-                'compress': compressor}
+                'data': convert(obj, compress, pool),
+                'compress': compress}
     elif isinstance(obj, np.number):
         if np.iscomplexobj(obj):
             return {'typ': 'np_scalar',
@@ -434,9 +757,10 @@ def encode(obj):
     return obj
 
 
-def decode(obj):
+def decode(obj, pool=None):
     """
-    Decoder for deserializing numpy data types.
+    Decoder for deserializing numpy data types; compressed chunks are
+    decompressed on the thread pool if given
     """
 
     typ = obj.get('typ')
@@ -449,19 +773,19 @@ def decode(obj):
     elif typ == 'index':
         dtype = dtype_for(obj['dtype'])
         data = unconvert(obj['data'], np.typeDict[obj['dtype']],
-                         obj.get('compress'))
+                         obj.get('compress'), pool)
         return globals()[obj['klass']](data, dtype=dtype, name=obj['name'])
     elif typ == 'multi_index':
         data = unconvert(obj['data'], np.typeDict[obj['dtype']],
-                         obj.get('compress'))
+                         obj.get('compress'), pool)
         data = [tuple(x) for x in data]
         return globals()[obj['klass']].from_tuples(data, names=obj['names'])
     elif typ == 'period_index':
-        data = unconvert(obj['data'], np.int64, obj.get('compress'))
+        data = unconvert(obj['data'], np.int64, obj.get('compress'), pool)
         d = dict(name=obj['name'], freq=obj['freq'])
         return globals()[obj['klass']](data, **d)
     elif typ == 'datetime_index':
-        data = unconvert(obj['data'], np.int64, obj.get('compress'))
+        data = unconvert(obj['data'], np.int64, obj.get('compress'), pool)
         d = dict(name=obj['name'], freq=obj['freq'], verify_integrity=False)
         result = globals()[obj['klass']](data, **d)
         tz = obj['tz']
@@ -475,19 +799,21 @@ def decode(obj):
         dtype = dtype_for(obj['dtype'])
         index = obj['index']
         return globals()[obj['klass']](unconvert(obj['data'], dtype,
-                                                 obj['compress']),
+                                                 obj['compress'], pool),
                                        index=index, name=obj['name'])
     elif typ == 'block_manager':
         axes = obj['axes']
 
-        def create_block(b):
-            values = unconvert(b['values'], dtype_for(b['dtype']),
-                               b['compress']).reshape(b['shape'])
-            return make_block(values=values,
+        values = unconvert_arrays([(b['values'], dtype_for(b['dtype']),
+                                    b['compress']) for b in obj['blocks']],
+                                  pool=pool)
+
+        def create_block(b, values):
+            return make_block(values=values.reshape(b['shape']),
                               klass=getattr(internals, b['klass']),
                               placement=axes[0].get_indexer(b['items']))
 
-        blocks = [create_block(b) for b in obj['blocks']]
+        blocks = [create_block(b, v) for b, v in zip(obj['blocks'], values)]
         return globals()[obj['klass']](BlockManager(blocks, axes))
     elif typ == 'datetime':
         return parse(obj['data'])
@@ -523,7 +849,7 @@ def decode(obj):
         return globals()[obj['klass']](obj['length'], obj['indices'])
     elif typ == 'ndarray':
         return unconvert(obj['data'], np.typeDict[obj['dtype']],
-                         obj.get('compress')).reshape(obj['shape'])
+                         obj.get('compress'), pool).reshape(obj['shape'])
     elif typ == 'np_scalar':
         if obj.get('sub_typ') == 'np_complex':
             return c2f(obj['real'], obj['imag'], obj['dtype'])
@@ -542,14 +868,16 @@ def decode(obj):
 
 
 def pack(o, default=encode,
-         encoding='latin1', unicode_errors='strict', use_single_float=False):
+         encoding='latin1', unicode_errors='strict', use_single_float=False,
+         compress=None, pool=None):
     """
     Pack an object and return the packed bytes.
     """
 
     return Packer(default=default, encoding=encoding,
                   unicode_errors=unicode_errors,
-                  use_single_float=use_single_float).pack(o)
+                  use_single_float=use_single_float,
+                  compress=compress, pool=pool).pack(o)
 
 
 def unpack(packed, object_hook=decode,
@@ -572,7 +900,11 @@ class Packer(_Packer):
     def __init__(self, default=encode,
                  encoding='latin1',
                  unicode_errors='strict',
-                 use_single_float=False):
+                 use_single_float=False,
+                 compress=None,
+                 pool=None):
+        if compress is not None or pool is not None:
+            default = partial(default, compress=compress, pool=pool)
         super(Packer, self).__init__(default=default,
                                      encoding=encoding,
                                      unicode_errors=unicode_errors,
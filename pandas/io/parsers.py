@@ -4,9 +4,14 @@ Module contains tools for processing files into DataFrames or other objects
 from __future__ import print_function
 from pandas.compat import range, lrange, StringIO, lzip, zip, string_types, map
 from pandas import compat
+import os
 import re
 import csv
+import sys
+import threading
 import warnings
+import weakref
+from collections import deque
 
 import numpy as np
 
@@ -54,6 +59,7 @@ escapechar : string (length 1), default None
     One-character string used to escape delimiter when quoting is QUOTE_NONE.
 dtype : Type name or dict of column -> type
     Data type for data or columns. E.g. {'a': np.float64, 'b': np.int32}
+    Use 'category' to parse a column directly to a Categorical.
     (Unsupported with engine='python')
 compression : {'gzip', 'bz2', None}, default None
     For on-the-fly decompression of on-disk data
@@ -107,6 +113,11 @@ date_parser : function
     to do the conversion.
 dayfirst : boolean, default False
     DD/MM format dates, international and European format
+date_format : string, default None
+    strftime-style format of the columns in ``parse_dates``, e.g.
+    "%Y-%m-%d %H:%M:%S". With the C engine, formats made up of the %Y, %m,
+    %d, %H, %M, %S and %f directives, as well as ISO 8601 dates when no
+    format is given, are converted directly while parsing
 thousands : str, default None
     Thousands separator
 comment : str, default None
@@ -125,6 +136,10 @@ iterator : boolean, default False
     Return TextFileReader object
 chunksize : int, default None
     Return TextFileReader object for iteration
+prefetch : int, default None
+    When iterating, parse the following chunks in a background thread,
+    holding at most about this many bytes of parsed chunks which have not
+    been consumed yet (at least one chunk is always parsed ahead)
 skipfooter : int, default 0
     Number of lines at bottom of file to skip (Unsupported with engine='c')
 converters : dict. optional
@@ -165,6 +180,13 @@ infer_datetime_format : boolean, default False
     the datetime format to speed up the processing
 skip_blank_lines : boolean, default True
     If True, skip over blank lines rather than interpreting as NaN values
+n_jobs : int, default 1
+    Number of threads used to tokenize the file. When greater than 1 and
+    the whole of an uncompressed file on disk is read, the file is split
+    into newline-aligned byte ranges which are tokenized concurrently and
+    concatenated. A file that contains the quote character (unless
+    quoting=QUOTE_NONE) is read by a single tokenizer. (Only valid with C
+    parser)
 
 Returns
 -------
@@ -206,6 +228,10 @@ colspecs : list of pairs (int, int) or 'infer'. optional
 widths : list of ints. optional
     A list of field widths which can be used instead of 'colspecs' if
     the intervals are contiguous.
+engine : {'c', 'python'}
+    Parser engine to use. The C engine is faster, the python engine is used
+    when an option the C engine does not handle is passed (e.g. negative
+    colspecs or a non UTF-8 encoding).
 """
 
 _read_fwf_doc = """
@@ -237,6 +263,10 @@ def _read(filepath_or_buffer, kwds):
     nrows = kwds.pop('nrows', None)
     chunksize = kwds.get('chunksize', None)
 
+    # parallel tokenization only applies when reading the whole file
+    if nrows is not None or chunksize or iterator:
+        kwds.pop('n_jobs', None)
+
     # Create the parser.
     parser = TextFileReader(filepath_or_buffer, **kwds)
 
@@ -280,12 +310,14 @@ _parser_defaults = {
     'keep_date_col': False,
     'dayfirst': False,
     'date_parser': None,
+    'date_format': None,
 
     'usecols': None,
 
     # 'nrows': None,
     # 'iterator': False,
     'chunksize': None,
+    'prefetch': None,
     'verbose': False,
     'encoding': None,
     'squeeze': False,
@@ -310,7 +342,8 @@ _c_parser_defaults = {
     'warn_bad_lines': True,
     'dtype': None,
     'decimal': b'.',
-    'float_precision': None
+    'float_precision': None,
+    'n_jobs': 1
 }
 
 _fwf_defaults = {
@@ -374,12 +407,15 @@ def _make_parser_function(name, sep=','):
                  keep_date_col=False,
                  dayfirst=False,
                  date_parser=None,
+                 date_format=None,
 
                  memory_map=False,
                  float_precision=None,
+                 n_jobs=1,
                  nrows=None,
                  iterator=False,
                  chunksize=None,
+                 prefetch=None,
 
                  verbose=False,
                  encoding=None,
@@ -434,10 +470,12 @@ def _make_parser_function(name, sep=','):
                     keep_date_col=keep_date_col,
                     dayfirst=dayfirst,
                     date_parser=date_parser,
+                    date_format=date_format,
 
                     nrows=nrows,
                     iterator=iterator,
                     chunksize=chunksize,
+                    prefetch=prefetch,
                     skipfooter=skipfooter or skip_footer,
                     converters=converters,
                     dtype=dtype,
@@ -447,6 +485,7 @@ def _make_parser_function(name, sep=','):
                     squeeze=squeeze,
                     memory_map=memory_map,
                     float_precision=float_precision,
+                    n_jobs=n_jobs,
 
                     na_filter=na_filter,
                     compact_ints=compact_ints,
@@ -492,7 +531,11 @@ def read_fwf(filepath_or_buffer, colspecs='infer', widths=None, **kwds):
             col += w
 
     kwds['colspecs'] = colspecs
-    kwds['engine'] = 'python-fwf'
+    kwds['engine_specified'] = kwds.get('engine') is not None
+    if kwds.get('engine', 'c') == 'c':
+        kwds['engine'] = 'c-fwf'
+    else:
+        kwds['engine'] = 'python-fwf'
     return _read(filepath_or_buffer, kwds)
 
 
@@ -547,7 +590,9 @@ class TextFileReader(object):
         options = self._get_options_with_defaults(engine)
 
         self.chunksize = options.pop('chunksize', None)
+        self.prefetch = options.pop('prefetch', None)
         self.squeeze = options.pop('squeeze', False)
+        self._prefetcher = None
 
         # might mutate self.engine
         self.options, self.engine = self._clean_options(options, engine)
@@ -568,14 +613,14 @@ class TextFileReader(object):
             if argname in kwds:
                 value = kwds[argname]
 
-                if engine != 'c' and value != default:
+                if engine not in ('c', 'c-fwf') and value != default:
                     raise ValueError('The %r option is not supported with the'
                                      ' %r engine' % (argname, engine))
             else:
                 value = default
             options[argname] = value
 
-        if engine == 'python-fwf':
+        if engine in ('c-fwf', 'python-fwf'):
             for argname, default in compat.iteritems(_fwf_defaults):
                 options[argname] = kwds.get(argname, default)
 
@@ -596,6 +641,14 @@ class TextFileReader(object):
                 fallback_reason = "the 'c' engine does not support"\
                                   " skip_footer"
                 engine = 'python'
+        elif engine == 'c-fwf':
+            if options['colspecs'] != 'infer':
+                _validate_colspecs(options['colspecs'])
+            fallback_reason = _fwf_c_unsupported(self.f, options)
+            if fallback_reason:
+                engine = 'python-fwf'
+            else:
+                del result['widths']
 
         if sep is None and not delim_whitespace:
             if engine == 'c':
@@ -606,7 +659,7 @@ class TextFileReader(object):
             if engine == 'c' and sep == '\s+':
                 result['delim_whitespace'] = True
                 del result['delimiter']
-            elif engine not in ('python', 'python-fwf'):
+            elif engine not in ('python', 'c-fwf', 'python-fwf'):
                 # wait until regex engine integrated
                 fallback_reason = "the 'c' engine does not support"\
                                   " regex separators"
@@ -615,7 +668,7 @@ class TextFileReader(object):
         if fallback_reason and engine_specified:
             raise ValueError(fallback_reason)
 
-        if engine == 'c':
+        if engine in ('c', 'c-fwf'):
             for arg in _c_unsupported:
                 del result[arg]
 
@@ -683,14 +736,14 @@ class TextFileReader(object):
         try:
             if self.chunksize:
                 while True:
-                    yield self.read(self.chunksize)
+                    yield self.get_chunk()
             else:
                 yield self.read()
         except StopIteration:
             pass
 
     def _make_engine(self, engine='c'):
-        if engine == 'c':
+        if engine in ('c', 'c-fwf'):
             self._engine = CParserWrapper(self.f, **self.options)
         else:
             if engine == 'python':
@@ -703,6 +756,12 @@ class TextFileReader(object):
         raise NotImplementedError
 
     def read(self, nrows=None):
+        if self._prefetcher is not None:
+            raise ValueError('cannot call read while chunks are being '
+                             'prefetched, use get_chunk')
+        return self._read_chunk(nrows)
+
+    def _read_chunk(self, nrows=None):
         if nrows is not None:
             if self.options.get('skip_footer'):
                 raise ValueError('skip_footer not supported for iteration')
@@ -728,7 +787,145 @@ class TextFileReader(object):
     def get_chunk(self, size=None):
         if size is None:
             size = self.chunksize
-        return self.read(nrows=size)
+
+        if not self.prefetch or size is None:
+            return self.read(nrows=size)
+
+        if self._prefetcher is None:
+            self._prefetcher = _ChunkPrefetcher(self, size, self.prefetch)
+        elif size != self._prefetcher.chunksize:
+            raise ValueError('get_chunk size must stay the same when '
+                             'prefetching, got %d instead of %d'
+                             % (size, self._prefetcher.chunksize))
+
+        return self._prefetcher.next()
+
+    def close(self):
+        """
+        Stop prefetching chunks in the background; an abandoned reader stops
+        when it is garbage collected
+        """
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+
+
+class _ChunkPrefetcher(object):
+    """
+    Read chunks of chunksize rows of a TextFileReader in a background
+    thread, while less than max_bytes of parsed chunks are waiting to be
+    consumed
+
+    The thread only holds a weak reference to the reader while it waits, so
+    that a reader which is not iterated to the end can be collected, which
+    stops the thread.
+    """
+
+    def __init__(self, reader, chunksize, max_bytes):
+        self.chunksize = chunksize
+        self.max_bytes = max_bytes
+
+        self._chunks = deque()
+        self._nbytes = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._reader = weakref.ref(reader, self._reader_collected)
+
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _reader_collected(self, ref):
+        self.close()
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._chunks.clear()
+            self._nbytes = 0
+            self._cond.notify_all()
+
+        # let a chunk being parsed finish before the parser is released,
+        # unless the reader was collected by the thread itself
+        if threading.current_thread() is not self._thread:
+            self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while (not self._closed and self._chunks and
+                       self._nbytes >= self.max_bytes):
+                    self._cond.wait()
+                if self._closed:
+                    return
+
+            reader = self._reader()
+            if reader is None:
+                return
+
+            # (chunk, exc_info, nbytes), a chunk of None ends the iteration
+            try:
+                chunk = reader._read_chunk(self.chunksize)
+                item = (chunk, None, _chunk_nbytes(chunk))
+            except StopIteration:
+                item = (None, None, 0)
+            except Exception:
+                item = (None, sys.exc_info(), 0)
+            del reader
+
+            with self._cond:
+                if self._closed:
+                    return
+                self._chunks.append(item)
+                self._nbytes += item[2]
+                self._cond.notify_all()
+
+            if item[0] is None:
+                return
+
+    def next(self):
+        with self._cond:
+            while not self._chunks:
+                if self._closed:
+                    raise ValueError('I/O operation on a closed reader')
+                self._cond.wait()
+
+            chunk, exc_info, nbytes = self._chunks[0]
+            if chunk is None:
+                # leave it there, later calls fail the same way
+                if exc_info is not None:
+                    compat.raise_with_traceback(exc_info[1], exc_info[2])
+                raise StopIteration
+
+            self._chunks.popleft()
+            self._nbytes -= nbytes
+            self._cond.notify_all()
+
+        return chunk
+
+
+# number of values of an object array whose size is measured to estimate
+# the memory held by its objects
+_NBYTES_SAMPLE = 100
+
+
+def _chunk_nbytes(chunk):
+    """ estimate of the memory held by a parsed chunk """
+    if isinstance(chunk, DataFrame):
+        return sum(_values_nbytes(blk.values) for blk in chunk._data.blocks)
+    return _values_nbytes(getattr(chunk, 'values', chunk))
+
+
+def _values_nbytes(values):
+    nbytes = values.nbytes
+    if (isinstance(values, np.ndarray) and values.dtype == np.object_ and
+            values.size):
+        # the array only holds pointers, add the size of the objects from
+        # a sample of them
+        flat = values.ravel()
+        sample = flat[::max(1, len(flat) // _NBYTES_SAMPLE)]
+        nbytes += (len(flat) * sum(sys.getsizeof(x) for x in sample)
+                   // len(sample))
+    return nbytes
 
 
 def _is_index_col(col):
@@ -749,6 +946,7 @@ class ParserBase(object):
         self.parse_dates = kwds.pop('parse_dates', False)
         self.date_parser = kwds.pop('date_parser', None)
         self.dayfirst = kwds.pop('dayfirst', False)
+        self.date_format = kwds.pop('date_format', None)
         self.keep_date_col = kwds.pop('keep_date_col', False)
 
         self.na_values = kwds.get('na_values')
@@ -761,7 +959,8 @@ class ParserBase(object):
         self._date_conv = _make_date_converter(
             date_parser=self.date_parser,
             dayfirst=self.dayfirst,
-            infer_datetime_format=self.infer_datetime_format
+            infer_datetime_format=self.infer_datetime_format,
+            date_format=self.date_format
         )
 
         # validate header options for mi
@@ -1053,6 +1252,21 @@ class CParserWrapper(ParserBase):
         # #2442
         kwds['allow_leading_cols'] = self.index_col is not False
 
+        if kwds.get('colspecs') == 'infer':
+            rows = _peek_lines(src, 100, kwds.get('encoding'),
+                               kwds.get('compression'))
+            kwds['colspecs'] = _detect_colspecs(rows, kwds.get('delimiter'),
+                                                kwds.get('comment'))
+
+        self._byte_ranges = None
+        n_jobs = kwds.pop('n_jobs', 1)
+        if n_jobs is not None and n_jobs > 1:
+            self._byte_ranges = _get_parallel_byte_ranges(src, n_jobs, kwds)
+            if self._byte_ranges is not None:
+                self._src = src
+                self._worker_kwds = kwds.copy()
+                kwds['byte_range'] = self._byte_ranges[0]
+
         self._reader = _parser.TextReader(src, **kwds)
 
         # XXX
@@ -1120,17 +1334,30 @@ class CParserWrapper(ParserBase):
     def _set_noconvert_columns(self):
         names = self.names
 
+        # the positions are kept so that the readers of the other byte
+        # ranges can be set up the same way
+        self._noconvert_columns = noconvert = []
+        self._date_format_columns = date_columns = []
+
         def _set(x):
             if com.is_integer(x):
-                self._reader.set_noconvert(x)
+                noconvert.append(x)
             else:
-                self._reader.set_noconvert(names.index(x))
+                noconvert.append(names.index(x))
+
+        def _set_date(x):
+            # single date columns can be converted by the tokenizer
+            if not com.is_integer(x):
+                x = names.index(x)
+            date_columns.append(x)
 
         if isinstance(self.parse_dates, list):
             for val in self.parse_dates:
                 if isinstance(val, list):
                     for k in val:
                         _set(k)
+                elif self.date_parser is None:
+                    _set_date(val)
                 else:
                     _set(val)
 
@@ -1142,6 +1369,20 @@ class CParserWrapper(ParserBase):
                 else:
                     _set(val)
 
+        self._apply_noconvert_columns(self._reader,
+                                      self._byte_ranges is None)
+
+    def _apply_noconvert_columns(self, reader, convert_dates=True):
+        # the readers of byte ranges return the date columns as strings,
+        # they are converted once the ranges are concatenated
+        for i in self._noconvert_columns:
+            reader.set_noconvert(i)
+        for i in self._date_format_columns:
+            if convert_dates:
+                reader.set_date_format(i, self.date_format)
+            else:
+                reader.set_noconvert(i)
+
     def set_error_bad_lines(self, status):
         self._reader.set_error_bad_lines(int(status))
 
@@ -1151,7 +1392,13 @@ class CParserWrapper(ParserBase):
             return self._reader.read(nrows)
 
         try:
-            data = self._reader.read(nrows)
+            if self._byte_ranges is not None and nrows is not None:
+                self._read_serially()
+
+            if self._byte_ranges is not None:
+                data = self._read_parallel()
+            else:
+                data = self._reader.read(nrows)
         except StopIteration:
             if nrows is None:
                 return None, self.names, {}
@@ -1211,6 +1458,58 @@ class CParserWrapper(ParserBase):
 
         return index, names, data
 
+    def _read_serially(self):
+        """
+        Replace the reader of the first byte range by one over the whole
+        file, as only whole-file reads are split across threads
+        """
+        self._byte_ranges = None
+        self._reader = _parser.TextReader(self._src, **self._worker_kwds)
+        self._apply_noconvert_columns(self._reader)
+
+    def _read_parallel(self):
+        """
+        Tokenize and convert each byte range of the file in its own thread
+        and stitch the resulting columns together.
+        """
+        from multiprocessing.pool import ThreadPool
+
+        # the first range (holding the header) is read by self._reader, the
+        # others are parsed as headerless data using the same column names
+        # so that per-column dtype, converter and NA options line up
+        kwds = self._worker_kwds.copy()
+        kwds['header'] = None
+        kwds['skiprows'] = None
+        if self._reader.header is not None:
+            kwds['names'] = list(self._reader.header[0])
+
+        def _read_range(i):
+            if i == 0:
+                reader = self._reader
+            else:
+                reader = _parser.TextReader(self._src,
+                                            byte_range=self._byte_ranges[i],
+                                            **kwds)
+                self._apply_noconvert_columns(reader, False)
+            try:
+                return reader.read()
+            except StopIteration:
+                return None
+
+        pool = ThreadPool(len(self._byte_ranges))
+        try:
+            chunks = pool.map(_read_range, range(len(self._byte_ranges)))
+        finally:
+            pool.close()
+
+        chunks = [chunk for chunk in chunks if chunk]
+        if not chunks:
+            raise StopIteration
+
+        date_formats = dict((i, self.date_format)
+                            for i in self._date_format_columns)
+        return _parser._concatenate_chunks(chunks, date_formats)
+
     def _filter_usecols(self, names):
         # hackish
         if self.usecols is not None and len(names) != len(self.usecols):
@@ -1287,6 +1586,111 @@ def TextParser(*args, **kwds):
     return TextFileReader(*args, **kwds)
 
 
+# smallest byte range worth handing to a separate tokenizer thread
+_PARALLEL_MIN_BYTES = 2 ** 20
+
+
+def _get_parallel_byte_ranges(src, n_jobs, kwds):
+    """
+    Return the byte ranges of ``src`` to tokenize concurrently, or None if
+    the source / options do not allow it to be split
+    """
+    if not isinstance(src, compat.string_types) or not os.path.isfile(src):
+        return None
+
+    # options whose semantics depend on seeing the file from the start, or
+    # that make it impossible to find a record boundary from the raw bytes
+    if (kwds.get('compression') is not None or
+            kwds.get('as_recarray') or
+            kwds.get('skiprows') or
+            kwds.get('escapechar') is not None or
+            kwds.get('comment') is not None or
+            isinstance(kwds.get('header'), (list, tuple, np.ndarray))):
+        return None
+
+    # fixed-width fields are never quoted
+    quotechar = kwds.get('quotechar')
+    if (kwds.get('quoting') == csv.QUOTE_NONE or not quotechar or
+            kwds.get('colspecs') is not None):
+        quotechar = None
+    elif not isinstance(quotechar, bytes):
+        quotechar = quotechar.encode('utf-8')
+
+    lineterminator = kwds.get('lineterminator') or b'\n'
+    if not isinstance(lineterminator, bytes):
+        lineterminator = lineterminator.encode('utf-8')
+
+    nchunks = min(n_jobs, os.path.getsize(src) // _PARALLEL_MIN_BYTES)
+    if nchunks < 2:
+        return None
+
+    # a quote character is only special at the start of a field, so the
+    # raw bytes do not tell where a quoted field (which may hold line
+    # terminators) ends; such files are not split
+    if quotechar is not None and _file_contains(src, quotechar):
+        return None
+
+    ranges = _get_byte_ranges(src, nchunks, lineterminator=lineterminator)
+    if len(ranges) < 2:
+        return None
+    return ranges
+
+
+def _file_contains(path, value, blocksize=2 ** 20):
+    """ whether the bytes ``value`` occur in the file at ``path`` """
+    overlap = len(value) - 1
+    with open(path, 'rb') as f:
+        tail = b''
+        while True:
+            block = f.read(blocksize)
+            if not block:
+                return False
+            if value in tail + block:
+                return True
+            tail = block[len(block) - overlap:] if overlap else b''
+
+
+def _get_byte_ranges(path, nchunks, lineterminator=b'\n', blocksize=2 ** 20):
+    """
+    Split the file at ``path`` into at most ``nchunks`` contiguous
+    ``(start, stop)`` byte ranges of roughly equal size
+
+    Every range but the last ends just after a line terminator, so the file
+    must not contain quoted fields for each range to be tokenized on its own.
+    """
+    size = os.path.getsize(path)
+    targets = [size * k // nchunks for k in range(1, nchunks)]
+
+    bounds = [0]
+    with open(path, 'rb') as f:
+        for target in targets:
+            if target <= bounds[-1]:
+                continue
+
+            # the first line terminator after the target ends the range
+            f.seek(target)
+            pos = target
+            boundary = None
+            tail = b''
+            while boundary is None:
+                block = f.read(blocksize)
+                if not block:
+                    break
+                idx = (tail + block).find(lineterminator)
+                if idx >= 0:
+                    boundary = pos - len(tail) + idx + len(lineterminator)
+                else:
+                    tail = block[len(block) - len(lineterminator) + 1:]
+                    pos += len(block)
+
+            if boundary is None or boundary >= size:
+                break
+            bounds.append(boundary)
+
+    bounds.append(size)
+    return lzip(bounds[:-1], bounds[1:])
+
+
 def count_empty_vals(vals):
     return sum([1 for v in vals if v == '' or v is None])
 
@@ -2011,9 +2415,13 @@ class PythonParser(ParserBase):
 
 
 def _make_date_converter(date_parser=None, dayfirst=False,
-                         infer_datetime_format=False):
+                         infer_datetime_format=False, date_format=None):
     def converter(*date_cols):
         if date_parser is None:
+            if len(date_cols) == 1 and com.is_datetime64_dtype(date_cols[0]):
+                # already converted by the C parser
+                return date_cols[0]
+
             strs = _concat_date_cols(date_cols)
             try:
                 return tools.to_datetime(
@@ -2021,6 +2429,7 @@ def _make_date_converter(date_parser=None, dayfirst=False,
                     utc=None,
                     box=False,
                     dayfirst=dayfirst,
+                    format=date_format,
                     infer_datetime_format=infer_datetime_format
                 )
             except:
@@ -2277,6 +2686,107 @@ def _concat_date_cols(date_cols):
     return rs
 
 
+def _validate_colspecs(colspecs):
+    if not isinstance(colspecs, (tuple, list)):
+        raise TypeError("column specifications must be a list or tuple, "
+                        "input was a %r" % type(colspecs).__name__)
+
+    for colspec in colspecs:
+
+        if not (isinstance(colspec, (tuple, list)) and
+                len(colspec) == 2 and
+                isinstance(colspec[0], (int, np.integer, type(None))) and
+                isinstance(colspec[1], (int, np.integer, type(None)))):
+            raise TypeError('Each column specification must be '
+                            '2 element tuple or list of integers')
+
+
+def _detect_colspecs(rows, delimiter, comment):
+    delimiter = '\r\n' + delimiter if delimiter else '\n\r\t '
+
+    # Regex escape the delimiters
+    delimiters = ''.join([r'\%s' % x for x in delimiter])
+    pattern = re.compile('([^%s]+)' % delimiters)
+    max_len = max(map(len, rows))
+    mask = np.zeros(max_len + 1, dtype=int)
+    if comment is not None:
+        rows = [row.partition(comment)[0] for row in rows]
+    for row in rows:
+        for m in pattern.finditer(row):
+            mask[m.start():m.end()] = 1
+    shifted = np.roll(mask, 1)
+    shifted[0] = 0
+    edges = np.where((mask ^ shifted) == 1)[0]
+    return list(zip(edges[::2], edges[1::2]))
+
+
+def _fwf_c_unsupported(f, options):
+    """
+    Return why the C engine cannot parse the fixed-width source f with
+    these options, or None
+    """
+    colspecs = options['colspecs']
+    encoding = options['encoding']
+
+    if options['skip_footer'] > 0:
+        return "the 'c' engine does not support skip_footer"
+
+    if options['comment'] is not None and len(options['comment']) > 1:
+        return "the 'c' engine only supports length-1 comment characters"
+
+    if colspecs == 'infer':
+        if not isinstance(f, compat.string_types):
+            if not hasattr(f, 'seek') or options['compression'] is not None:
+                return ("the 'c' engine cannot infer colspecs from an "
+                        "unseekable or compressed buffer")
+    elif any(x is not None and x < 0 for colspec in colspecs
+             for x in colspec):
+        return "the 'c' engine does not support negative colspecs"
+
+    # positions are counted in UTF-8 characters on Python 3, bytes on 2
+    if encoding is not None:
+        if not compat.PY3 or encoding.lower() not in ('utf-8', 'utf8'):
+            return ("the 'c' engine only supports the UTF-8 encoding for "
+                    "fixed-width files")
+
+    return None
+
+
+def _peek_lines(src, n, encoding=None, compression=None):
+    """
+    The first n lines of src as strings, file handles are rewound
+    """
+    if isinstance(src, compat.string_types):
+        if compression == 'gzip':
+            import gzip
+            f = gzip.GzipFile(src, 'rb')
+        elif compression == 'bz2':
+            import bz2
+            f = bz2.BZ2File(src, 'rb')
+        else:
+            f = open(src, 'rb')
+
+        try:
+            rows = [line for _, line in zip(range(n), f)]
+        finally:
+            f.close()
+    else:
+        pos = src.tell()
+        rows = []
+        for _ in range(n):
+            line = src.readline()
+            if not line:
+                break
+            rows.append(line)
+        src.seek(pos)
+
+    if compat.PY3:
+        rows = [row.decode(encoding or 'utf-8')
+                if isinstance(row, bytes) else row for row in rows]
+
+    return rows
+
+
 class FixedWidthReader(object):
     """
     A reader of fixed-width lines.
@@ -2287,22 +2797,12 @@ class FixedWidthReader(object):
         self.delimiter = '\r\n' + delimiter if delimiter else '\n\r\t '
         self.comment = comment
         if colspecs == 'infer':
-            self.colspecs = self.detect_colspecs()
+            self.colspecs = _detect_colspecs(self.get_rows(100), delimiter,
+                                             comment)
         else:
             self.colspecs = colspecs
 
-        if not isinstance(self.colspecs, (tuple, list)):
-            raise TypeError("column specifications must be a list or tuple, "
-                            "input was a %r" % type(colspecs).__name__)
-
-        for colspec in self.colspecs:
-
-            if not (isinstance(colspec, (tuple, list)) and
-                    len(colspec) == 2 and
-                    isinstance(colspec[0], (int, np.integer, type(None))) and
-                    isinstance(colspec[1], (int, np.integer, type(None)))):
-                raise TypeError('Each column specification must be '
-                                '2 element tuple or list of integers')
+        _validate_colspecs(self.colspecs)
 
     def get_rows(self, n):
         rows = []
@@ -2313,23 +2813,6 @@ class FixedWidthReader(object):
         self.buffer = iter(rows)
         return rows
 
-    def detect_colspecs(self, n=100):
-        # Regex escape the delimiters
-        delimiters = ''.join([r'\%s' % x for x in self.delimiter])
-        pattern = re.compile('([^%s]+)' % delimiters)
-        rows = self.get_rows(n)
-        max_len = max(map(len, rows))
-        mask = np.zeros(max_len + 1, dtype=int)
-        if self.comment is not None:
-            rows = [row.partition(self.comment)[0] for row in rows]
-        for row in rows:
-            for m in pattern.finditer(row):
-                mask[m.start():m.end()] = 1
-        shifted = np.roll(mask, 1)
-        shifted[0] = 0
-        edges = np.where((mask ^ shifted) == 1)[0]
-        return list(zip(edges[::2], edges[1::2]))
-
     def next(self):
         if self.buffer is not None:
             try:
@@ -11,6 +11,7 @@ import copy
 import itertools
 import warnings
 import os
+import sys
 
 import numpy as np
 from pandas import (Series, TimeSeries, DataFrame, Panel, Panel4D, Index,
@@ -190,6 +191,7 @@ _TABLE_MAP = {
     u('appendable_series'): 'AppendableSeriesTable',
     u('appendable_multiseries'): 'AppendableMultiSeriesTable',
     u('appendable_frame'): 'AppendableFrameTable',
+    u('appendable_columnar_frame'): 'AppendableColumnarFrameTable',
     u('appendable_multiframe'): 'AppendableMultiFrameTable',
     u('appendable_panel'): 'AppendablePanelTable',
     u('appendable_ndim'): 'AppendableNDimTable',
@@ -250,6 +252,16 @@ def _tables():
 
     return _table_mod
 
+
+def _h5py():
+    """ return the h5py module, which locates the array data for mmap """
+    try:
+        import h5py
+    except ImportError:
+        raise ImportError("mmap=True requires h5py to find the location of "
+                          "the data in the file")
+    return h5py
+
 @contextmanager
 def get_store(path, **kwargs):
     """
@@ -316,6 +328,11 @@ def read_hdf(path_or_buf, key, **kwargs):
         chunksize : optional, nrows to include in iteration, return an iterator
         auto_close : optional, boolean, should automatically close the store
             when finished, default is False
+        mmap : optional, boolean, for a fixed store, return the data of
+            uncompressed arrays as read-only memory maps of the file instead
+            of reading copies, default is False. Requires h5py; if the file
+            cannot be opened again to locate the data (it is locked by a
+            store opened for writing), copies are read
 
         Returns
         -------
@@ -639,7 +656,8 @@ class HDFStore(StringMixin):
         return self._read_group(group)
 
     def select(self, key, where=None, start=None, stop=None, columns=None,
-               iterator=False, chunksize=None, auto_close=False, **kwargs):
+               iterator=False, chunksize=None, auto_close=False, mmap=False,
+               **kwargs):
         """
         Retrieve pandas object stored in file, optionally based on where
         criteria
@@ -656,6 +674,11 @@ class HDFStore(StringMixin):
         chunksize : nrows to include in iteration, return an iterator
         auto_close : boolean, should automatically close the store when
             finished, default is False
+        mmap : boolean, default False, for a fixed store, return the data of
+            uncompressed arrays as read-only memory maps of the file instead
+            of reading copies. Requires h5py; if the file cannot be opened
+            again to locate the data (it is locked by a store opened for
+            writing), copies are read
 
         Returns
         -------
@@ -665,6 +688,8 @@ class HDFStore(StringMixin):
         group = self.get_node(key)
         if group is None:
             raise KeyError('No object named %s in the file' % key)
+        if mmap:
+            _h5py()
 
         # create the storer and axes
         where = _ensure_term(where, scope_level=1)
@@ -675,7 +700,7 @@ class HDFStore(StringMixin):
         def func(_start, _stop, _where):
             return s.read(start=_start, stop=_stop,
                           where=_where,
-                          columns=columns, **kwargs)
+                          columns=columns, mmap=mmap, **kwargs)
 
         # create the iterator
         it = TableIterator(self, s, func, where=where, nrows=s.nrows, start=start,
@@ -820,6 +845,10 @@ class HDFStore(StringMixin):
         append   : boolean, default False
             This will force Table format, append the input data to the
             existing.
+        layout   : 'row' or 'columnar', default 'row'
+            For DataFrames in table format; 'columnar' stores every column
+            that is not a data_column in its own array node, so selecting
+            a subset of the columns only reads those columns
         encoding : default None, provide an encoding for strings
         dropna   : boolean, default True, do not write an ALL nan row to
             the store settable by the option 'io.hdf.dropna_table'
@@ -902,6 +931,8 @@ class HDFStore(StringMixin):
         nan_rep      : string to use as string nan represenation
         chunksize    : size to chunk the writing
         expectedrows : expected TOTAL row size of this table
+        layout       : 'row' or 'columnar', default 'row', the storage
+            layout used when the table is created (see put)
         encoding     : default None, provide an encoding for strings
         dropna       : boolean, default True, do not write an ALL nan row to
             the store settable by the option 'io.hdf.dropna_table'
@@ -1141,7 +1172,7 @@ class HDFStore(StringMixin):
         return kwargs
 
     def _create_storer(self, group, format=None, value=None, append=False,
-                       **kwargs):
+                       layout=None, **kwargs):
         """ return a suitable class to operate """
 
         def error(t):
@@ -1203,6 +1234,8 @@ class HDFStore(StringMixin):
                     if index is not None:
                         if index.nlevels == 1:
                             tt = u('appendable_frame')
+                            if layout == 'columnar':
+                                tt = u('appendable_columnar_frame')
                         elif index.nlevels > 1:
                             tt = u('appendable_multiframe')
                 elif pt == u('wide_table'):
@@ -1227,7 +1260,14 @@ class HDFStore(StringMixin):
             error('_TABLE_MAP')
 
     def _write_to_group(self, key, value, format, index=True, append=False,
-                        complib=None, encoding=None, **kwargs):
+                        complib=None, encoding=None, layout=None, **kwargs):
+        if layout not in (None, 'row', 'columnar'):
+            raise ValueError("layout must be one of 'row' or 'columnar'")
+        if layout == 'columnar' and not (isinstance(value, DataFrame) and
+                                         format == 'table'):
+            raise ValueError("layout='columnar' is only supported for "
+                             "DataFrames stored in table format")
+
         group = self.get_node(key)
 
         # remove the node if we are not appending
@@ -1258,7 +1298,7 @@ class HDFStore(StringMixin):
                 path = new_path
 
         s = self._create_storer(group, format, value, append=append,
-                                encoding=encoding, **kwargs)
+                                encoding=encoding, layout=layout, **kwargs)
         if append:
             # raise if we are trying to append to a Fixed format,
             #       or a table that exists (and we are putting)
@@ -1351,6 +1391,27 @@ class TableIterator(object):
         if self.auto_close:
             self.store.close()
 
+    def groupby(self, by=None, level=None, sort=True):
+        """ group each chunk of the iteration by by / level; the returned
+        TableGroupBy combines the aggregations of the chunks, so only the
+        partial results per group are held in memory
+
+        Parameters
+        ----------
+        by : the keys to group each chunk by (see DataFrame.groupby)
+        level : the index level(s) to group each chunk by
+        sort : boolean, sort the group keys, default is True
+
+        Returns
+        -------
+        a TableGroupBy
+
+        """
+        if self.chunksize is None:
+            raise TypeError("can only groupby a table selected with an "
+                            "iterator or chunksize")
+        return TableGroupBy(self, by=by, level=level, sort=sort)
+
     def get_result(self, coordinates=False):
 
         #  return the actual iterator
@@ -1374,6 +1435,188 @@ class TableIterator(object):
         self.close()
         return results
 
+
+class TableGroupBy(object):
+
+    """ aggregate the chunks of a TableIterator by groups
+
+        each chunk is grouped and aggregated on its own, the partial results
+        are merged into the final result; only aggregations that can be
+        combined this way are supported: sum, count, mean, min, max and var
+
+        Parameters
+        ----------
+
+        iterator : the TableIterator of the chunks
+        by       : the keys to group each chunk by
+        level    : the index level(s) to group each chunk by
+        sort     : boolean, sort the group keys
+        """
+
+    _aggregations = ['sum', 'count', 'mean', 'min', 'max', 'var']
+
+    def __init__(self, iterator, by=None, level=None, sort=True):
+        self.iterator = iterator
+        self.by = by
+        self.level = level
+        self.sort = sort
+
+    def sum(self):
+        """ Compute sum of groups, excluding missing values """
+        return self.agg('sum')
+
+    def count(self):
+        """ Compute count of groups, excluding missing values """
+        return self.agg('count')
+
+    def mean(self):
+        """ Compute mean of groups, excluding missing values """
+        return self.agg('mean')
+
+    def min(self):
+        """ Compute min of groups, excluding missing values """
+        return self.agg('min')
+
+    def max(self):
+        """ Compute max of groups, excluding missing values """
+        return self.agg('max')
+
+    def var(self, ddof=1):
+        """ Compute variance of groups, excluding missing values """
+        return self.agg('var', ddof=ddof)
+
+    def aggregate(self, func, ddof=1):
+        """
+        Aggregate the groups over all the chunks of the table
+
+        Parameters
+        ----------
+        func : string or list of strings, the name(s) of the aggregation(s):
+            'sum', 'count', 'mean', 'min', 'max' or 'var'
+        ddof : integer, delta degrees of freedom of var, default 1
+
+        Returns
+        -------
+        the aggregated object; with a list of funcs the columns are a
+        MultiIndex of (column, func)
+        """
+        if isinstance(func, string_types):
+            funcs = [func]
+        else:
+            funcs = list(func)
+        for f in funcs:
+            if f not in self._aggregations:
+                raise ValueError("cannot aggregate a table by chunks with "
+                                 "[%s], supported are %s"
+                                 % (f, ', '.join(self._aggregations)))
+
+        partials = self._combine_chunks(set(funcs))
+        results = [self._finalize(f, partials, ddof) for f in funcs]
+
+        if isinstance(func, string_types):
+            return results[0]
+        if isinstance(results[0], Series):
+            return concat(results, axis=1, keys=funcs)
+
+        # a column is aggregated by each of the funcs in turn
+        columns = []
+        for result in results:
+            columns.extend(c for c in result.columns if c not in columns)
+
+        pieces, keys = [], []
+        for c in columns:
+            for f, result in zip(funcs, results):
+                if c in result.columns:
+                    pieces.append(result[c])
+                    keys.append((c, f))
+        result = concat(pieces, axis=1, keys=keys)
+        result.columns.names = [None, None]
+        return result
+
+    agg = aggregate
+
+    def _grouped(self, chunk):
+        return chunk.groupby(self.by, level=self.level, sort=self.sort)
+
+    def _combine_chunks(self, funcs):
+        """ compute the partial aggregations needed for funcs on each chunk
+        and merge them into the running results """
+        moments = 'mean' in funcs or 'var' in funcs
+        partials = dict()
+        for chunk in self.iterator:
+            grouped = self._grouped(chunk)
+            current = dict()
+            for f in ('sum', 'count', 'min', 'max'):
+                if f in funcs:
+                    current[f] = getattr(grouped, f)()
+            if moments:
+                current['moments'] = self._moments(grouped)
+
+            for f, value in compat.iteritems(current):
+                if f not in partials:
+                    partials[f] = value
+                elif f in ('sum', 'count'):
+                    partials[f] = self._add_partials(partials[f], value)
+                elif f in ('min', 'max'):
+                    both = concat([partials[f], value])
+                    partials[f] = getattr(self._grouped_index(both), f)()
+                else:
+                    partials[f] = self._merge_moments(partials[f], value)
+        return partials
+
+    def _add_partials(self, a, b):
+        """ add two partial sums; the groups missing from one of them
+        upcast the result while aligning, so cast it back to the dtype of
+        the partials where no missing values are left """
+        result = a.add(b, fill_value=0)
+        if isinstance(result, DataFrame):
+            for c in result.columns:
+                result[c] = _restore_dtype(result[c],
+                                           [x[c] for x in (a, b) if c in x])
+            return result
+        return _restore_dtype(result, [a, b])
+
+    def _grouped_index(self, obj):
+        """ group partial results by all the levels of their index """
+        nlevels = obj.index.nlevels
+        level = lrange(nlevels) if nlevels > 1 else 0
+        return obj.groupby(level=level, sort=self.sort)
+
+    def _moments(self, grouped):
+        """ the count, mean and sum of squared deviations of each group """
+        total = grouped.sum()
+        n = grouped.count()
+        if isinstance(total, DataFrame):
+            n = n.reindex(columns=total.columns)
+        mean = (total / n).fillna(0)
+        m2 = (grouped.var() * (n - 1)).fillna(0)
+        return n, mean, m2
+
+    def _merge_moments(self, a, b):
+        """ merge the moments of two sets of observations (Chan et al.) """
+        na, nb = a[0].align(b[0], fill_value=0)
+        ma, mb = a[1].align(b[1], fill_value=0)
+        m2a, m2b = a[2].align(b[2], fill_value=0)
+        n = na + nb
+        delta = mb - ma
+        mean = (ma + delta * nb / n).fillna(0)
+        m2 = (m2a + m2b + delta ** 2 * na * nb / n).fillna(0)
+        return n, mean, m2
+
+    def _finalize(self, func, partials, ddof):
+        if not partials:
+            return DataFrame()
+        if func in ('mean', 'var'):
+            n, mean, m2 = partials['moments']
+            if func == 'mean':
+                return mean.where(n > 0)
+            return (m2 / (n - ddof)).where(n > ddof)
+
+        result = partials[func]
+        if func == 'count':
+            result = result.astype('int64')
+        return result
+
 class IndexCol(StringMixin):
 
     """ an index column description class
@@ -2028,6 +2271,21 @@ class GenericDataIndexableCol(DataIndexableCol):
         pass
 
 
+class ColumnarDataCol(DataCol):
+
+    """ a data column stored in its own array node rather than as a field
+    of the table; self.table is that node """
+
+    @property
+    def description(self):
+        return None
+
+    @property
+    def col(self):
+        """ the atom of my node, which carries the itemsize for strings """
+        return getattr(self.table, 'atom', None)
+
+
 class Fixed(StringMixin):
 
     """ represent an object in my store
@@ -2243,15 +2501,22 @@ class GenericFixed(Fixed):
     def write(self, obj, **kwargs):
         self.set_attrs()
 
-    def read_array(self, key):
-        """ read an array for the specified node (off of group """
+    def read_array(self, key, mmap=False):
+        """ read an array for the specified node (off of group; with mmap,
+        an uncompressed contiguous node is returned as a read-only view of
+        the file instead of a copy """
         import tables
         node = getattr(self.group, key)
-        data = node[:]
         attrs = node._v_attrs
 
         transposed = getattr(attrs, 'transposed', False)
 
+        data = None
+        if mmap:
+            data = self._memmap_node(node)
+        if data is None:
+            data = node[:]
+
         if isinstance(node, tables.VLArray):
             ret = data[0]
         else:
@@ -2265,15 +2530,57 @@ class GenericFixed(Fixed):
                 ret = data
 
             if dtype == u('datetime64'):
-                ret = np.array(ret, dtype='M8[ns]')
+                if isinstance(ret.base, np.memmap):
+                    ret = ret.view('M8[ns]')
+                else:
+                    ret = np.array(ret, dtype='M8[ns]')
             elif dtype == u('timedelta64'):
-                ret = np.array(ret, dtype='m8[ns]')
+                if isinstance(ret.base, np.memmap):
+                    ret = ret.view('m8[ns]')
+                else:
+                    ret = np.array(ret, dtype='m8[ns]')
 
         if transposed:
             return ret.T
         else:
             return ret
 
+    def _memmap_node(self, node):
+        """ return a read-only ndarray backed by a np.memmap of the data of
+        node in the file, or None if node is not stored uncompressed and
+        contiguously in native byte order """
+        import tables
+        h5py = _h5py()
+
+        if type(node) is not tables.Array or node.chunkshape is not None:
+            return None
+        if node.filters.complevel or node.dtype.hasobject:
+            return None
+        if node.byteorder not in (sys.byteorder, 'irrelevant'):
+            return None
+        if not node.nrows:
+            return None
+        driver = getattr(self.parent._handle, 'driver', None)
+        if driver not in (None, 'H5FD_SEC2', 'H5FD_STDIO', 'H5FD_WINDOWS'):
+            return None
+
+        # data written by this handle has to be in the file to be mapped
+        if self.parent._mode != 'r':
+            self.parent.flush()
+
+        # h5py opens the file a second time; with HDF5 >= 1.10 this fails
+        # while the file is locked by a handle opened for writing
+        try:
+            with h5py.File(self.parent._path, 'r') as f:
+                offset = f[node._v_pathname].id.get_offset()
+        except (IOError, OSError):
+            return None
+        if offset is None:
+            return None
+
+        return np.memmap(self.parent._path, dtype=node.dtype, mode='r',
+                         offset=offset, shape=node.shape).view(np.ndarray)
+
     def read_index(self, key):
         variety = _ensure_decoded(getattr(self.attrs, '%s_variety' % key))
 
@@ -2520,7 +2827,7 @@ class LegacySeriesFixed(LegacyFixed):
     def read(self, **kwargs):
         self.validate_read(kwargs)
         index = self.read_index_legacy('index')
-        values = self.read_array('values')
+        values = self.read_array('values', mmap=kwargs.get('mmap', False))
         return Series(values, index=index)
 
 
@@ -2530,7 +2837,7 @@ class LegacyFrameFixed(LegacyFixed):
         self.validate_read(kwargs)
         index = self.read_index_legacy('index')
         columns = self.read_index_legacy('columns')
-        values = self.read_array('values')
+        values = self.read_array('values', mmap=kwargs.get('mmap', False))
         return DataFrame(values, index=index, columns=columns)
 
 
@@ -2548,7 +2855,7 @@ class SeriesFixed(GenericFixed):
     def read(self, **kwargs):
         self.validate_read(kwargs)
         index = self.read_index('index')
-        values = self.read_array('values')
+        values = self.read_array('values', mmap=kwargs.get('mmap', False))
         return Series(values, index=index, name=self.name)
 
     def write(self, obj, **kwargs):
@@ -2695,7 +3002,8 @@ class BlockManagerFixed(GenericFixed):
         blocks = []
         for i in range(self.nblocks):
             blk_items = self.read_index('block%d_items' % i)
-            values = self.read_array('block%d_values' % i)
+            values = self.read_array('block%d_values' % i,
+                                     mmap=kwargs.get('mmap', False))
             blk = make_block(values,
                              placement=items.get_indexer(blk_items))
             blocks.append(blk)
@@ -2768,6 +3076,7 @@ class Table(Fixed):
     levels = 1
     is_table = True
     is_shape_reversed = False
+    _values_col_class = DataCol
 
     def __init__(self, *args, **kwargs):
         super(Table, self).__init__(*args, **kwargs)
@@ -2783,6 +3092,10 @@ class Table(Fixed):
     def table_type_short(self):
         return self.table_type.split('_')[0]
 
+    @property
+    def is_columnar(self):
+        return self._values_col_class is ColumnarDataCol
+
     @property
     def format_type(self):
         return 'table'
@@ -3003,7 +3316,7 @@ class Table(Fixed):
             base_pos = len(self._indexables)
 
             def f(i, c):
-                klass = DataCol
+                klass = self._values_col_class
                 if c in dc:
                     klass = DataIndexableCol
                 return klass.create_for_block(i=i, name=c, pos=base_pos + i,
@@ -3075,9 +3388,10 @@ class Table(Fixed):
                 if not v.is_indexed:
                     v.create_index(**kw)
 
-    def read_axes(self, where, **kwargs):
+    def read_axes(self, where, columns=None, **kwargs):
         """create and return the axes sniffed from the table: return boolean
-        for success
+        for success; columns is only used by layouts which can read a subset
+        of the values
         """
 
         # validate the version
@@ -3265,6 +3579,20 @@ class Table(Fixed):
                     blocks.extend(mgr.blocks)
                     blk_items.extend(get_blk_items(mgr, mgr.blocks))
 
+            # one values block per column, each is stored separately
+            if self.is_columnar:
+                new_blocks, new_blk_items = [], []
+                for b, b_items in zip(blocks, blk_items):
+                    if len(b_items) == 1:
+                        new_blocks.append(b)
+                        new_blk_items.append(b_items)
+                        continue
+                    for c in b_items:
+                        mgr = block_obj.reindex_axis([c], axis=axis)._data
+                        new_blocks.extend(mgr.blocks)
+                        new_blk_items.extend(get_blk_items(mgr, mgr.blocks))
+                blocks, blk_items = new_blocks, new_blk_items
+
         # reorder the blocks in the same order as the existing_table if we can
         if existing_table is not None:
             by_items = dict([(tuple(b_items.tolist()), (b, b_items))
@@ -3290,7 +3618,7 @@ class Table(Fixed):
         for i, (b, b_items) in enumerate(zip(blocks, blk_items)):
 
             # shape of the data column are the indexable axes
-            klass = DataCol
+            klass = self._values_col_class
             name = None
 
             # we have a data_column
@@ -3725,7 +4053,7 @@ class AppendableTable(LegacyTable):
                   for v in values]
         bvalues = []
         for i, v in enumerate(values):
-            new_shape = (nrows,) + self.dtype[names[nindexes + i]].shape
+            new_shape = (nrows,) + self.values_axes[i].typ.shape
             bvalues.append(values[i].ravel().reshape(new_shape))
 
         # write the chunks
@@ -3858,7 +4186,7 @@ class AppendableFrameTable(AppendableTable):
 
     def read(self, where=None, columns=None, **kwargs):
 
-        if not self.read_axes(where=where, **kwargs):
+        if not self.read_axes(where=where, columns=columns, **kwargs):
             return None
 
         info = (self.info.get(self.non_index_axes[0][0], dict())
@@ -3905,6 +4233,242 @@ class AppendableFrameTable(AppendableTable):
         return df
 
 
+class AppendableColumnarFrameTable(AppendableFrameTable):
+
+    """ a frame table where each values column is stored in its own array
+    node next to the table; the table itself only holds the index and the
+    data_columns, so where clauses work as usual while selecting columns
+    only reads the nodes of those columns """
+    table_type = u('appendable_columnar_frame')
+    _values_col_class = ColumnarDataCol
+
+    # rows of a column node moved at a time when deleting rows
+    _move_chunksize = 100000
+
+    def _column_node(self, cname):
+        return getattr(self.group, cname)
+
+    def _read_column_node(self, cname, coordinates=None, start=None,
+                          stop=None):
+        """ read rows of a column node, by coordinates or by start/stop """
+        node = self._column_node(cname)
+        if coordinates is None:
+            return node[start:stop]
+        coordinates = np.asarray(coordinates)
+        if not len(coordinates):
+            return node[0:0]
+
+        # read the covering range of each run of coordinates that are at
+        # most a chunk of the node apart, then take the selected rows
+        coordinates, inverse = np.unique(coordinates, return_inverse=True)
+        gap = max((node.chunkshape or (1,))[0], 1)
+        runs = np.split(coordinates,
+                        np.nonzero(np.diff(coordinates) > gap)[0] + 1)
+        values = [node[run[0]:run[-1] + 1][run - run[0]] for run in runs]
+        return np.concatenate(values)[inverse]
+
+    def get_attrs(self):
+        super(AppendableColumnarFrameTable, self).get_attrs()
+        self.values_axes = [
+            a if a.is_data_indexable else a.infer(self._column_node(a.cname))
+            for a in self.values_axes
+        ]
+
+    def create_description(self, **kwargs):
+        """ the table only holds the indexables and the data columns """
+        d = super(AppendableColumnarFrameTable, self).create_description(
+            **kwargs)
+        d['description'] = dict([(a.cname, a.typ) for a in self.axes
+                                 if a.is_data_indexable])
+        return d
+
+    def write(self, obj, axes=None, append=False, complib=None,
+              complevel=None, fletcher32=None, min_itemsize=None,
+              chunksize=None, expectedrows=None, dropna=True, **kwargs):
+
+        if not append and self.is_exists:
+            for name in list(self.group._v_children):
+                self._handle.remove_node(self.group, name, recursive=True)
+
+        # create the axes
+        self.create_axes(axes=axes, obj=obj, validate=append,
+                         min_itemsize=min_itemsize,
+                         **kwargs)
+
+        if not self.is_exists:
+
+            # create the table and a node per values column
+            options = self.create_description(complib=complib,
+                                              complevel=complevel,
+                                              fletcher32=fletcher32,
+                                              expectedrows=expectedrows)
+            self.set_attrs()
+            table = self._handle.create_table(self.group, **options)
+
+            for a in self.values_axes:
+                if a.is_data_indexable:
+                    continue
+                atom = _tables().Atom.from_dtype(np.dtype(a.typ.dtype))
+                self._handle.create_earray(
+                    self.group, a.cname, atom=atom, shape=(0,),
+                    filters=options.get('filters'),
+                    expectedrows=options['expectedrows'])
+
+        else:
+            table = self.table
+
+        # update my info
+        self.set_info()
+
+        # validate the axes and set the kinds
+        for a in self.axes:
+            if a.is_data_indexable:
+                a.validate_and_set(table, append)
+            else:
+                a.validate_and_set(self._column_node(a.cname), append)
+
+        # add the rows
+        self.write_data(chunksize, dropna=dropna)
+
+    def write_data_chunk(self, indexes, mask, values):
+
+        # 0 len
+        for v in values:
+            if not np.prod(v.shape):
+                return
+
+        table_values = []
+        column_values = []
+        for a, v in zip(self.values_axes, values):
+            if a.is_data_indexable:
+                table_values.append(v)
+            else:
+                column_values.append((a, v))
+
+        super(AppendableColumnarFrameTable, self).write_data_chunk(
+            indexes, mask, table_values)
+
+        keep = ~mask.ravel().astype(bool)
+        try:
+            for a, v in column_values:
+                v = v[keep]
+                if len(v):
+                    node = self._column_node(a.cname)
+                    node.append(v)
+                    node.flush()
+        except Exception as detail:
+            raise TypeError("tables cannot write this data -> %s" % detail)
+
+    def read_axes(self, where, columns=None, **kwargs):
+
+        # validate the version
+        self.validate_version(where)
+
+        # infer the data kind
+        if not self.infer_axes():
+            return False
+
+        # select the rows of the table; columns are read with the same
+        # start/stop or coordinates
+        self.selection = selection = Selection(self, where=where, **kwargs)
+        coordinates = None
+        if selection.condition is None and selection.coordinates is None:
+            values = selection.select()
+        else:
+            coordinates = selection.select_coords()
+            values = self.table.read_coordinates(coordinates)
+
+        # only the nodes of the requested columns are read
+        if columns is not None:
+            wanted = set(columns)
+            values_axes = [a for a in self.values_axes
+                           if a.is_data_indexable or wanted & set(a.values)]
+            self.values_axes = values_axes or self.values_axes[:1]
+
+        nodes = {}
+        for a in self.values_axes:
+            if not a.is_data_indexable:
+                nodes[a.cname] = self._read_column_node(
+                    a.cname, coordinates, selection.start, selection.stop)
+
+        # convert the data
+        for a in self.axes:
+            a.set_info(self.info)
+            a.convert(nodes.get(a.cname, values), nan_rep=self.nan_rep,
+                      encoding=self.encoding)
+
+        return True
+
+    def read_column(self, column, where=None, start=None, stop=None,
+                    **kwargs):
+
+        # a values column is read from its own node
+        if self.infer_axes():
+            for a in self.values_axes:
+                if a.is_data_indexable or list(a.values) != [column]:
+                    continue
+                if where is not None:
+                    raise TypeError("read_column does not currently accept "
+                                    "a where clause")
+                a.set_info(self.info)
+                data = a.convert(self._column_node(a.cname)[start:stop],
+                                 nan_rep=self.nan_rep,
+                                 encoding=self.encoding).take_data()
+                return Series(_set_tz(data.ravel(), a.tz, True))
+
+        return super(AppendableColumnarFrameTable, self).read_column(
+            column, where=where, start=start, stop=stop, **kwargs)
+
+    def delete(self, where=None, start=None, stop=None, **kwargs):
+
+        # delete the group
+        if where is None and start is None and stop is None:
+            return super(AppendableColumnarFrameTable, self).delete()
+
+        # infer the data kind
+        if not self.infer_axes():
+            return None
+
+        # the rows are selected on the table, before any of it is removed
+        selection = Selection(self, where=where, start=start, stop=stop,
+                              **kwargs)
+        coordinates = np.unique(selection.select_coords())
+        if not len(coordinates):
+            return 0
+
+        # an array node cannot remove rows, so the kept rows are moved down
+        # over the removed ones; the nodes are only truncated once all of
+        # them have been moved, so they never differ in length
+        nodes = [self._column_node(a.cname) for a in self.values_axes
+                 if not a.is_data_indexable]
+        for node in nodes:
+            self._move_column_rows(node, coordinates)
+        for node in nodes:
+            node.truncate(node.nrows - len(coordinates))
+            node.flush()
+
+        return super(AppendableColumnarFrameTable, self).delete(
+            where=coordinates)
+
+    def _move_column_rows(self, node, coordinates):
+        """ move the rows of a column node that are not at the sorted
+        coordinates down over the rows that are, a chunk at a time """
+        nrows = node.nrows
+        chunksize = self._move_chunksize
+        dest = coordinates[0]
+        for start in range(dest, nrows, chunksize):
+            stop = min(start + chunksize, nrows)
+            values = node[start:stop]
+            lo, hi = coordinates.searchsorted([start, stop])
+            if hi > lo:
+                keep = np.ones(len(values), dtype=bool)
+                keep[coordinates[lo:hi] - start] = False
+                values = values[keep]
+            if len(values):
+                node[dest:dest + len(values)] = values
+                dest += len(values)
+
+
 class AppendableSeriesTable(AppendableFrameTable):
     """ support the new appendable table formats """
     pandas_kind = u('series_table')
@@ -4074,6 +4638,14 @@ class AppendableNDimTable(AppendablePanelTable):
     obj_type = Panel4D
 
 
+def _restore_dtype(result, parts):
+    """ cast result to the common dtype of parts if it has no nulls """
+    dtype = np.result_type(*[p.dtype for p in parts])
+    if result.dtype != dtype and not result.isnull().any():
+        result = result.astype(dtype)
+    return result
+
+
 def _reindex_axis(obj, axis, labels, other=None):
     ax = obj._get_axis(axis)
     labels = _ensure_index(labels)
@@ -9,6 +9,7 @@ from datetime import datetime, date
 
 import warnings
 import traceback
+import itertools
 import re
 import numpy as np
 
@@ -115,12 +116,93 @@ def _parse_date_columns(data_frame, parse_dates):
     return data_frame
 
 
+# number of rows fetched at a time when reading a whole result set
+_FETCH_BATCH_SIZE = 10000
+
+
+def _convert_column(values, coerce_float=True):
+    """Convert an object array of column values to the inferred dtype"""
+    values = lib.maybe_convert_objects(values, try_float=coerce_float)
+    return com._possibly_cast_to_datetime(values, None)
+
+
+def _convert_rows(rows, ncols, coerce_float=True):
+    """Convert a batch of fetched rows into one typed array per column"""
+    if not isinstance(rows, list):
+        rows = list(rows)
+    content = lib.to_object_array_tuples(rows)
+
+    arrays = []
+    for i in range(ncols):
+        # copy the object columns, so they don't keep the batch alive
+        values = _convert_column(content[:, i], coerce_float=coerce_float)
+        if values.dtype == np.object_:
+            values = values.copy()
+        arrays.append(values)
+    return arrays
+
+
+def _concat_column(pieces, coerce_float=True):
+    """Concatenate the typed arrays of a column from several batches"""
+    if len(pieces) == 1:
+        return pieces[0]
+    if len(set(p.dtype for p in pieces)) == 1:
+        return np.concatenate(pieces)
+
+    # the batches were inferred differently (e.g. int and float): convert
+    # the column as a whole, as if it was fetched at once
+    from pandas.tseries.index import DatetimeIndex
+    values = []
+    for p in pieces:
+        if com.is_datetime64_dtype(p):
+            p = DatetimeIndex(p).asobject.values
+        values.append(p.astype(object))
+    return _convert_column(np.concatenate(values), coerce_float=coerce_float)
+
+
+def _fetch_columns(result, ncols, coerce_float=True,
+                   batch_size=None):
+    """
+    Fetch a whole result set in batches of rows into one typed array per
+    column; only the rows of one batch are held as python objects. Returns
+    None if the result set has no rows.
+    """
+    if batch_size is None:
+        batch_size = _FETCH_BATCH_SIZE
+
+    pieces = [[] for _ in range(ncols)]
+    while True:
+        rows = result.fetchmany(batch_size)
+        if not rows:
+            break
+        for i, values in enumerate(_convert_rows(rows, ncols,
+                                                 coerce_float=coerce_float)):
+            pieces[i].append(values)
+
+    if not ncols or not pieces[0]:
+        return None
+
+    arrays = []
+    for i in range(ncols):
+        arrays.append(_concat_column(pieces[i], coerce_float=coerce_float))
+        pieces[i] = None
+    return arrays
+
+
+def _arrays_to_frame(arrays, columns, coerce_float=True):
+    """Create a DataFrame from the arrays of _fetch_columns / _convert_rows"""
+    if arrays is None:
+        return DataFrame.from_records([], columns=columns,
+                                      coerce_float=coerce_float)
+    return DataFrame._from_arrays(arrays, columns, None)
+
+
 def _wrap_result(data, columns, index_col=None, coerce_float=True,
                  parse_dates=None):
-    """Wrap result set of query in a DataFrame """
+    """Wrap result set of query in a DataFrame; data is a list of arrays,
+    one per column, or None for an empty result set """
 
-    frame = DataFrame.from_records(data, columns=columns,
-                                   coerce_float=coerce_float)
+    frame = _arrays_to_frame(data, columns, coerce_float=coerce_float)
 
     _parse_date_columns(frame, parse_dates)
 
@@ -484,7 +566,7 @@ def read_sql(sql, con, index_col=None, coerce_float=True, params=None,
 
 
 def to_sql(frame, name, con, flavor='sqlite', schema=None, if_exists='fail',
-           index=True, index_label=None, chunksize=None):
+           index=True, index_label=None, chunksize=None, method=None):
     """
     Write records stored in a DataFrame to a SQL database.
 
@@ -517,6 +599,18 @@ def to_sql(frame, name, con, flavor='sqlite', schema=None, if_exists='fail',
     chunksize : int, default None
         If not None, then rows will be written in batches of this size at a
         time.  If None, all rows will be written at once.
+    method : {None, 'multi', callable}, default None
+        Controls the SQL insertion clause used:
+
+        - None : Uses standard SQL ``INSERT`` clause (one per row).
+        - 'multi': Pass multiple values in a single ``INSERT`` clause, with
+          as many rows per statement as the parameter limit of the database
+          allows.
+        - callable with signature ``(pd_table, conn, keys, data_iter)``,
+          e.g. to use a bulk loader of the database driver: ``pd_table`` is
+          the SQLTable, ``conn`` the connection (or cursor) of the
+          transaction, ``keys`` the list of column names and ``data_iter``
+          an iterable of the row tuples of a chunk.
 
     """
     if if_exists not in ('fail', 'replace', 'append'):
@@ -531,7 +625,7 @@ def to_sql(frame, name, con, flavor='sqlite', schema=None, if_exists='fail',
 
     pandas_sql.to_sql(frame, name, if_exists=if_exists, index=index,
                       index_label=index_label, schema=schema,
-                      chunksize=chunksize)
+                      chunksize=chunksize, method=method)
 
 
 def has_table(table_name, con, flavor='sqlite', schema=None):
@@ -564,6 +658,22 @@ def has_table(table_name, con, flavor='sqlite', schema=None):
 table_exists = has_table
 
 
+# the maximum number of parameters of a statement, which bounds the rows of a
+# multi-row insert; 999 is the default SQLITE_MAX_VARIABLE_NUMBER
+_MAX_PARAMETERS = {
+    'sqlite': 999,
+    'mysql': 65535,
+    'postgresql': 32767,
+    'mssql': 2100,
+}
+
+
+def _max_insert_rows(dialect, ncols):
+    """Return the number of rows of a multi-row insert of ncols columns"""
+    limit = _MAX_PARAMETERS.get(dialect, _MAX_PARAMETERS['sqlite'])
+    return max(1, limit // max(1, ncols))
+
+
 _MYSQL_WARNING = ("The 'mysql' flavor with DBAPI connection is deprecated "
                   "and will be removed in future versions. "
                   "MySQL will be further supported with SQLAlchemy engines.")
@@ -674,7 +784,11 @@ class SQLTable(PandasObject):
 
             # replace NaN with None
             if b._can_hold_na:
-                mask = isnull(d)
+                # the mask is cheaper to find on the typed values
+                if b.is_float or b.is_datetime:
+                    mask = isnull(b.values)
+                else:
+                    mask = isnull(d)
                 d[mask] = None
 
             for col_loc, col in zip(b.mgr_locs, d):
@@ -682,11 +796,35 @@ class SQLTable(PandasObject):
 
         return column_names, data_list
 
+    def _dialect(self):
+        return self.pd_sql.engine.dialect.name
+
     def _execute_insert(self, conn, keys, data_iter):
         data = [dict((k, v) for k, v in zip(keys, row)) for row in data_iter]
         conn.execute(self.insert_statement(), data)
 
-    def insert(self, chunksize=None):
+    def _execute_insert_multi(self, conn, keys, data_iter):
+        """Insert the rows with multi-row VALUES clauses"""
+        rows = list(data_iter)
+        size = _max_insert_rows(self._dialect(), len(keys))
+        for start in range(0, len(rows), size):
+            data = [dict((k, v) for k, v in zip(keys, row))
+                    for row in rows[start:start + size]]
+            conn.execute(self.insert_statement().values(data))
+
+    def insert(self, chunksize=None, method=None):
+
+        # set insert method
+        if method is None:
+            exec_insert = self._execute_insert
+        elif method == 'multi':
+            exec_insert = self._execute_insert_multi
+        elif callable(method):
+            exec_insert = lambda conn, keys, data_iter: method(
+                self, conn, keys, data_iter)
+        else:
+            raise ValueError("Invalid parameter 'method': {0}".format(method))
+
         keys, data_list = self.insert_data()
 
         nrows = len(self.frame)
@@ -709,7 +847,7 @@ class SQLTable(PandasObject):
                     break
 
                 chunk_iter = zip(*[arr[start_i:end_i] for arr in data_list])
-                self._execute_insert(conn, keys, chunk_iter)
+                exec_insert(conn, keys, chunk_iter)
 
     def _query_iterator(self, result, chunksize, columns, coerce_float=True,
                         parse_dates=None):
@@ -720,8 +858,10 @@ class SQLTable(PandasObject):
             if not data:
                 break
             else:
-                self.frame = DataFrame.from_records(
-                    data, columns=columns, coerce_float=coerce_float)
+                data = _convert_rows(data, len(columns),
+                                     coerce_float=coerce_float)
+                self.frame = _arrays_to_frame(data, columns,
+                                              coerce_float=coerce_float)
 
                 self._harmonize_columns(parse_dates=parse_dates)
 
@@ -750,9 +890,10 @@ class SQLTable(PandasObject):
                                         coerce_float=coerce_float,
                                         parse_dates=parse_dates)
         else:
-            data = result.fetchall()
-            self.frame = DataFrame.from_records(
-                data, columns=column_names, coerce_float=coerce_float)
+            data = _fetch_columns(result, len(column_names),
+                                  coerce_float=coerce_float)
+            self.frame = _arrays_to_frame(data, column_names,
+                                          coerce_float=coerce_float)
 
             self._harmonize_columns(parse_dates=parse_dates)
 
@@ -1036,6 +1177,8 @@ class SQLDatabase(PandasSQL):
             if not data:
                 break
             else:
+                data = _convert_rows(data, len(columns),
+                                     coerce_float=coerce_float)
                 yield _wrap_result(data, columns, index_col=index_col,
                                    coerce_float=coerce_float,
                                    parse_dates=parse_dates)
@@ -1090,7 +1233,8 @@ class SQLDatabase(PandasSQL):
                                         coerce_float=coerce_float,
                                         parse_dates=parse_dates)
         else:
-            data = result.fetchall()
+            data = _fetch_columns(result, len(columns),
+                                  coerce_float=coerce_float)
             frame = _wrap_result(data, columns, index_col=index_col,
                                  coerce_float=coerce_float,
                                  parse_dates=parse_dates)
@@ -1099,7 +1243,7 @@ class SQLDatabase(PandasSQL):
     read_sql = read_query
 
     def to_sql(self, frame, name, if_exists='fail', index=True,
-               index_label=None, schema=None, chunksize=None):
+               index_label=None, schema=None, chunksize=None, method=None):
         """
         Write records stored in a DataFrame to a SQL database.
 
@@ -1125,13 +1269,15 @@ class SQLDatabase(PandasSQL):
         chunksize : int, default None
             If not None, then rows will be written in batches of this size at a
             time.  If None, all rows will be written at once.
+        method : {None, 'multi', callable}, default None
+            Controls the SQL insertion clause used, see ``pandas.to_sql``.
     
         """
         table = SQLTable(name, self, frame=frame, index=index,
                          if_exists=if_exists, index_label=index_label,
                          schema=schema)
         table.create()
-        table.insert(chunksize)
+        table.insert(chunksize, method=method)
         # check for potentially case sensitivity issues (GH7815)
         if name not in self.engine.table_names(schema=schema or self.meta.schema):
             warnings.warn("The provided table name '{0}' is not found exactly "
@@ -1234,7 +1380,7 @@ class SQLiteTable(SQLTable):
             for stmt in self.table:
                 conn.execute(stmt)
 
-    def insert_statement(self):
+    def insert_statement(self, num_rows=1):
         names = list(map(str, self.frame.columns))
         flv = self.pd_sql.flavor
         br_l = _SQL_SYMB[flv]['br_l']  # left val quote char
@@ -1246,15 +1392,27 @@ class SQLiteTable(SQLTable):
 
         bracketed_names = [br_l + column + br_r for column in names]
         col_names = ','.join(bracketed_names)
-        wildcards = ','.join([wld] * len(names))
-        insert_statement = 'INSERT INTO %s (%s) VALUES (%s)' % (
+        row_wildcards = ','.join([wld] * len(names))
+        wildcards = ','.join(['(%s)' % row_wildcards] * num_rows)
+        insert_statement = 'INSERT INTO %s (%s) VALUES %s' % (
             self.name, col_names, wildcards)
         return insert_statement
 
+    def _dialect(self):
+        return self.pd_sql.flavor
+
     def _execute_insert(self, conn, keys, data_iter):
         data_list = list(data_iter)
         conn.executemany(self.insert_statement(), data_list)
 
+    def _execute_insert_multi(self, conn, keys, data_iter):
+        rows = list(data_iter)
+        size = _max_insert_rows(self._dialect(), len(keys))
+        for start in range(0, len(rows), size):
+            batch = rows[start:start + size]
+            conn.execute(self.insert_statement(num_rows=len(batch)),
+                         list(itertools.chain.from_iterable(batch)))
+
     def _create_table_setup(self):
         """
         Return a list of SQL statement that create a table reflecting the
@@ -1392,6 +1550,8 @@ class SQLiteDatabase(PandasSQL):
                 cursor.close()
                 break
             else:
+                data = _convert_rows(data, len(columns),
+                                     coerce_float=coerce_float)
                 yield _wrap_result(data, columns, index_col=index_col,
                                    coerce_float=coerce_float,
                                    parse_dates=parse_dates)
@@ -1409,7 +1569,8 @@ class SQLiteDatabase(PandasSQL):
                                         coerce_float=coerce_float,
                                         parse_dates=parse_dates)
         else:
-            data = self._fetchall_as_list(cursor)
+            data = _fetch_columns(cursor, len(columns),
+                                  coerce_float=coerce_float)
             cursor.close()
 
             frame = _wrap_result(data, columns, index_col=index_col,
@@ -1417,14 +1578,8 @@ class SQLiteDatabase(PandasSQL):
                                  parse_dates=parse_dates)
             return frame
 
-    def _fetchall_as_list(self, cur):
-        result = cur.fetchall()
-        if not isinstance(result, list):
-            result = list(result)
-        return result
-
     def to_sql(self, frame, name, if_exists='fail', index=True,
-               index_label=None, schema=None, chunksize=None):
+               index_label=None, schema=None, chunksize=None, method=None):
         """
         Write records stored in a DataFrame to a SQL database.
 
@@ -1448,12 +1603,14 @@ class SQLiteDatabase(PandasSQL):
         chunksize : int, default None
             If not None, then rows will be written in batches of this
             size at a time. If None, all rows will be written at once.
+        method : {None, 'multi', callable}, default None
+            Controls the SQL insertion clause used, see ``pandas.to_sql``.
 
         """
         table = SQLiteTable(name, self, frame=frame, index=index,
                             if_exists=if_exists, index_label=index_label)
         table.create()
-        table.insert(chunksize)
+        table.insert(chunksize, method=method)
 
     def has_table(self, name, schema=None):
         flavor_map = {
@@ -29,7 +29,8 @@ from pandas.tslib import NaT, Timestamp
 
 def read_stata(filepath_or_buffer, convert_dates=True,
                convert_categoricals=True, encoding=None, index=None,
-               convert_missing=False, preserve_dtypes=True, columns=None):
+               convert_missing=False, preserve_dtypes=True, columns=None,
+               iterator=False, chunksize=None):
     """
     Read Stata file into DataFrame
 
@@ -58,8 +59,25 @@ def read_stata(filepath_or_buffer, convert_dates=True,
     columns : list or None
         Columns to retain.  Columns will be returned in the given order.  None
         returns all columns
+    iterator : boolean, default False
+        Return StataReader object for iterative reading
+    chunksize : int, default None
+        Return StataReader object for iteration, returning chunks with
+        given number of records; the values are converted per chunk
+
+    Returns
+    -------
+    DataFrame or StataReader
     """
-    reader = StataReader(filepath_or_buffer, encoding)
+    reader = StataReader(filepath_or_buffer, encoding, chunksize=chunksize)
+
+    if iterator or chunksize is not None:
+        reader._read_kwargs = dict(
+            convert_dates=convert_dates,
+            convert_categoricals=convert_categoricals, index=index,
+            convert_missing=convert_missing, preserve_dtypes=preserve_dtypes,
+            columns=columns)
+        return reader
 
     return reader.data(convert_dates, convert_categoricals, index,
                        convert_missing, preserve_dtypes, columns)
@@ -817,15 +835,22 @@ class StataReader(StataParser):
     encoding : string, None or encoding
         Encoding used to parse the files. Note that Stata doesn't
         support unicode. None defaults to cp1252.
+    chunksize : int, default None
+        Number of records returned by each iteration or get_chunk()
     """
 
-    def __init__(self, path_or_buf, encoding='cp1252'):
+    def __init__(self, path_or_buf, encoding='cp1252', chunksize=None):
         super(StataReader, self).__init__(encoding)
         self.col_sizes = ()
         self._has_string_data = False
         self._missing_values = False
         self._data_read = False
         self._value_labels_read = False
+        self._lines_read = 0
+        self._categories = {}
+        self._categories_missing = None
+        self._chunksize = chunksize
+        self._read_kwargs = dict()
         if isinstance(path_or_buf, str):
             path_or_buf, encoding = get_filepath_or_buffer(
                 path_or_buf, encoding=self._default_encoding
@@ -1080,6 +1105,10 @@ class StataReader(StataParser):
             if self._value_labels_read:
                 raise Exception("Value labels have already been read.")
 
+            # the value labels follow the data
+            self.path_or_buf.seek(self.data_location +
+                                  self.nobs * self._record_dtype().itemsize)
+
         self.value_label_dict = dict()
 
         if self.format_version <= 108:
@@ -1166,30 +1195,128 @@ class StataReader(StataParser):
         -------
         y : DataFrame instance
         """
-        self._missing_values = convert_missing
         if self._data_read:
             raise Exception("Data has already been read.")
-        self._data_read = True
 
-        if self.format_version >= 117:
-            self._read_strls()
+        return self.read(None, convert_dates=convert_dates,
+                         convert_categoricals=convert_categoricals,
+                         index=index, convert_missing=convert_missing,
+                         preserve_dtypes=preserve_dtypes, columns=columns)
 
-        # Read data
-        count = self.nobs
+    def __iter__(self):
+        try:
+            while True:
+                yield self.get_chunk()
+        except StopIteration:
+            pass
+
+    def get_chunk(self, size=None):
+        """
+        Reads the next chunk of size (default is the chunksize of the
+        reader) records, with the options passed to read_stata
+        """
+        if size is None:
+            size = self._chunksize
+        return self.read(nrows=size, **self._read_kwargs)
+
+    def _record_dtype(self):
+        """ the numpy dtype of a data record """
         dtype = []  # Convert struct data types to numpy data type
         for i, typ in enumerate(self.typlist):
             if typ in self.NUMPY_TYPE_MAP:
                 dtype.append(('s' + str(i), self.NUMPY_TYPE_MAP[typ]))
             else:
                 dtype.append(('s' + str(i), 'S' + str(typ)))
-        dtype = np.dtype(dtype)
-        read_len = count * dtype.itemsize
-        self.path_or_buf.seek(self.data_location)
-        data = np.frombuffer(self.path_or_buf.read(read_len),dtype=dtype,count=count)
-        self._data_read = True
+        return np.dtype(dtype)
 
-        if convert_categoricals:
-            self._read_value_labels()
+    def read(self, nrows=None, convert_dates=True, convert_categoricals=True,
+             index=None, convert_missing=False, preserve_dtypes=True,
+             columns=None):
+        """
+        Reads the next nrows (default is all the remaining) observations
+        from the Stata file and converts them into a dataframe; see data()
+        for the other parameters
+
+        Returns
+        -------
+        y : DataFrame instance
+
+        Raises StopIteration once all the observations have been read
+        """
+        self._missing_values = convert_missing
+
+        dtype = self._record_dtype()
+        if not self._data_read:
+            self._data_read = True
+
+            if self.format_version >= 117:
+                self._read_strls()
+
+            # the value labels are needed for each chunk, so they are read
+            # before the data
+            if convert_categoricals and not self._value_labels_read:
+                self._read_value_labels()
+
+        elif self._lines_read >= self.nobs:
+            raise StopIteration
+
+        # Read data
+        start = self._lines_read
+        count = self.nobs - start
+        if nrows is not None:
+            count = min(count, int(nrows))
+
+        # the categories of a chunk can only come from all the records
+        if convert_categoricals and count < self.nobs:
+            self._read_categories(dtype, convert_missing)
+
+        self.path_or_buf.seek(self.data_location + start * dtype.itemsize)
+        data = np.frombuffer(self.path_or_buf.read(count * dtype.itemsize),
+                             dtype=dtype, count=count)
+        self._lines_read += count
+
+        return self._convert_records(data, start, convert_dates,
+                                     convert_categoricals, index,
+                                     preserve_dtypes, columns)
+
+    def _read_categories(self, dtype, convert_missing):
+        """ scan all the records for the categories of the labeled
+        columns, once per setting of convert_missing """
+        if self._categories_missing is convert_missing:
+            return
+
+        labeled = [col for col, lbl in zip(self.varlist, self.lbllist)
+                   if lbl in self.value_label_dict]
+        values = dict((col, []) for col in labeled)
+        if labeled:
+            nrows = max(1, _SCAN_CHUNK_BYTES // dtype.itemsize)
+            for start in range(0, self.nobs, nrows):
+                count = min(nrows, self.nobs - start)
+                self.path_or_buf.seek(self.data_location +
+                                      start * dtype.itemsize)
+                data = np.frombuffer(
+                    self.path_or_buf.read(count * dtype.itemsize),
+                    dtype=dtype, count=count)
+                data = self._convert_records(data, start, False, False,
+                                             None, True, labeled)
+                for col, lbl in zip(self.varlist, self.lbllist):
+                    if col in values:
+                        labeled_data = _apply_value_labels(
+                            data[col], self.value_label_dict[lbl])
+                        values[col].append(np.asarray(
+                            Categorical.from_array(labeled_data).categories,
+                            dtype=object))
+
+        self._categories = dict(
+            (col, _label_categories(self.value_label_dict[lbl], values[col]))
+            for col, lbl in zip(self.varlist, self.lbllist) if col in values)
+        self._categories_missing = convert_missing
+
+    def _convert_records(self, data, start, convert_dates,
+                         convert_categoricals, index, preserve_dtypes,
+                         columns):
+        """ convert the records starting at observation start to a
+        DataFrame """
 
         if len(data)==0:
             data = DataFrame(columns=self.varlist, index=index)
@@ -1197,6 +1324,15 @@ class StataReader(StataParser):
             data = DataFrame.from_records(data, index=index)
             data.columns = self.varlist
 
+            # the chunks continue the numbering of the observations
+            if index is None and start:
+                data.index = np.arange(start, start + len(data))
+
+        dtyplist = self.dtyplist
+        typlist = self.typlist
+        fmtlist = self.fmtlist
+        lbllist = self.lbllist
+
         if columns is not None:
             column_set = set(columns)
             if len(column_set) != len(columns):
@@ -1221,28 +1357,24 @@ class StataReader(StataParser):
                     lbllist.append(self.lbllist[i])
 
             data = data[columns]
-            self.dtyplist = dtyplist
-            self.typlist = typlist
-            self.fmtlist = fmtlist
-            self.lbllist = lbllist
 
-        for col, typ in zip(data, self.typlist):
+        for col, typ in zip(data, typlist):
             if type(typ) is int:
                 data[col] = data[col].apply(self._null_terminate, convert_dtype=True,)
 
-        cols_ = np.where(self.dtyplist)[0]
+        cols_ = np.where(dtyplist)[0]
 
         # Convert columns (if needed) to match input type
         index = data.index
         requires_type_conversion = False
         data_formatted = []
         for i in cols_:
-            if self.dtyplist[i] is not None:
+            if dtyplist[i] is not None:
                 col = data.columns[i]
                 dtype = data[col].dtype
-                if (dtype != np.dtype(object)) and (dtype != self.dtyplist[i]):
+                if (dtype != np.dtype(object)) and (dtype != dtyplist[i]):
                     requires_type_conversion = True
-                    data_formatted.append((col, Series(data[col], index, self.dtyplist[i])))
+                    data_formatted.append((col, Series(data[col], index, dtyplist[i])))
                 else:
                     data_formatted.append((col, data[col]))
         if requires_type_conversion:
@@ -1251,7 +1383,7 @@ class StataReader(StataParser):
 
         # Check for missing values, and replace if found
         for i, colname in enumerate(data):
-            fmt = self.typlist[i]
+            fmt = typlist[i]
             if fmt not in self.VALID_RANGE:
                 continue
 
@@ -1283,24 +1415,28 @@ class StataReader(StataParser):
 
         if convert_dates:
             cols = np.where(lmap(lambda x: x in _date_formats,
-                                 self.fmtlist))[0]
+                                 fmtlist))[0]
             for i in cols:
                 col = data.columns[i]
-                data[col] = _stata_elapsed_date_to_datetime_vec(data[col], self.fmtlist[i])
+                data[col] = _stata_elapsed_date_to_datetime_vec(data[col], fmtlist[i])
 
         if convert_categoricals:
             cols = np.where(
                 lmap(lambda x: x in compat.iterkeys(self.value_label_dict),
-                     self.lbllist)
+                     lbllist)
             )[0]
             for i in cols:
                 col = data.columns[i]
-                labeled_data = np.copy(data[col])
-                labeled_data = labeled_data.astype(object)
-                for k, v in compat.iteritems(
-                        self.value_label_dict[self.lbllist[i]]):
-                    labeled_data[(data[col] == k).values] = v
-                data[col] = Categorical.from_array(labeled_data)
+                value_labels = self.value_label_dict[lbllist[i]]
+                labeled_data = _apply_value_labels(data[col], value_labels)
+
+                # a chunk uses the categories of the whole file, so that all
+                # the chunks have the categorical dtype of data()
+                categories = self._categories.get(col)
+                if categories is None:
+                    categories = _label_categories(value_labels,
+                                                   [labeled_data])
+                data[col] = Categorical(labeled_data, categories=categories)
 
         if not preserve_dtypes:
             retyped_data = []
@@ -1355,6 +1491,28 @@ def _set_endianness(endianness):
         raise ValueError("Endianness %s not understood" % endianness)
 
 
+# size of the record buffer used by StataWriter
+_WRITE_CHUNK_BYTES = 1 << 22
+
+# size of the record buffer used to find the categories of a chunked read
+_SCAN_CHUNK_BYTES = 1 << 22
+
+
+def _apply_value_labels(series, value_labels):
+    """ the values of series with their labels substituted """
+    labeled_data = np.copy(series).astype(object)
+    for k, v in compat.iteritems(value_labels):
+        labeled_data[(series == k).values] = v
+    return labeled_data
+
+
+def _label_categories(value_labels, values):
+    """ the categories of a labeled column: all of its labels, and the
+    unlabeled values among values """
+    labels = np.array(list(compat.itervalues(value_labels)), dtype=object)
+    return Categorical.from_array(np.concatenate([labels] + values)).categories
+
+
 def _pad_bytes(name, length):
     """
     Takes a char string and pads it wih null bytes until it's length chars
@@ -1497,6 +1655,9 @@ class StataWriter(StataParser):
         case the current time is used.
     dataset_label : str
         A label for the data set.  Should be 80 characters or smaller.
+    chunksize : int, default None
+        Number of rows converted and written at a time. The default uses
+        chunks of about 4MB.
 
     Returns
     -------
@@ -1519,9 +1680,10 @@ class StataWriter(StataParser):
     """
     def __init__(self, fname, data, convert_dates=None, write_index=True,
                  encoding="latin-1", byteorder=None, time_stamp=None,
-                 data_label=None):
+                 data_label=None, chunksize=None):
         super(StataWriter, self).__init__(encoding)
         self._convert_dates = convert_dates
+        self._chunksize = chunksize
         self._write_index = write_index
         self._time_stamp = time_stamp
         self._data_label = data_label
@@ -1722,7 +1884,6 @@ class StataWriter(StataParser):
         self._write_variable_labels()
         # write 5 zeros for expansion fields
         self._write(_pad_bytes("", 5))
-        self._prepare_data()
         self._write_data()
         self._write_value_labels()
         self._file.close()
@@ -1802,43 +1963,67 @@ class StataWriter(StataParser):
             for i in range(nvar):
                 self._write(_pad_bytes("", 81))
 
-    def _prepare_data(self):
-        data = self.data.copy()
-        typlist = self.typlist
-        convert_dates = self._convert_dates
-        # 1. Convert dates
-        if self._convert_dates is not None:
-            for i, col in enumerate(data):
-                if i in convert_dates:
-                    data[col] = _datetime_to_stata_elapsed_vec(data[col],
-                                                               self.fmtlist[i])
-
-        # 2. Convert bad string data to '' and pad to correct length
+    def _record_dtype(self):
+        """ the numpy dtype of a data record, in the byteorder of the file """
+        convert_dates = self._convert_dates or {}
         dtype = []
-        data_cols = []
-        has_strings = False
-        for i, col in enumerate(data):
-            typ = ord(typlist[i])
+        for i, col in enumerate(self.data):
+            typ = ord(self.typlist[i])
             if typ <= 244:
-                has_strings = True
-                data[col] = data[col].fillna('').apply(_pad_bytes, args=(typ,))
-                stype = 'S%d' % typ
-                dtype.append(('c'+str(i), stype))
-                string = data[col].str.encode(self._encoding)
-                data_cols.append(string.values.astype(stype))
+                dtype.append(('c' + str(i), 'S%d' % typ))
             else:
-                dtype.append(('c'+str(i), data[col].dtype))
-                data_cols.append(data[col].values)
-        dtype = np.dtype(dtype)
-
-        if has_strings:
-            self.data = np.fromiter(zip(*data_cols), dtype=dtype)
-        else:
-            self.data = data.to_records(index=False)
+                if i in convert_dates:
+                    col_dtype = np.dtype(np.float64)
+                else:
+                    col_dtype = self.data[col].dtype
+                dtype.append(('c' + str(i),
+                              col_dtype.newbyteorder(self._byteorder)))
+        return np.dtype(dtype)
+
+    def _encode_strings(self, values):
+        """ encode an object array of strings, missing values are written as
+        empty strings """
+        mask = isnull(values)
+        if mask.any():
+            values = values.copy()
+            values[mask] = ''
+        return np.char.encode(values.astype(text_type),
+                              self._encoding or self._default_encoding)
 
     def _write_data(self):
+        """
+        Writes the records in chunks of rows. Each chunk is filled column by
+        column into a preallocated record buffer, so the memory used is
+        bounded by the chunksize.
+        """
         data = self.data
-        data.tofile(self._file)
+        nobs = self.nobs
+        convert_dates = self._convert_dates or {}
+        dtype = self._record_dtype()
+
+        chunksize = self._chunksize
+        if chunksize is None:
+            chunksize = max(_WRITE_CHUNK_BYTES // max(dtype.itemsize, 1), 1)
+        chunksize = min(chunksize, nobs)
+        if chunksize <= 0:
+            return
+        buf = np.empty(chunksize, dtype=dtype)
+
+        for start in range(0, nobs, chunksize):
+            stop = min(start + chunksize, nobs)
+            chunk = buf[:stop - start]
+            for i, col in enumerate(data):
+                name = 'c' + str(i)
+                series = data[col]
+                if i in convert_dates:
+                    chunk[name] = _datetime_to_stata_elapsed_vec(
+                        series.iloc[start:stop], self.fmtlist[i])
+                elif ord(self.typlist[i]) <= 244:
+                    chunk[name] = self._encode_strings(
+                        series.values[start:stop])
+                else:
+                    chunk[name] = series.values[start:stop]
+            chunk.tofile(self._file)
 
     def _null_terminate(self, s, as_string=False):
         null_byte = '\x00'
@@ -0,0 +1,115 @@
+import nose
+
+import numpy as np
+
+from pandas.compat import u
+from pandas import (DataFrame, MultiIndex, Categorical, date_range,
+                    period_range, Timestamp)
+import pandas.util.testing as tm
+from pandas.util.testing import ensure_clean
+
+from pandas.io.blockfile import to_blockfile, read_blockfile
+import pandas.io.blockfile as blockfile
+
+nan = np.nan
+
+_multiprocess_can_split_ = False
+
+
+class TestBlockFile(tm.TestCase):
+
+    def setUp(self):
+        self.path = '__%s__.blk' % tm.rands(10)
+
+    def round_trip(self, df, **kwargs):
+        with ensure_clean(self.path) as path:
+            df.to_blockfile(path)
+
+            # the values are mapped, read them while the file exists
+            return read_blockfile(path, **kwargs).copy()
+
+    def test_round_trip(self):
+        df = DataFrame({'float': np.random.randn(10),
+                        'int': np.arange(10),
+                        'bool': np.arange(10) % 2 == 0,
+                        'complex': np.arange(10) * (1 + 2j),
+                        'date': date_range('20130101', periods=10),
+                        'delta': np.arange(10).astype('m8[s]'),
+                        'str': ['a', 'b', nan, u('\u00e9'), 'd'] * 2,
+                        'cat': Categorical(['a', 'b'] * 5)},
+                       index=date_range('20140101', periods=10,
+                                        tz='US/Eastern', name='when'),
+                       columns=['float', 'int', 'bool', 'complex', 'date',
+                                'delta', 'str', 'cat'])
+
+        for mmap_mode in [None, 'r', 'c']:
+            result = self.round_trip(df, mmap_mode=mmap_mode)
+            tm.assert_frame_equal(result, df)
+
+    def test_memmap_blocks(self):
+        df = DataFrame(np.random.randn(100, 3), columns=list('abc'))
+        df['s'] = 'foo'
+
+        with ensure_clean(self.path) as path:
+            df.to_blockfile(path)
+
+            result = read_blockfile(path)
+            for block in result._data.blocks:
+                if block.is_numeric:
+                    self.assertIsInstance(block.values, np.memmap)
+                    self.assertEqual(block.values.offset %
+                                     blockfile._ALIGNMENT, 0)
+                else:
+                    self.assertNotIsInstance(block.values, np.memmap)
+            tm.assert_frame_equal(result, df)
+
+            # copy-on-write leaves the file alone
+            result.iloc[0, 0] = 100.
+            tm.assert_frame_equal(read_blockfile(path), df)
+
+            result = read_blockfile(path, mmap_mode=None)
+            for block in result._data.blocks:
+                self.assertNotIsInstance(block.values, np.memmap)
+            del result
+
+    def test_axes(self):
+        index = MultiIndex.from_tuples([('a', 1), ('a', 2), ('b', 1)],
+                                       names=['first', 'second'])
+        df = DataFrame(np.random.randn(3, 2), index=index,
+                       columns=period_range('2000-01', periods=2, freq='M'))
+        result = self.round_trip(df)
+        tm.assert_frame_equal(result, df)
+
+        df = DataFrame(np.random.randn(3, 2), index=[1.5, 2.5, 3.5],
+                       columns=[('a', 1), ('b', 2)])
+        df.index.name = ('x', 'y')
+        result = self.round_trip(df)
+        tm.assert_frame_equal(result, df)
+        self.assertEqual(result.index.name, ('x', 'y'))
+
+    def test_empty(self):
+        for df in [DataFrame(), DataFrame(columns=list('ab')),
+                   DataFrame(index=list('ab'))]:
+            result = self.round_trip(df)
+            tm.assert_frame_equal(result, df)
+
+    def test_unsupported(self):
+        df = DataFrame({'a': [1, 'b', Timestamp('20130101')]})
+        with ensure_clean(self.path) as path:
+            self.assertRaises(TypeError, df.to_blockfile, path)
+            self.assertRaises(TypeError, to_blockfile, df['a'], path)
+
+    def test_not_a_blockfile(self):
+        with ensure_clean(self.path) as path:
+            with open(path, 'wb') as fh:
+                fh.write(b'not a blockfile at all')
+            self.assertRaises(ValueError, read_blockfile, path)
+
+            DataFrame({'a': [1, 2]}).to_blockfile(path)
+            self.assertRaises(ValueError, read_blockfile, path,
+                              mmap_mode='w')
+
+
+if __name__ == '__main__':
+    nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
+                   exit=False)
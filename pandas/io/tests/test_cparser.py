@@ -299,6 +299,34 @@ a,b,c
         self.assertTrue((result[1] == exp[1]).all())
         self.assertTrue((result[2] == exp[2]).all())
 
+    def test_usecols_skipped_fields(self):
+        # fields outside of usecols are not stored by the tokenizer
+        data = ('a,b,c,d\n'
+                '1,foo,2,bar\n'
+                '3,baz,4,qux\n'
+                '5,,6\n'
+                '7,spam,8,eggs')
+
+        reader = TextReader(StringIO(data), delimiter=',', usecols=(0, 2),
+                            low_memory=True, buffer_lines=2)
+        result = reader.read()
+        self.assertEqual(sorted(result), [0, 2])
+        self.assert_numpy_array_equal(result[0], [1, 3, 5, 7])
+        self.assert_numpy_array_equal(result[2], [2, 4, 6, 8])
+
+        # bad lines are still detected on the full row
+        data = ('a,b,c\n'
+                '1,2,3\n'
+                '4,5,6,7\n'
+                '8,9,10')
+        reader = TextReader(StringIO(data), delimiter=',', usecols=(0,))
+        self.assertRaises(parser.CParserError, reader.read)
+
+        reader = TextReader(StringIO(data), delimiter=',', usecols=(0,),
+                            error_bad_lines=False, warn_bad_lines=False)
+        result = reader.read()
+        self.assert_numpy_array_equal(result[0], [1, 8])
+
     def test_cr_delimited(self):
         def _test(text, **kwargs):
             nice_text = text.replace('\r', '\r\n')
@@ -336,6 +364,28 @@ a,b,c
                     2: np.array(['3', ''], dtype=object)}
         assert_array_dicts_equal(result, expected)
 
+    def test_byte_range(self):
+        data = b'a,b\n1,2\n3,4\n5,6\n'
+
+        with tm.ensure_clean() as path:
+            with open(path, 'wb') as f:
+                f.write(data)
+
+            for memory_map in [False, True]:
+                reader = TextReader(path, delimiter=',', header=None,
+                                    byte_range=(8, 16),
+                                    memory_map=memory_map)
+                result = reader.read()
+                expected = {0: np.array([3, 5]),
+                            1: np.array([4, 6])}
+                assert_array_dicts_equal(result, expected)
+
+            self.assertRaises(IOError, TextReader, path, header=None,
+                              byte_range=(8, 4))
+
+        self.assertRaises(ValueError, TextReader, StringIO(data.decode()),
+                          byte_range=(0, 4))
+
 
 def assert_array_dicts_equal(left, right):
     for k, v in compat.iteritems(left):
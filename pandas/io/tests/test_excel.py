@@ -18,7 +18,7 @@ from pandas import DataFrame, Index, MultiIndex
 from pandas.io.parsers import read_csv
 from pandas.io.excel import (
     ExcelFile, ExcelWriter, read_excel, _XlwtWriter, _Openpyxl1Writer,
-    _Openpyxl2Writer, register_writer, _XlsxWriter
+    _Openpyxl2Writer, register_writer, _XlsxWriter, get_writer
 )
 from pandas.io.common import URLError
 from pandas.util.testing import ensure_clean
@@ -402,36 +402,20 @@ class ExcelReaderTests(SharedItems, tm.TestCase):
     def test_reader_seconds(self):
         # Test reading times with and without milliseconds. GH5945.
         _skip_if_no_xlrd()
-        import xlrd
 
-        if LooseVersion(xlrd.__VERSION__) >= LooseVersion("0.9.3"):
-            # Xlrd >= 0.9.3 can handle Excel milliseconds.
-            expected = DataFrame.from_items([("Time",
-                                              [time(1, 2, 3),
-                                               time(2, 45, 56, 100000),
-                                               time(4, 29, 49, 200000),
-                                               time(6, 13, 42, 300000),
-                                               time(7, 57, 35, 400000),
-                                               time(9, 41, 28, 500000),
-                                               time(11, 25, 21, 600000),
-                                               time(13, 9, 14, 700000),
-                                               time(14, 53, 7, 800000),
-                                               time(16, 37, 0, 900000),
-                                               time(18, 20, 54)])])
-        else:
-            # Xlrd < 0.9.3 rounds Excel milliseconds.
-            expected = DataFrame.from_items([("Time",
-                                              [time(1, 2, 3),
-                                               time(2, 45, 56),
-                                               time(4, 29, 49),
-                                               time(6, 13, 42),
-                                               time(7, 57, 35),
-                                               time(9, 41, 29),
-                                               time(11, 25, 22),
-                                               time(13, 9, 15),
-                                               time(14, 53, 8),
-                                               time(16, 37, 1),
-                                               time(18, 20, 54)])])
+        # Excel milliseconds are kept, whatever the xlrd version
+        expected = DataFrame.from_items([("Time",
+                                          [time(1, 2, 3),
+                                           time(2, 45, 56, 100000),
+                                           time(4, 29, 49, 200000),
+                                           time(6, 13, 42, 300000),
+                                           time(7, 57, 35, 400000),
+                                           time(9, 41, 28, 500000),
+                                           time(11, 25, 21, 600000),
+                                           time(13, 9, 14, 700000),
+                                           time(14, 53, 7, 800000),
+                                           time(16, 37, 0, 900000),
+                                           time(18, 20, 54)])])
 
         epoch_1900 = os.path.join(self.dirpath, 'times_1900.xls')
         epoch_1904 = os.path.join(self.dirpath, 'times_1904.xls')
@@ -442,6 +426,23 @@ class ExcelReaderTests(SharedItems, tm.TestCase):
         actual = read_excel(epoch_1904, 'Sheet1')
         tm.assert_frame_equal(actual, expected)
 
+    def test_xldates_to_datetime(self):
+        _skip_if_no_xlrd()
+        from xlrd import xldate
+        from pandas.io.excel import _xldates_to_datetime
+
+        values = np.array([0.25, 0.5, 1.0, 59.5, 61.0, 1000.75, 41000.123456,
+                           42000.9999999], dtype=object)
+        for epoch1904 in [0, 1]:
+            expected = []
+            for value in values:
+                value = xldate.xldate_as_datetime(value, epoch1904)
+                if value.date() in (date(1899, 12, 31), date(1904, 1, 1)):
+                    value = value.time()
+                expected.append(value)
+            result = _xldates_to_datetime(values, epoch1904)
+            self.assertEqual(list(result), expected)
+
 
 class ExcelWriterBase(SharedItems):
     # Base class for test cases to run with different Excel writers.
@@ -1126,6 +1127,51 @@ class ExcelWriterBase(SharedItems):
             tm.assert_series_equal(write_frame['A'], read_frame['A'])
             tm.assert_series_equal(write_frame['B'], read_frame['B'])
 
+    def test_to_excel_streaming(self):
+        _skip_if_no_xlrd()
+        from pandas.core.format import ExcelFormatter
+
+        frame = self.frame.copy()
+        arrays = [np.arange(len(frame.index)) // 3,
+                  np.arange(len(frame.index))]
+        frame.index = MultiIndex.from_arrays(arrays,
+                                             names=['first', 'second'])
+
+        # the same cells, in row order
+        formatter = ExcelFormatter(frame, merge_cells=self.merge_cells)
+        cells = list(formatter.get_formatted_cells())
+        formatter = ExcelFormatter(frame, merge_cells=self.merge_cells)
+        row_cells = list(formatter.get_formatted_cells(row_major=True))
+        rows = [cell.row for cell in row_cells]
+        self.assertEqual(rows, sorted(rows))
+        key = lambda cell: (cell.row, cell.col)
+        self.assertEqual([(c.row, c.col, c.val) for c in sorted(cells, key=key)],
+                         [(c.row, c.col, c.val)
+                          for c in sorted(row_cells, key=key)])
+
+        with ensure_clean(self.ext) as path:
+            if not get_writer(self.engine_name).supports_streaming:
+                self.assertRaises(ValueError, ExcelWriter, path,
+                                  engine=self.engine_name, streaming=True)
+                return
+
+            with ExcelWriter(path, engine=self.engine_name,
+                             streaming=True) as writer:
+                self.frame.to_excel(writer, 'test1')
+                frame.to_excel(writer, 'test2', merge_cells=self.merge_cells)
+
+                # the rows that were written can't be written again
+                self.assertRaises(ValueError, self.frame.to_excel, writer,
+                                  'test1')
+
+            reader = ExcelFile(path)
+            recons = reader.parse('test1', index_col=0)
+            tm.assert_frame_equal(self.frame, recons)
+            recons = reader.parse('test2', index_col=[0, 1],
+                                  parse_dates=False,
+                                  has_index_names=self.merge_cells)
+            tm.assert_frame_equal(frame, recons)
+
 
 def raise_wrapper(major_ver):
     def versioned_raise_wrapper(orig_method):
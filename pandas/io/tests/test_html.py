@@ -720,6 +720,46 @@ class TestReadHtmlLxml(tm.TestCase, ReadHtmlMixin):
         with tm.assert_produces_warning(FutureWarning):
             self.read_html(data, infer_types=False, header=[0, 1])
 
+    def test_iterparse_same_as_tree(self):
+        from pandas.io.html import _HtmlFrameParser, _LxmlFrameParser
+
+        filename = os.path.join(DATA_PATH, 'valid_markup.html')
+        df = mkdf(200, 4, data_gen_f=lambda r, c: '%d,%03d' % (r, c))
+        html = df.to_html()
+        minified = re.sub(r'>\s+<', '><', html)
+        tail = ('<table><tbody><tr><td>a</td></tr>x<tr><td>b</td></tr>'
+                '<tr><td>c</td></tr></tbody></table>')
+        for io in [filename, html, html.encode('utf-8'),
+                   BytesIO(html.encode('utf-8')), minified, tail]:
+            for match in ['.+', 'R_l0_g1', 'R_l0_g199', '^a$', '^x$', '']:
+                try:
+                    tree = list(_HtmlFrameParser.parse_tables(
+                        _LxmlFrameParser(io, re.compile(match), {}, None)))
+                except ValueError:
+                    tree = None
+                if hasattr(io, 'seek'):
+                    io.seek(0)
+                try:
+                    streamed = _LxmlFrameParser(io, re.compile(match), {},
+                                                None)._iterparse_tables()
+                except ValueError:
+                    streamed = None
+                if hasattr(io, 'seek'):
+                    io.seek(0)
+                self.assertEqual(streamed, tree)
+
+    def test_iterparse_nested_tables(self):
+        from pandas.io.html import _LxmlFrameParser, _StreamingNotSupported
+
+        html = ('<table><tr><td>a</td><td><table><tr><td>b</td></tr>'
+                '</table></td></tr><tr><td>c</td><td>d</td></tr></table>')
+        parser = _LxmlFrameParser(html, re.compile('.+'), {}, None)
+        self.assertRaises(_StreamingNotSupported, parser._iterparse_tables)
+
+        # falls back on the tree parser
+        dfs = self.read_html(html)
+        self.assertEqual(len(dfs), 2)
+
 
 def test_invalid_flavor():
     url = 'google.com'
@@ -1,5 +1,5 @@
 # pylint: disable-msg=W0612,E1101
-from pandas.compat import range, lrange, StringIO
+from pandas.compat import range, lrange, StringIO, BytesIO, u
 from pandas import compat
 import os
 
@@ -627,3 +627,39 @@ class TestPandasContainer(tm.TestCase):
             raise TypeError("raisin")
         self.assertRaises(TypeError, frame.to_json,
                           default_handler=my_handler_raises)
+
+    def test_lines(self):
+        df = DataFrame({'a': [1, 2, 3, 4], 'b': ['x', 'y,"z"', None, 'w\n']})
+        result = df.to_json(lines=True)
+        expected = ('{"a":1,"b":"x"}\n{"a":2,"b":"y,\\"z\\""}\n'
+                    '{"a":3,"b":null}\n{"a":4,"b":"w\\n"}\n')
+        self.assertEqual(result, expected)
+        self.assertRaises(ValueError, df.to_json, orient='split', lines=True)
+
+        assert_frame_equal(read_json(result, lines=True), df)
+
+        # blank lines are ignored, chunks continue the row numbering
+        reader = read_json(StringIO(result + '\n'), lines=True, chunksize=3)
+        chunks = list(reader)
+        self.assertEqual([len(c) for c in chunks], [3, 1])
+        assert_frame_equal(pd.concat(chunks), df)
+
+        # bytes lines are decoded before being joined
+        df2 = DataFrame({'a': [1, 2], 'b': [u('\u00e9t\u00e9'), 'x']})
+        data = df2.to_json(lines=True).encode('utf-8')
+        assert_frame_equal(read_json(BytesIO(data), lines=True), df2)
+        reader = read_json(BytesIO(data), lines=True, chunksize=1)
+        assert_frame_equal(pd.concat(list(reader)), df2)
+
+        with ensure_clean('test.json') as path:
+            df.to_json(path, lines=True)
+            assert_frame_equal(read_json(path, lines=True), df)
+            reader = read_json(path, lines=True, chunksize=1)
+            assert_frame_equal(reader.get_chunk(), df.iloc[:1])
+            assert_frame_equal(reader.read(), df.iloc[1:])
+
+        s = Series([1.5, 2.5, np.nan], name='s')
+        assert_series_equal(read_json(s.to_json(lines=True), typ='series',
+                                      lines=True), s, check_names=False)
+
+        self.assertRaises(ValueError, read_json, result, chunksize=2)
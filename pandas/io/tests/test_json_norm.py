@@ -163,6 +163,23 @@ class TestJSONNormalize(tm.TestCase):
 
         tm.assert_frame_equal(result, expected)
 
+    def test_nested_missing_keys(self):
+        data = [{'a': 1, 'b': {'c': 2.5, 'd': {'e': 'x'}}},
+                {'a': 2, 'f': 'y'},
+                {'a': 3, 'b': {'c': 3.5}}]
+
+        result = json_normalize(data)
+        expected = DataFrame(nested_to_record(data))
+        tm.assert_frame_equal(result, expected)
+
+        data = [{'id': 1, 'recs': [{'a': 1}, {'a': 2, 'b': 'x'}]},
+                {'id': 2, 'recs': [{'b': 'y'}]}]
+        result = json_normalize(data, 'recs', meta='id')
+        expected = DataFrame({'a': [1, 2, np.nan], 'b': [np.nan, 'x', 'y'],
+                              'id': [1, 1, 2]},
+                             columns=['a', 'b', 'id'])
+        tm.assert_frame_equal(result, expected)
+
 
 class TestNestedToRecord(tm.TestCase):
 
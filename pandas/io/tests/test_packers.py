@@ -1,6 +1,7 @@
 import nose
 
 import datetime
+import mmap
 import numpy as np
 import sys
 from distutils.version import LooseVersion
@@ -23,6 +24,7 @@ from pandas import Timestamp, tslib
 nan = np.nan
 
 from pandas.io.packers import to_msgpack, read_msgpack
+import pandas.io.packers as packers
 
 _multiprocess_can_split_ = False
 
@@ -373,6 +375,91 @@ class TestNDFrame(TestPackers):
             for i, packed in enumerate(read_msgpack(path, iterator=True)):
                 check_arbitrary(packed, l[i])
 
+    def test_mmap(self):
+
+        def is_mapped(values):
+            while values is not None:
+                if isinstance(values, mmap.mmap):
+                    return True
+                values = values.base
+            return False
+
+        def is_aligned(values):
+            address = values.__array_interface__['data'][0]
+            return address % packers._RAW_VIEW_ALIGNMENT == 0
+
+        l = [self.frame['float'], self.frame['mixed'], self.frame['int'].A,
+             np.arange(10.).reshape(2, 5), None]
+
+        with ensure_clean(self.path) as path:
+            to_msgpack(path, *l, mmap=True)
+
+            for read_only in [False, True]:
+                result = read_msgpack(path, mmap=True, read_only=read_only)
+                check_arbitrary(result[:3], l[:3])
+                tm.assert_numpy_array_equal(result[3], l[3])
+                self.assertTrue(result[4] is None)
+
+                for blk in result[1]._data.blocks:
+                    self.assertEqual(is_mapped(blk.values), not blk.is_object)
+                    if not blk.is_object:
+                        self.assertEqual(blk.values.flags.writeable,
+                                         not read_only)
+                        self.assertTrue(is_aligned(blk.values))
+                self.assertTrue(is_mapped(result[2].values))
+                self.assertTrue(is_aligned(result[2].values))
+
+            # copy-on-write: the file is not modified
+            result = read_msgpack(path, mmap=True)
+            result[0].iloc[0, 0] = 100.
+            assert_frame_equal(read_msgpack(path), self.frame['float'])
+
+            # read without mapping
+            result = read_msgpack(path)
+            check_arbitrary(result[:3], l[:3])
+            tm.assert_numpy_array_equal(result[3], l[3])
+
+            # a single object
+            to_msgpack(path, self.frame['float'], mmap=True)
+            result = read_msgpack(path, mmap=True)
+            assert_frame_equal(result, self.frame['float'])
+
+            # appended objects are aligned in the whole file
+            to_msgpack(path, self.frame['int'].A, mmap=True, append=True)
+            result = read_msgpack(path, mmap=True)
+            assert_frame_equal(result[0], self.frame['float'])
+            assert_series_equal(result[1], self.frame['int'].A)
+            for values in [result[0]._data.blocks[0].values, result[1].values]:
+                self.assertTrue(is_aligned(values))
+
+            # without mmap=True, or compressed, the data is read into memory
+            for kwargs in [{}, {'compress': 'zlib'}]:
+                to_msgpack(path, self.frame['float'], **kwargs)
+                result = read_msgpack(path, mmap=True)
+                assert_frame_equal(result, self.frame['float'])
+                self.assertFalse(is_mapped(result._data.blocks[0].values))
+
+            self.assertRaises(ValueError, to_msgpack, path,
+                              self.frame['float'], compress='zlib', mmap=True)
+
+    def test_mmap_format(self):
+        # the prefix of the mapped data is only written with mmap=True
+        df = self.frame['float']
+        self.assertFalse(packers._RAW_VIEW_PREFIX in to_msgpack(None, df))
+        self.assertTrue(packers._RAW_VIEW_PREFIX in
+                        to_msgpack(None, df, mmap=True))
+
+        # other values starting with the prefix are not turned into views
+        value = packers._RAW_VIEW_PREFIX.decode('latin1') + u('abc')
+        l = [value, {'a': value, value: 1}, [value, 1], df]
+        with ensure_clean(self.path) as path:
+            to_msgpack(path, *l, mmap=True)
+            result = read_msgpack(path, mmap=True)
+            self.assertEqual(result[0], value)
+            self.assertEqual(result[1], {'a': value, value: 1})
+            self.assertEqual(list(result[2]), [value, 1])
+            assert_frame_equal(result[3], df)
+
     def tests_datetimeindex_freq_issue(self):
 
         # GH 5947
@@ -385,6 +472,68 @@ class TestNDFrame(TestPackers):
         result = self.encode_decode(df)
         assert_frame_equal(result, df)
 
+class TestCompression(TestPackers):
+
+    def setUp(self):
+        super(TestCompression, self).setUp()
+        data = {
+            'A': np.arange(1000).astype(np.float64),
+            'B': np.arange(1000).astype(np.int32),
+            'C': list(100 * 'abcdefghij'),
+            'D': date_range('1/1/2009', periods=1000),
+        }
+        self.frame = {
+            'float': DataFrame(dict(A=data['A'], B=data['A'] + 1)),
+            'int': DataFrame(dict(A=data['B'], B=data['B'] + 1)),
+            'mixed': DataFrame(data),
+        }
+
+    def _check_compress(self, compress):
+        for n_jobs in [None, 3]:
+            for k, v in self.frame.items():
+                result = self.encode_decode(v, compress=compress,
+                                            n_jobs=n_jobs)
+                assert_frame_equal(result, v)
+
+        # many chunks per array, (de)compressed concurrently
+        chunk_size = packers._COMPRESS_CHUNK_SIZE
+        try:
+            packers._COMPRESS_CHUNK_SIZE = 100
+            for n_jobs in [None, 3]:
+                l = [self.frame['mixed'], self.frame['float'].A,
+                     np.arange(50.).reshape(5, 10)]
+                result = self.encode_decode(l, compress=compress,
+                                            n_jobs=n_jobs)
+                assert_frame_equal(result[0], l[0])
+                assert_series_equal(result[1], l[1])
+                tm.assert_numpy_array_equal(result[2], l[2])
+
+            # arrays are only split with n_jobs
+            values = np.arange(50.)
+            self.assertNotIsInstance(packers.convert(values, compress),
+                                     list)
+            pool = packers._get_pool(2)
+            try:
+                self.assertIsInstance(packers.convert(values, compress, pool),
+                                      list)
+            finally:
+                packers._close_pool(pool)
+        finally:
+            packers._COMPRESS_CHUNK_SIZE = chunk_size
+
+    def test_compression_zlib(self):
+        self._check_compress('zlib')
+
+    def test_compression_blosc(self):
+        if not packers._BLOSC:
+            raise nose.SkipTest('no blosc')
+        self._check_compress('blosc')
+
+    def test_compression_invalid(self):
+        self.assertRaises(ValueError, to_msgpack, None, self.frame['float'],
+                          compress='foo')
+
+
 class TestSparse(TestPackers):
 
     def _check_roundtrip(self, obj, comparator, **kwargs):
@@ -3,6 +3,7 @@
 
 from datetime import datetime
 import csv
+import gc
 import os
 import sys
 import re
@@ -23,6 +24,7 @@ from pandas.io.parsers import (read_csv, read_table, read_fwf,
                                TextFileReader, TextParser)
 
 import pandas.util.testing as tm
+import pandas.core.common as com
 import pandas as pd
 
 from pandas.compat import parse_date
@@ -934,6 +936,35 @@ c,4,5
                         'C': [2, 4, 5]}, idx)
         tm.assert_frame_equal(rs, xp)
 
+    def test_parse_dates_date_format(self):
+        data = """date,A
+2009-01-31 00:10:00,1
+2009-02-28 10:20:30.5,2
+,3
+2009-03-31T08:30:00,4
+"""
+        rs = self.read_csv(StringIO(data), parse_dates=['date'])
+        self.assertEqual(rs['date'].dtype, 'M8[ns]')
+        xp = Series([datetime(2009, 1, 31, 0, 10),
+                     datetime(2009, 2, 28, 10, 20, 30, 500000),
+                     np.nan, datetime(2009, 3, 31, 8, 30)], name='date')
+        tm.assert_series_equal(rs['date'], xp)
+
+        data = """date,A
+31/01/2009 00:10,1
+28/02/2009 10:20,2
+NaN,3
+"""
+        rs = self.read_csv(StringIO(data), parse_dates=[0],
+                           date_format='%d/%m/%Y %H:%M')
+        xp = Series([datetime(2009, 1, 31, 0, 10),
+                     datetime(2009, 2, 28, 10, 20), np.nan], name='date')
+        tm.assert_series_equal(rs['date'], xp)
+
+        rs = self.read_csv(StringIO(data), parse_dates=[0], index_col=0,
+                           date_format='%d/%m/%Y %H:%M')
+        self.assertTrue(rs.index.equals(DatetimeIndex(xp.values)))
+
     def test_yy_format(self):
         data = """date,time,B,C
 090131,0010,1,2
@@ -1174,6 +1205,53 @@ baz,7,8,9
         tm.assert_frame_equal(chunks[1], df[2:4])
         tm.assert_frame_equal(chunks[2], df[4:])
 
+    def test_read_chunksize_prefetch(self):
+        df = self.read_csv(StringIO(self.data1), index_col=0)
+
+        for prefetch in [1, 2**20]:
+            reader = self.read_csv(StringIO(self.data1), index_col=0,
+                                   chunksize=2, prefetch=prefetch)
+            chunks = list(reader)
+            self.assertEqual(len(chunks), 3)
+            tm.assert_frame_equal(chunks[0], df[:2])
+            tm.assert_frame_equal(chunks[1], df[2:4])
+            tm.assert_frame_equal(chunks[2], df[4:])
+
+            self.assertRaises(StopIteration, reader.get_chunk)
+
+        reader = self.read_csv(StringIO(self.data1), index_col=0,
+                               chunksize=2, prefetch=2**20)
+        tm.assert_frame_equal(reader.get_chunk(), df[:2])
+        self.assertRaises(ValueError, reader.get_chunk, 3)
+        self.assertRaises(ValueError, reader.read)
+
+        # closing the reader stops the prefetching thread
+        reader = self.read_csv(StringIO(self.data1), index_col=0,
+                               chunksize=2, prefetch=1)
+        tm.assert_frame_equal(reader.get_chunk(), df[:2])
+        thread = reader._prefetcher._thread
+        reader.close()
+        self.assertFalse(thread.is_alive())
+        self.assertRaises(ValueError, reader.get_chunk)
+
+        # and so does dropping it
+        reader = self.read_csv(StringIO(self.data1), index_col=0,
+                               chunksize=2, prefetch=1)
+        tm.assert_frame_equal(reader.get_chunk(), df[:2])
+        thread = reader._prefetcher._thread
+        del reader
+        gc.collect()
+        thread.join(10)
+        self.assertFalse(thread.is_alive())
+
+    def test_chunk_nbytes(self):
+        # the objects of object columns are counted
+        df = DataFrame({'a': ['x' * 1000 + str(i) for i in range(100)],
+                        'b': np.arange(100.)})
+        self.assertTrue(parsers._chunk_nbytes(df) > 100 * 1000)
+        self.assertTrue(parsers._chunk_nbytes(df['a']) > 100 * 1000)
+        self.assertEqual(parsers._chunk_nbytes(df[['b']]), 800)
+
     def test_read_chunksize_named(self):
         reader = self.read_csv(
             StringIO(self.data1), index_col='index', chunksize=2)
@@ -2393,6 +2471,33 @@ c   1   2   3   4
         with tm.assertRaisesRegexp(ValueError, "Must specify either"):
             read_fwf(StringIO(data3), colspecs=None, widths=None)
 
+    def test_fwf_engines(self):
+        data = """\
+A     B     C
+1     foo   2.5
+2           3.5
+# a comment
+3     bar   NA
+4     baz   5.5 # trailing
+"""
+        widths = [6, 6, 5]
+
+        for kwds in [{}, {'usecols': ['A', 'C']}, {'skiprows': [2]},
+                     {'names': ['x', 'y', 'z'], 'header': None}]:
+            expected = read_fwf(StringIO(data), widths=widths,
+                                comment='#', engine='python', **kwds)
+            result = read_fwf(StringIO(data), widths=widths, comment='#',
+                              engine='c', **kwds)
+            tm.assert_frame_equal(result, expected)
+
+        expected = read_fwf(StringIO(data), widths=widths, comment='#')
+        reader = read_fwf(StringIO(data), widths=widths, comment='#',
+                          chunksize=2)
+        tm.assert_frame_equal(pd.concat(list(reader)), expected)
+
+        with tm.assertRaisesRegexp(ValueError, 'negative colspecs'):
+            read_fwf(StringIO(data), colspecs=[(0, 6), (6, -1)], engine='c')
+
     def test_fwf_colspecs_is_list_or_tuple(self):
         with tm.assertRaisesRegexp(TypeError,
                                    'column specifications must be a list or '
@@ -3184,6 +3289,28 @@ class TestCParserLowMemory(ParserTests, tm.TestCase):
         kwds['buffer_lines'] = 2
         return read_table(*args, **kwds)
 
+    def test_parse_dates_later_chunk(self):
+        # the tokenizer only fails to convert the dates of a later chunk
+        data = ('date,A\n2009-01-01,1\n2009-01-02,2\n2009-01-03,3\n'
+                'Jan 4 2009,4\n2009-01-05,5\n')
+        rs = self.read_csv(StringIO(data), parse_dates=['date'])
+        xp = Series(date_range('20090101', periods=5), name='date')
+        tm.assert_series_equal(rs['date'], xp)
+
+        # the column is converted as a whole, as in a single chunk
+        for data in ['date,A\n04/01/2009,1\n05/01/2009,2\n06/01/2009,3\n'
+                     'foo,4\n',
+                     'date,A\n04/01/2009,1\nfoo,2\n06/01/2009,3\n'
+                     '07/01/2009,4\n',
+                     'date,A\n04/01/2009,1\n,2\n06/01/2009,3\n']:
+            with tm.assert_produces_warning(None):
+                rs = self.read_csv(StringIO(data), parse_dates=['date'],
+                                   date_format='%d/%m/%Y')
+            xp = read_csv(StringIO(data), parse_dates=['date'],
+                          date_format='%d/%m/%Y', engine='c',
+                          low_memory=False)
+            tm.assert_frame_equal(rs, xp)
+
     def test_compact_ints(self):
         data = ('0,1,0,0\n'
                 '1,1,0,0\n'
@@ -3232,6 +3359,29 @@ one,two
         self.assertEqual(result['one'].dtype, 'u1')
         self.assertEqual(result['two'].dtype, 'S1')
 
+    def test_pass_dtype_as_category(self):
+        # categories of the chunks are merged
+        data = """\
+sym,px
+XOM,1.5
+AAPL,2.5
+,3.5
+XOM,4.5
+MSFT,5.5
+AAPL,6.5"""
+
+        result = self.read_csv(StringIO(data), dtype={'sym': 'category'})
+        self.assertTrue(com.is_categorical_dtype(result['sym']))
+
+        expected = self.read_csv(StringIO(data))
+        expected['sym'] = expected['sym'].astype('category')
+        tm.assert_frame_equal(result, expected)
+
+        result = self.read_csv(StringIO(data), dtype='category')
+        self.assert_numpy_array_equal(result['px'].cat.categories,
+                                      ['1.5', '2.5', '3.5', '4.5', '5.5',
+                                       '6.5'])
+
     def test_usecols_dtypes(self):
         data = """\
 1,2,3
@@ -3311,6 +3461,21 @@ one,two
             result = self.read_csv(open(path, 'rb'), compression='gzip')
             tm.assert_frame_equal(result, expected)
 
+            # a truncated file is an error, not a shorter frame
+            with open(path, 'rb') as f:
+                compressed = f.read()
+            with open(path, 'wb') as f:
+                f.write(compressed[:len(compressed) // 2])
+            self.assertRaises(Exception, self.read_csv, path,
+                              compression='gzip')
+
+        with tm.ensure_clean() as path:
+            # so is a file which is not gzipped
+            with open(path, 'wb') as f:
+                f.write(data)
+            self.assertRaises(IOError, self.read_csv, path,
+                              compression='gzip')
+
         with tm.ensure_clean() as path:
             tmp = bz2.BZ2File(path, mode='wb')
             tmp.write(data)
@@ -3325,6 +3490,24 @@ one,two
             self.assertRaises(ValueError, self.read_csv,
                               path, compression='bz3')
 
+    def test_decompression_concatenated(self):
+        import gzip
+
+        data = open(self.csv1, 'rb').read()
+        body = data.split(b'\n', 1)[1]
+        expected = self.read_csv(self.csv1)
+        expected = pd.concat([expected] * 3, ignore_index=True)
+
+        with tm.ensure_clean() as path:
+            # multi-member gzip file
+            for i, part in enumerate([data, body, body]):
+                tmp = gzip.GzipFile(path, mode='wb' if i == 0 else 'ab')
+                tmp.write(part if part.endswith(b'\n') else part + b'\n')
+                tmp.close()
+
+            result = self.read_csv(path, compression='gzip')
+            tm.assert_frame_equal(result, expected)
+
     def test_decompression_regex_sep(self):
         try:
             import gzip
@@ -3367,6 +3550,120 @@ one,two
         # it works!
         result = self.read_csv(self.csv1, memory_map=True)
 
+    def test_parallel_tokenization(self):
+        n = 200000
+        df = DataFrame({'a': np.arange(n),
+                        'b': np.random.randn(n),
+                        'c': ['x y' if i % 7 == 0 else 'foo'
+                              for i in range(n)]})
+
+        with tm.ensure_clean() as path:
+            df.to_csv(path, index=False)
+            self.assertTrue(os.path.getsize(path) > 2 * parsers._PARALLEL_MIN_BYTES)
+
+            expected = self.read_csv(path)
+            tm.assert_frame_equal(expected, df)
+
+            reader = TextFileReader(path, engine='c', n_jobs=4)
+            self.assertTrue(len(reader._engine._byte_ranges) > 1)
+            result = self.read_csv(path, n_jobs=4)
+            tm.assert_frame_equal(result, expected)
+
+            result = self.read_csv(path, n_jobs=4, memory_map=True)
+            tm.assert_frame_equal(result, expected)
+
+            result = self.read_csv(path, n_jobs=4, usecols=['c', 'a'],
+                                   dtype={'a': np.float64})
+            tm.assert_frame_equal(result,
+                                  DataFrame({'a': expected['a'].astype(float),
+                                             'c': expected['c']}))
+
+            # chunked reading ignores n_jobs
+            reader = self.read_csv(path, n_jobs=4, chunksize=n // 2)
+            result = pd.concat(list(reader), ignore_index=True)
+            tm.assert_frame_equal(result, expected)
+
+            # reading a number of rows falls back to a single reader
+            reader = TextFileReader(path, engine='c', n_jobs=4)
+            tm.assert_frame_equal(reader.read(10), expected[:10])
+            reader = TextFileReader(path, engine='c', n_jobs=4,
+                                    chunksize=n // 2)
+            result = pd.concat(list(reader), ignore_index=True)
+            tm.assert_frame_equal(result, expected)
+
+    def test_parallel_tokenization_quotes(self):
+        # a stray quote inside an unquoted field does not start a quoted
+        # field, so files with quotes are never split
+        n = 200000
+        df = DataFrame({'a': np.arange(n),
+                        'c': ['5" pipe' if i % 7 == 0 else 'x\n"y",z'
+                              for i in range(n)]})
+
+        with tm.ensure_clean() as path:
+            df.to_csv(path, index=False)
+            self.assertTrue(os.path.getsize(path) > 2 * parsers._PARALLEL_MIN_BYTES)
+
+            reader = TextFileReader(path, engine='c', n_jobs=4)
+            self.assertIsNone(reader._engine._byte_ranges)
+            result = self.read_csv(path, n_jobs=4)
+            tm.assert_frame_equal(result, self.read_csv(path))
+            tm.assert_frame_equal(result, df)
+
+            # without quoting the quote character is data
+            reader = TextFileReader(path, engine='c', n_jobs=4,
+                                    quoting=csv.QUOTE_NONE)
+            self.assertIsNotNone(reader._engine._byte_ranges)
+
+    def test_parallel_tokenization_parse_dates(self):
+        n = 200000
+        dates = date_range('20120101', periods=n, freq='min')
+        df = DataFrame({'a': np.arange(n),
+                        'date': [d.strftime('%Y%m%d') for d in dates],
+                        'stamp': dates})
+
+        with tm.ensure_clean() as path:
+            df.to_csv(path, index=False)
+            self.assertTrue(os.path.getsize(path) > 2 * parsers._PARALLEL_MIN_BYTES)
+
+            for kwargs in [{'parse_dates': ['date', 'stamp']},
+                           {'parse_dates': ['date'], 'date_format': '%Y%m%d'}]:
+                expected = self.read_csv(path, **kwargs)
+                self.assertEqual(expected['date'].dtype, 'M8[ns]')
+
+                result = self.read_csv(path, n_jobs=2, **kwargs)
+                tm.assert_frame_equal(result, expected)
+
+    def test_get_byte_ranges(self):
+        data = b'a,b\n1,x\n2,z\r\n3,w\n'
+
+        with tm.ensure_clean() as path:
+            with open(path, 'wb') as f:
+                f.write(data)
+
+            for blocksize in [1, 3, 1024]:
+                ranges = parsers._get_byte_ranges(path, len(data),
+                                                  blocksize=blocksize)
+                self.assertEqual(ranges[0][0], 0)
+                self.assertEqual(ranges[-1][1], len(data))
+                for (_, stop), (start, _) in zip(ranges[:-1], ranges[1:]):
+                    self.assertEqual(stop, start)
+                    self.assertEqual(data[stop - 1:stop], b'\n')
+
+                ranges = parsers._get_byte_ranges(path, len(data),
+                                                  lineterminator=b'\r\n',
+                                                  blocksize=blocksize)
+                boundary = data.index(b'\r\n') + 2
+                self.assertEqual(ranges, [(0, boundary),
+                                          (boundary, len(data))])
+
+                self.assertTrue(parsers._file_contains(path, b'\r\n',
+                                                       blocksize=blocksize))
+                self.assertFalse(parsers._file_contains(path, b'"',
+                                                        blocksize=blocksize))
+
+            ranges = parsers._get_byte_ranges(path, 1)
+            self.assertEqual(ranges, [(0, len(data))])
+
     def test_disable_bool_parsing(self):
         # #2090
 
@@ -3493,6 +3790,16 @@ No,No,No"""
         data = "\n\n\n"
         self.assertRaises(ValueError, self.read_csv, StringIO(data))
 
+    def test_parse_dates_fallback_across_chunks(self):
+        # native conversion succeeds on the first chunks only
+        data = 'a,b\n' + '2012-01-01,1\n' * 5 + 'Jan 2 2012,2\n'
+
+        result = self.read_csv(StringIO(data), parse_dates=['a'])
+        expected = DataFrame({'a': [datetime(2012, 1, 1)] * 5 +
+                                   [datetime(2012, 1, 2)],
+                              'b': [1] * 5 + [2]}, columns=['a', 'b'])
+        tm.assert_frame_equal(result, expected)
+
     def test_warn_if_chunks_have_mismatched_type(self):
         # Issue #3866 If chunks are different types and can't
         # be coerced using numerical types, then issue warning.
@@ -684,6 +684,66 @@ class TestHDFStore(tm.TestCase):
             store.put('c', df, format='table', complib='blosc')
             tm.assert_frame_equal(store['c'], df)
 
+    def test_select_mmap(self):
+        tm.skip_if_no_package('h5py')
+
+        def is_mapped(values):
+            while values is not None:
+                if isinstance(values, np.memmap):
+                    return True
+                values = values.base
+            return False
+
+        df = tm.makeTimeDataFrame()
+        df['int'] = np.arange(len(df))
+        df['date'] = Timestamp('20130101')
+        df['obj'] = 'foo'
+        s = df['A']
+
+        with ensure_clean_path(self.path) as path:
+
+            df.to_hdf(path, 'df')
+            s.to_hdf(path, 's')
+            df.to_hdf(path, 'df_table', format='table')
+
+            store = HDFStore(path, mode='r')
+            try:
+                result = store.select('df', mmap=True)
+                tm.assert_frame_equal(result, df)
+
+                for blk in result._data.blocks:
+                    if blk.dtype == object:
+                        self.assertFalse(is_mapped(blk.values))
+                    else:
+                        self.assertTrue(is_mapped(blk.values))
+                        self.assertFalse(blk.values.flags.writeable)
+
+                result = store.select('s', mmap=True)
+                tm.assert_series_equal(result, s)
+                self.assertTrue(is_mapped(result.values))
+
+                # tables are read as usual
+                result = store.select('df_table', mmap=True)
+                tm.assert_frame_equal(result, df)
+            finally:
+                store.close()
+
+            result = read_hdf(path, 'df', mmap=True)
+            tm.assert_frame_equal(result, df)
+
+            # a store opened for writing may lock the file against the
+            # second handle that locates the data; copies are read then
+            with get_store(path, mode='a') as store:
+                tm.assert_frame_equal(store.select('df', mmap=True), df)
+
+        # compressed arrays are read into memory
+        with ensure_clean_path(self.path) as path:
+            df.to_hdf(path, 'df', complevel=9, complib='zlib')
+            result = read_hdf(path, 'df', mmap=True)
+            tm.assert_frame_equal(result, df)
+            for blk in result._data.blocks:
+                self.assertFalse(is_mapped(blk.values))
+
     def test_put_integer(self):
         # non-date, non-string index
         df = DataFrame(np.random.randn(50, 100))
@@ -3287,6 +3347,138 @@ class TestHDFStore(tm.TestCase):
             tm.assert_frame_equal(expected, result)
             self.assertEqual(len(result), 100)
 
+    def test_columnar_layout(self):
+
+        with ensure_clean_store(self.path) as store:
+
+            df = DataFrame(dict(A=np.random.randn(20),
+                                B=np.arange(20),
+                                C=['foo', 'bar'] * 10,
+                                D=np.random.randn(20),
+                                E=date_range('2013-01-01', periods=20)),
+                           columns=list('ABCDE'))
+            df.loc[3, 'C'] = np.nan
+
+            _maybe_remove(store, 'df')
+            store.append('df', df[:10], format='table', layout='columnar',
+                         data_columns=['B'])
+            store.append('df', df[10:])
+            self.assertEqual(store.keys(), ['/df'])
+            self.assertEqual(store.get_storer('df').table_type,
+                             'appendable_columnar_frame')
+
+            tm.assert_frame_equal(store.select('df'), df)
+
+            # only the requested columns are read
+            result = store.select('df', columns=['D', 'A'])
+            tm.assert_frame_equal(result, df[['A', 'D']])
+
+            result = store.select('df', 'B > 5 & B < 15', columns=['C', 'E'])
+            expected = df.loc[(df.B > 5) & (df.B < 15), ['C', 'E']]
+            tm.assert_frame_equal(result, expected)
+
+            result = store.select('df', start=5, stop=12, columns=['A'])
+            tm.assert_frame_equal(result, df.iloc[5:12][['A']])
+
+            result = store.select('df', where=np.array([1, 4, 17]))
+            tm.assert_frame_equal(result, df.iloc[[1, 4, 17]])
+
+            result = store.select('df', where=np.array([17, 1, 18, 1]))
+            tm.assert_frame_equal(result, df.iloc[[17, 1, 18, 1]])
+
+            # values columns can be read individually
+            tm.assert_series_equal(store.select_column('df', 'D'),
+                                   Series(df['D'].values))
+            tm.assert_series_equal(store.select_column('df', 'B'),
+                                   Series(df['B'].values, name='B'),
+                                   check_names=False)
+
+            # strings longer than the stored itemsize are rejected
+            self.assertRaises(ValueError, store.append, 'df',
+                              DataFrame(dict(A=[1.], B=[1], C=['foobarbaz'],
+                                             D=[1.], E=[Timestamp('2013')]),
+                                        columns=list('ABCDE')))
+
+            # rows are removed from the table and from every column node,
+            # moving the kept rows in chunks
+            klass = pytables.AppendableColumnarFrameTable
+            chunksize = klass._move_chunksize
+            klass._move_chunksize = 4
+            try:
+                self.assertEqual(store.remove('df', 'B > 5 & B < 9'), 3)
+                expected = df[(df.B <= 5) | (df.B >= 9)]
+                tm.assert_frame_equal(store.select('df'), expected)
+                tm.assert_frame_equal(store.select('df', columns=['C', 'E']),
+                                      expected[['C', 'E']])
+
+                self.assertEqual(store.remove('df', start=-3), 3)
+                expected = expected.iloc[:-3]
+                tm.assert_frame_equal(store.select('df'), expected)
+
+                self.assertEqual(store.remove('df', where=np.array([0, 2])), 2)
+                expected = expected.drop(expected.index[[0, 2]])
+                tm.assert_frame_equal(store.select('df'), expected)
+
+                self.assertEqual(store.remove('df', 'B > 100'), 0)
+                tm.assert_frame_equal(store.select('df'), expected)
+            finally:
+                klass._move_chunksize = chunksize
+
+            # appending continues after the removed rows
+            store.append('df', df[-2:])
+            tm.assert_frame_equal(store.select('df'),
+                                  concat([expected, df[-2:]]))
+
+            store.remove('df')
+            self.assertNotIn('df', store)
+
+            self.assertRaises(ValueError, store.put, 'df', df,
+                              layout='columnar')
+            self.assertRaises(ValueError, store.put, 'df', df,
+                              format='table', layout='foo')
+
+    def test_select_iterator_groupby(self):
+
+        df = tm.makeTimeDataFrame(500)
+        df['key'] = np.random.choice(['a', 'b', 'c', 'd'], size=len(df))
+        df['key2'] = np.random.randint(0, 3, size=len(df))
+        df['int'] = np.random.randint(-10, 10, size=len(df))
+        df.loc[df.index[::7], 'A'] = np.nan
+        df.loc[df.index[:50], 'B'] = np.nan
+        df.loc[df.index[df.key == 'd'], 'C'] = np.nan
+
+        with ensure_clean_store(self.path) as store:
+
+            store.append('df', df, data_columns=['key'])
+
+            for by in ['key', ['key', 'key2']]:
+                expected = df.groupby(by)
+                for chunksize in [7, 100, 1000]:
+                    result = store.select('df', chunksize=chunksize).groupby(by)
+                    tm.assert_frame_equal(result.sum(), expected.sum())
+                    tm.assert_frame_equal(result.count(), expected.count())
+                    tm.assert_frame_equal(result.mean(), expected.mean())
+                    tm.assert_frame_equal(result.var(), expected.var())
+                    tm.assert_frame_equal(result.var(ddof=0),
+                                          expected.var(ddof=0))
+                    tm.assert_frame_equal(result.min(), expected.min())
+                    tm.assert_frame_equal(result.max(), expected.max())
+
+            # several aggregations in one pass, with a where
+            result = store.select('df', where='key!="a"', chunksize=33)
+            result = result.groupby('key').agg(['sum', 'mean'])
+            expected = df[df.key != 'a'].groupby('key').agg(['sum', 'mean'])
+            tm.assert_frame_equal(result, expected[result.columns])
+
+            # a series by level
+            s = df.set_index('key', append=True)['A']
+            store.append('s', s)
+            result = store.select('s', chunksize=50).groupby(level=1).mean()
+            tm.assert_series_equal(result, s.groupby(level=1).mean())
+
+            it = store.select('df', chunksize=10).groupby('key')
+            self.assertRaises(ValueError, it.agg, 'median')
+
     def test_select_iterator(self):
 
         # single table
@@ -460,6 +460,39 @@ class _TestSQLApi(PandasSQLTest):
         s2 = sql.read_sql_query("SELECT * FROM test_series", self.conn)
         tm.assert_frame_equal(s.to_frame(), s2)
 
+    def test_to_sql_method(self):
+        # more rows than fit in one multi-row insert statement
+        df = DataFrame({'a': np.arange(1000), 'b': np.random.randn(1000),
+                        'c': ['foo'] * 1000})
+        df.loc[::3, 'b'] = np.nan
+
+        for method in [None, 'multi']:
+            for chunksize in [None, 7]:
+                sql.to_sql(df, 'test_method', self.conn, flavor='sqlite',
+                           index=False, if_exists='replace',
+                           chunksize=chunksize, method=method)
+                result = sql.read_sql_query("SELECT * FROM test_method",
+                                            self.conn)
+                tm.assert_frame_equal(result, df)
+
+        calls = []
+
+        def insert(pd_table, conn, keys, data_iter):
+            rows = list(data_iter)
+            calls.append(len(rows))
+            pd_table._execute_insert(conn, keys, rows)
+
+        sql.to_sql(df, 'test_method', self.conn, flavor='sqlite',
+                   index=False, if_exists='replace', chunksize=400,
+                   method=insert)
+        self.assertEqual(calls, [400, 400, 200])
+        result = sql.read_sql_query("SELECT * FROM test_method", self.conn)
+        tm.assert_frame_equal(result, df)
+
+        self.assertRaises(ValueError, sql.to_sql, df, 'test_method',
+                          self.conn, flavor='sqlite', if_exists='replace',
+                          method='foo')
+
     def test_to_sql_panel(self):
         panel = tm.makePanel()
         self.assertRaises(NotImplementedError, sql.to_sql, panel,
@@ -678,6 +711,32 @@ class _TestSQLApi(PandasSQLTest):
 
             tm.assert_frame_equal(res1, res3)
 
+    def test_read_query_batches(self):
+        df = DataFrame({'a': lrange(10), 'b': np.random.randn(10),
+                        'c': list('abcdefghij'),
+                        'd': lrange(10)})
+        df.to_sql('test_batches', self.conn, index=False)
+        sql.execute("update test_batches set d = NULL where a = 9", self.conn)
+
+        query = "select * from test_batches"
+        expected = DataFrame.from_records(
+            sql.execute(query, self.conn).fetchall(), columns=list('abcd'))
+        self.assertEqual(expected['d'].dtype, np.float64)
+
+        # the batches of a column may be inferred with different dtypes
+        batch_size = sql._FETCH_BATCH_SIZE
+        try:
+            for size in [1, 3, 9, 100]:
+                sql._FETCH_BATCH_SIZE = size
+                result = sql.read_sql_query(query, self.conn)
+                tm.assert_frame_equal(result, expected)
+        finally:
+            sql._FETCH_BATCH_SIZE = batch_size
+
+        result = sql.read_sql_query(query + " where a > 100", self.conn)
+        self.assertEqual(len(result), 0)
+        self.assertEqual(list(result.columns), list('abcd'))
+
     def test_categorical(self):
         # GH8624
         # test that categorical gets written correctly as dense column
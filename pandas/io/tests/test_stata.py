@@ -15,8 +15,8 @@ import pandas as pd
 from pandas.compat import iterkeys
 from pandas.core.frame import DataFrame, Series
 from pandas.io.parsers import read_csv
-from pandas.io.stata import (read_stata, StataReader, InvalidColumnName,
-    PossiblePrecisionLoss, StataMissingValue)
+from pandas.io.stata import (read_stata, StataReader, StataWriter,
+    InvalidColumnName, PossiblePrecisionLoss, StataMissingValue)
 import pandas.util.testing as tm
 from pandas.tslib import NaT
 from pandas.util.misc import is_little_endian
@@ -217,6 +217,12 @@ class TestStata(tm.TestCase):
         # these are all categoricals
         expected = pd.concat([expected[col].astype('category') for col in expected], axis=1)
 
+        # the categories include the labels of values that do not occur
+        labels = ['one', 'two', 'three', 'four', 'five', 'six', 'seven',
+                  'eight', 'nine', 'ten']
+        expected['labeled_with_missings'] = pd.Categorical(
+            expected['labeled_with_missings'], categories=sorted(labels))
+
         tm.assert_frame_equal(parsed_113, expected)
         tm.assert_frame_equal(parsed_114, expected)
         tm.assert_frame_equal(parsed_115, expected)
@@ -817,6 +823,73 @@ class TestStata(tm.TestCase):
             written_and_read_again = self.read_dta(path)
             tm.assert_frame_equal(written_and_read_again.set_index('index'), original)
 
+    def test_iterator(self):
+        fname = self.dta3_117
+        parsed = read_stata(fname)
+
+        itr = read_stata(fname, iterator=True)
+        chunk = itr.get_chunk(5)
+        tm.assert_frame_equal(parsed.iloc[0:5, :], chunk)
+        chunk = itr.get_chunk(5)
+        tm.assert_frame_equal(parsed.iloc[5:10, :], chunk)
+
+        itr = read_stata(fname, chunksize=5)
+        chunks = list(itr)
+        tm.assert_frame_equal(parsed.iloc[0:5, :], chunks[0])
+        tm.assert_frame_equal(parsed, pd.concat(chunks))
+
+        itr = StataReader(fname, chunksize=7)
+        tm.assert_frame_equal(parsed, pd.concat(list(itr)))
+
+        # dates are converted in each chunk
+        with warnings.catch_warnings(record=True):
+            parsed = read_stata(self.dta2_117)
+            for i, chunk in enumerate(read_stata(self.dta2_117,
+                                                 chunksize=2)):
+                expected = parsed.iloc[2 * i:2 * (i + 1), :]
+                tm.assert_frame_equal(expected.astype(object),
+                                      chunk.astype(object))
+
+        # value labels are applied to each chunk, with the categories of
+        # the whole file
+        for fname in [self.dta4_114, self.dta4_117]:
+            parsed = read_stata(fname)
+            chunks = list(read_stata(fname, chunksize=3))
+            for i, chunk in enumerate(chunks):
+                expected = parsed.iloc[3 * i:3 * (i + 1), :]
+                tm.assert_frame_equal(expected, chunk)
+            tm.assert_frame_equal(parsed, pd.concat(chunks))
+
+        # columns
+        itr = read_stata(self.dta3_117, chunksize=5,
+                         columns=['quarter', 'year'])
+        parsed = read_stata(self.dta3_117, columns=['quarter', 'year'])
+        tm.assert_frame_equal(parsed, pd.concat(list(itr)))
+
+    def test_write_chunks(self):
+        original = DataFrame({'string': ['a', 'bb', np.nan, 'dddd', 'e'] * 5,
+                              'integer': np.arange(25, dtype=np.int32),
+                              'floating': np.random.randn(25),
+                              'datetime': pd.date_range('2000-01-01',
+                                                        periods=25)},
+                             columns=['string', 'integer', 'floating',
+                                      'datetime'])
+        original.index.name = 'index'
+        original.index = original.index.astype(np.int32)
+        expected = original.copy()
+        expected['string'] = expected['string'].fillna('')
+
+        for byteorder in ['<', '>']:
+            for chunksize in [None, 1, 4, 25, 100]:
+                with tm.ensure_clean() as path:
+                    writer = StataWriter(path, original, {'datetime': 'tc'},
+                                         byteorder=byteorder,
+                                         chunksize=chunksize)
+                    writer.write_file()
+                    written_and_read_again = self.read_dta(path)
+                    tm.assert_frame_equal(
+                        written_and_read_again.set_index('index'), expected)
+
 if __name__ == '__main__':
     nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
                    exit=False)
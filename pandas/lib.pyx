@@ -480,6 +480,203 @@ def dicts_to_array(list dicts, list columns):
 
     return result
 
+cdef class _RecordColumns:
+    """
+    Fill the columns of a frame from a sequence of records (dicts), one
+    record at a time. The columns are created as new keys are seen, the
+    missing values are NaN. With flatten the nested dicts are flattened into
+    dotted keys, as nested_to_record does.
+    """
+    cdef:
+        dict columns
+        list keys
+        Py_ssize_t nrows
+        bint flatten
+        public bint all_dicts
+
+    def __init__(self, bint flatten=False):
+        self.columns = {}
+        self.keys = []
+        self.nrows = 0
+        self.flatten = flatten
+        self.all_dicts = True
+
+    cdef _set(self, object key, object value):
+        cdef:
+            list values
+            Py_ssize_t n
+
+        values = self.columns.get(key)
+        if values is None:
+            values = []
+            self.columns[key] = values
+            self.keys.append(key)
+
+        n = len(values)
+        if n > self.nrows:
+            # the key was already set for this record
+            values[self.nrows] = value
+            return
+        if n < self.nrows:
+            values.extend([np.nan] * (self.nrows - n))
+        values.append(value)
+
+    cdef _set_nested(self, object d, object prefix, int level):
+        cdef list nested = []
+
+        # the values of nested dicts take precedence over dotted keys
+        for k, v in d.items():
+            if isinstance(v, dict):
+                nested.append((k, v))
+            elif level == 0:
+                self._set(k, v)
+            else:
+                self._set(prefix + '.' + str(k), v)
+
+        for k, v in nested:
+            if level == 0:
+                newkey = str(k)
+            else:
+                newkey = prefix + '.' + str(k)
+            self._set_nested(v, newkey, level + 1)
+
+    cpdef add_record(self, object record):
+        if not self.all_dicts:
+            return
+        if not isinstance(record, dict):
+            self.all_dicts = False
+            return
+
+        if self.flatten:
+            self._set_nested(record, '', 0)
+        else:
+            for k, v in record.items():
+                self._set(k, v)
+        self.nrows += 1
+
+    def get_columns(self):
+        """
+        Return the (sorted if possible) keys and an object ndarray per key
+        """
+        cdef:
+            Py_ssize_t i, n = self.nrows
+            list keys, values
+            list arrays = []
+            ndarray[object] arr
+            object onan = np.nan
+
+        keys = list(self.keys)
+        try:
+            keys.sort()
+        except Exception:
+            pass
+
+        for key in keys:
+            values = self.columns[key]
+            arr = np.empty(n, dtype=object)
+            for i in range(len(values)):
+                arr[i] = values[i]
+            for i in range(len(values), n):
+                arr[i] = onan
+            arrays.append(arr)
+        return keys, arrays
+
+
+def normalize_records(object records, bint flatten=True):
+    """
+    Fill the columns of a list of records (dicts), flattening the nested
+    dicts into dotted keys
+
+    Returns
+    -------
+    (keys, arrays) or None if not all the records are dicts
+    """
+    cdef _RecordColumns columns = _RecordColumns(flatten)
+
+    for record in records:
+        columns.add_record(record)
+        if not columns.all_dicts:
+            return None
+    return columns.get_columns()
+
+
+cdef object _pull_field(object js, object spec):
+    cdef object result = js
+
+    if isinstance(spec, list):
+        for field in spec:
+            result = result[field]
+    else:
+        result = result[spec]
+    return result
+
+
+cdef _extract_records(object data, list path, dict seen_meta, int level,
+                      list meta, list meta_keys, _RecordColumns columns,
+                      list record_lists, dict meta_vals, list lengths):
+    cdef:
+        Py_ssize_t j, nmeta = len(meta)
+        list val
+
+    if len(path) > 1:
+        for obj in data:
+            for j in range(nmeta):
+                val = meta[j]
+                if level + 1 == len(val):
+                    seen_meta[meta_keys[j]] = _pull_field(obj, val[-1])
+
+            _extract_records(obj[path[0]], path[1:], seen_meta, level + 1,
+                             meta, meta_keys, columns, record_lists,
+                             meta_vals, lengths)
+    else:
+        for obj in data:
+            recs = _pull_field(obj, path[0])
+
+            # For repeating the metadata later
+            lengths.append(len(recs))
+
+            for j in range(nmeta):
+                val = meta[j]
+                if level + 1 > len(val):
+                    meta_val = seen_meta[meta_keys[j]]
+                else:
+                    meta_val = _pull_field(obj, val[level:])
+                meta_vals.setdefault(meta_keys[j], []).append(meta_val)
+
+            record_lists.append(recs)
+            for rec in recs:
+                columns.add_record(rec)
+
+
+def normalize_json(object data, list record_path, list meta,
+                   list meta_keys):
+    """
+    Walk data along record_path in a single pass, filling the columns of the
+    records and collecting the meta values of each list of records
+
+    Returns
+    -------
+    columns : (keys, arrays) or None if not all the records are dicts
+    record_lists : list of the lists of records
+    meta_vals : dict of meta key -> list of values, one per list of records
+    lengths : list of the number of records of each list
+    """
+    cdef:
+        _RecordColumns columns = _RecordColumns(False)
+        list record_lists = []
+        list lengths = []
+        dict meta_vals = {}
+
+    _extract_records(data, record_path, {}, 0, meta, meta_keys, columns,
+                     record_lists, meta_vals, lengths)
+
+    if columns.all_dicts:
+        result = columns.get_columns()
+    else:
+        result = None
+    return result, record_lists, meta_vals, lengths
+
+
 def fast_zip(list ndarrays):
     '''
     For zipping multiple ndarrays into an ndarray of tuples
@@ -977,6 +1174,424 @@ def write_csv_rows(list data, list data_index, int nlevels, list cols, object wr
     if  j >= 0 and (j < N-1 or (j % N) != N-1 ):
         writer.writerows(rows[:((j+1) % N)])
 
+cdef extern from "Python.h":
+    char *PyOS_double_to_string(double val, char format_code, int precision,
+                                int flags, int *ptype) except NULL
+    enum: Py_DTSF_ADD_DOT_0
+    void PyMem_Free(void *p)
+    int PyNumber_Check(object o)
+
+from libc.stdlib cimport realloc
+from libc.string cimport memcpy, strlen, memchr
+from libc.stdio cimport snprintf
+
+import sys
+
+cdef bint _PY3 = sys.version_info[0] >= 3
+
+# csv module quoting constants
+cdef enum:
+    _QUOTE_MINIMAL = 0
+    _QUOTE_ALL = 1
+    _QUOTE_NONNUMERIC = 2
+    _QUOTE_NONE = 3
+
+# column kinds understood by CSVWriter.write_rows
+cdef enum:
+    _CSV_FLOAT, _CSV_INT, _CSV_BOOL, _CSV_DATETIME, _CSV_OBJECT
+
+cdef dict _csv_kinds = {'f': _CSV_FLOAT, 'i': _CSV_INT, 'b': _CSV_BOOL,
+                        'M': _CSV_DATETIME, 'O': _CSV_OBJECT}
+
+# flush the buffer to the handle once it grows past this many bytes
+cdef Py_ssize_t _CSV_FLUSH_SIZE = 1 << 20
+
+
+cdef class CSVWriter:
+    """
+    Format rows of column arrays directly into a byte buffer, following the
+    quoting rules of the csv module, and write the result to a file handle.
+
+    Columns are passed to ``write_rows`` together with a kind code: 'f' for
+    contiguous float64 arrays, 'i' for int64, 'b' for bool (as uint8), 'M'
+    for datetime64[ns] (as int64) and 'O' for sequences of already
+    formatted objects.
+    """
+
+    cdef:
+        char *buf
+        Py_ssize_t length, capacity
+        char delimiter, quotechar, escapechar
+        int quoting
+        bint doublequote
+        bytes lineterminator, na_rep, float_format, date_format
+        object encoding, handle, float_format_str
+
+    def __cinit__(self, *args, **kwargs):
+        self.capacity = 1 << 16
+        self.length = 0
+        self.buf = <char*> malloc(self.capacity)
+        if self.buf == NULL:
+            raise MemoryError()
+
+    def __dealloc__(self):
+        free(self.buf)
+
+    def __init__(self, handle, delimiter=',', quotechar='"', int quoting=0,
+                 doublequote=True, escapechar=None, lineterminator='\n',
+                 na_rep='', float_format=None, date_format=None):
+        # py2 without an explicit encoding writes through str(), py3
+        # writes text and lets the handle do the encoding
+        self.encoding = 'utf-8' if _PY3 else 'ascii'
+        self.handle = handle
+        self.delimiter = self._to_char(delimiter)
+        self.quotechar = self._to_char(quotechar)
+        self.escapechar = self._to_char(escapechar)
+        self.quoting = quoting
+        self.doublequote = doublequote
+        self.lineterminator = self._to_bytes(lineterminator)
+        self.na_rep = self._to_bytes(na_rep)
+
+        # float_format / date_format must already be validated as formats
+        # that can be expanded natively, see CSVFormatter
+        self.float_format_str = float_format
+        self.float_format = None
+        if float_format is not None:
+            self.float_format = self._to_bytes(float_format)
+        self.date_format = None
+        if date_format is not None:
+            self.date_format = self._to_bytes(date_format)
+
+    cdef bytes _to_bytes(self, object val):
+        if isinstance(val, bytes):
+            return val
+        return val.encode(self.encoding)
+
+    cdef char _to_char(self, object val) except? -1:
+        cdef bytes b
+        if val is None:
+            return 0
+        b = self._to_bytes(val)
+        if len(b) != 1:
+            raise ValueError('expected a single byte character, got %r'
+                             % (val,))
+        return b[0]
+
+    cdef int _reserve(self, Py_ssize_t n) except -1:
+        cdef:
+            char *new_buf
+            Py_ssize_t cap
+
+        if self.length + n <= self.capacity:
+            return 0
+        cap = max(2 * self.capacity, self.length + n)
+        new_buf = <char*> realloc(self.buf, cap)
+        if new_buf == NULL:
+            raise MemoryError()
+        self.buf = new_buf
+        self.capacity = cap
+        return 0
+
+    cdef inline int _put(self, const char *s, Py_ssize_t n) except -1:
+        self._reserve(n)
+        memcpy(self.buf + self.length, s, n)
+        self.length += n
+        return 0
+
+    cdef inline bint _is_special(self, char c):
+        if c == 0:
+            return 0
+        return (c == self.delimiter or c == self.quotechar or
+                c == self.escapechar or
+                memchr(<char*> self.lineterminator, c,
+                       len(self.lineterminator)) != NULL)
+
+    cdef int _write_field(self, const char *s, Py_ssize_t n,
+                          bint quoted) except -1:
+        # mirrors join_append_data in the csv module
+        cdef:
+            Py_ssize_t k
+            char c
+            bint escape
+
+        if self.quoting == _QUOTE_ALL:
+            quoted = 1
+
+        if self.quoting != _QUOTE_NONE and not quoted:
+            for k in range(n):
+                c = s[k]
+                if self._is_special(c) and not (c == self.quotechar and
+                                                not self.doublequote):
+                    quoted = 1
+                    break
+
+        # worst case: every character is escaped, plus the quotes
+        self._reserve(2 * n + 2)
+
+        if quoted:
+            self.buf[self.length] = self.quotechar
+            self.length += 1
+
+        for k in range(n):
+            c = s[k]
+            if self._is_special(c):
+                escape = (self.quoting == _QUOTE_NONE or
+                          (c == self.quotechar and not self.doublequote))
+                if escape:
+                    if self.escapechar == 0:
+                        import csv
+                        raise csv.Error('need to escape, but no escapechar '
+                                        'set')
+                    self.buf[self.length] = self.escapechar
+                    self.length += 1
+                elif c == self.quotechar:
+                    self.buf[self.length] = self.quotechar
+                    self.length += 1
+            self.buf[self.length] = c
+            self.length += 1
+
+        if quoted:
+            self.buf[self.length] = self.quotechar
+            self.length += 1
+        return 0
+
+    cdef int _write_na(self) except -1:
+        return self._write_field(<char*> self.na_rep, len(self.na_rep),
+                                 self.quoting == _QUOTE_NONNUMERIC)
+
+    cdef int _write_object(self, object val) except -1:
+        cdef:
+            bint quoted = 0
+            bytes s
+
+        if self.quoting == _QUOTE_NONNUMERIC:
+            quoted = not PyNumber_Check(val)
+
+        if val is None:
+            s = b''
+        elif isinstance(val, unicode):
+            s = (<unicode> val).encode(self.encoding)
+        elif not _PY3 and isinstance(val, bytes):
+            s = val
+        else:
+            if PyFloat_Check(val):
+                val = repr(val)
+            else:
+                val = str(val)
+            s = self._to_bytes(val)
+        return self._write_field(<char*> s, len(s), quoted)
+
+    cdef int _write_double(self, double val) except -1:
+        cdef:
+            char tmp[512]
+            char *s
+            int n
+            bytes formatted
+
+        if val != val:
+            return self._write_na()
+
+        if self.float_format is not None:
+            n = snprintf(tmp, sizeof(tmp), <char*> self.float_format, val)
+            if n < 0 or n >= <int> sizeof(tmp):
+                formatted = self._to_bytes(self.float_format_str % val)
+                return self._write_field(<char*> formatted, len(formatted),
+                                         self.quoting == _QUOTE_NONNUMERIC)
+            return self._write_field(tmp, n,
+                                     self.quoting == _QUOTE_NONNUMERIC)
+
+        s = PyOS_double_to_string(val, c'r', 0, Py_DTSF_ADD_DOT_0, NULL)
+        try:
+            self._write_field(s, strlen(s), 0)
+        finally:
+            PyMem_Free(s)
+        return 0
+
+    cdef int _write_int(self, int64_t val) except -1:
+        cdef:
+            char tmp[32]
+            int n
+        n = snprintf(tmp, sizeof(tmp), "%lld", <long long> val)
+        return self._write_field(tmp, n, 0)
+
+    cdef int _write_datetime(self, int64_t val) except -1:
+        cdef:
+            pandas_datetimestruct dts
+            char tmp[1024]
+            Py_ssize_t n
+
+        if val == NPY_NAT:
+            return self._write_na()
+
+        pandas_datetime_to_datetimestruct(val, PANDAS_FR_ns, &dts)
+        if self.date_format is None:
+            n = _format_datetime_repr(&dts, tmp, sizeof(tmp))
+        else:
+            n = _format_datetime_strftime(&dts, <char*> self.date_format,
+                                          tmp, sizeof(tmp))
+        return self._write_field(tmp, n, self.quoting == _QUOTE_NONNUMERIC)
+
+    cdef int _flush(self) except -1:
+        cdef object chunk
+        if self.length == 0:
+            return 0
+        chunk = self.buf[:self.length]
+        if _PY3:
+            chunk = chunk.decode('utf-8')
+        self.length = 0
+        self.handle.write(chunk)
+        return 0
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def write_rows(self, list data, list kinds, object data_index,
+                   int nlevels):
+        """
+        Write one row per entry of data_index. data is a list of columns
+        described by the kind codes in kinds, data_index holds the
+        formatted index values (tuples when nlevels > 1).
+        """
+        cdef:
+            Py_ssize_t i, j, nrows, ncols, nfields, row_start
+            int kind
+            int *ckinds = NULL
+            void **ptrs = NULL
+            ndarray arr
+            object val
+
+        ncols = len(data)
+        nrows = len(data_index)
+
+        ckinds = <int*> malloc(max(ncols, 1) * sizeof(int))
+        ptrs = <void**> malloc(max(ncols, 1) * sizeof(void*))
+        if ckinds == NULL or ptrs == NULL:
+            free(ckinds)
+            free(ptrs)
+            raise MemoryError()
+
+        try:
+            for i in range(ncols):
+                kind = _csv_kinds[kinds[i]]
+                ckinds[i] = kind
+                ptrs[i] = NULL
+                if kind != _CSV_OBJECT:
+                    arr = data[i]
+                    if (arr.ndim != 1 or len(arr) < nrows or
+                            not arr.flags.c_contiguous):
+                        raise ValueError('column %d must be a contiguous '
+                                         '1-d array of length %d'
+                                         % (i, nrows))
+                    ptrs[i] = arr.data
+
+            for j in range(nrows):
+                row_start = self.length
+                nfields = 0
+
+                if nlevels == 1:
+                    self._write_object(data_index[j])
+                    nfields = 1
+                elif nlevels > 1:
+                    for val in data_index[j]:
+                        if nfields:
+                            self._put(&self.delimiter, 1)
+                        self._write_object(val)
+                        nfields += 1
+
+                for i in range(ncols):
+                    if nfields:
+                        self._put(&self.delimiter, 1)
+                    kind = ckinds[i]
+                    if kind == _CSV_FLOAT:
+                        self._write_double((<double*> ptrs[i])[j])
+                    elif kind == _CSV_INT:
+                        self._write_int((<int64_t*> ptrs[i])[j])
+                    elif kind == _CSV_BOOL:
+                        if (<uint8_t*> ptrs[i])[j]:
+                            self._write_field('True', 4, 0)
+                        else:
+                            self._write_field('False', 5, 0)
+                    elif kind == _CSV_DATETIME:
+                        self._write_datetime((<int64_t*> ptrs[i])[j])
+                    else:
+                        self._write_object(data[i][j])
+                    nfields += 1
+
+                # the csv module quotes a lone empty field so the row
+                # does not read back as a blank line
+                if nfields == 1 and self.length == row_start:
+                    if self.quoting == _QUOTE_NONE:
+                        import csv
+                        raise csv.Error('single empty field record must '
+                                        'be quoted')
+                    self._put(&self.quotechar, 1)
+                    self._put(&self.quotechar, 1)
+
+                self._put(<char*> self.lineterminator,
+                          len(self.lineterminator))
+
+                if self.length >= _CSV_FLUSH_SIZE:
+                    self._flush()
+
+            self._flush()
+        finally:
+            free(ckinds)
+            free(ptrs)
+
+
+cdef Py_ssize_t _format_datetime_repr(pandas_datetimestruct *dts, char *out,
+                                      Py_ssize_t size):
+    # same output as Timestamp._repr_base
+    cdef:
+        int n
+        int64_t ns = dts.ps // 1000
+
+    n = snprintf(out, size, "%d-%02d-%02d %02d:%02d:%02d",
+                 <int> dts.year, dts.month, dts.day,
+                 dts.hour, dts.min, dts.sec)
+    if ns != 0:
+        n += snprintf(out + n, size - n, ".%09d",
+                      <int> (ns + 1000 * dts.us))
+    elif dts.us != 0:
+        n += snprintf(out + n, size - n, ".%06d", <int> dts.us)
+    return n
+
+
+cdef Py_ssize_t _format_datetime_strftime(pandas_datetimestruct *dts,
+                                          char *fmt, char *out,
+                                          Py_ssize_t size):
+    # supports the %Y %m %d %H %M %S %f %% subset of strftime, the caller
+    # guarantees the format does not contain anything else
+    cdef:
+        Py_ssize_t n = 0
+        char c
+
+    while fmt[0] != 0 and n < size - 16:
+        if fmt[0] == c'%' and fmt[1] != 0:
+            c = fmt[1]
+            fmt += 2
+            if c == c'Y':
+                n += snprintf(out + n, size - n, "%d", <int> dts.year)
+            elif c == c'm':
+                n += snprintf(out + n, size - n, "%02d", dts.month)
+            elif c == c'd':
+                n += snprintf(out + n, size - n, "%02d", dts.day)
+            elif c == c'H':
+                n += snprintf(out + n, size - n, "%02d", dts.hour)
+            elif c == c'M':
+                n += snprintf(out + n, size - n, "%02d", dts.min)
+            elif c == c'S':
+                n += snprintf(out + n, size - n, "%02d", dts.sec)
+            elif c == c'f':
+                n += snprintf(out + n, size - n, "%06d", dts.us)
+            else:
+                out[n] = c
+                n += 1
+        else:
+            out[n] = fmt[0]
+            fmt += 1
+            n += 1
+    return n
+
 #-------------------------------------------------------------------------------
 # Groupby-related functions
 
@@ -55,6 +55,9 @@ cdef extern from "msgpack/unpack.h":
         PyObject* list_hook
         char *encoding
         char *unicode_errors
+        PyObject* raw_view_hook
+        const_char_ptr raw_view_prefix
+        Py_ssize_t raw_view_prefix_len
 
     ctypedef struct template_context:
         msgpack_user user
@@ -361,6 +364,9 @@ cdef inline init_ctx(template_context *ctx,
 
     ctx.user.encoding = encoding
     ctx.user.unicode_errors = unicode_errors
+    ctx.user.raw_view_hook = <PyObject*>NULL
+    ctx.user.raw_view_prefix = NULL
+    ctx.user.raw_view_prefix_len = 0
 
 def unpackb(object packed, object object_hook=None, object list_hook=None,
             bint use_list=1, encoding=None, unicode_errors="strict",
@@ -404,6 +410,60 @@ def unpackb(object packed, object object_hook=None, object list_hook=None,
         raise UnpackValueError
 
 
+def unpack_from(object packed, Py_ssize_t offset=0, object object_hook=None,
+                object list_hook=None, bint use_list=1, encoding=None,
+                unicode_errors="strict", object_pairs_hook=None,
+                object raw_view_hook=None, bytes raw_view_prefix=None):
+    """Unpack the object starting at `offset` of the buffer `packed`.
+    Returns the unpacked object and the offset following it.
+
+    Raw values starting with `raw_view_prefix` are not copied: the result of
+    ``raw_view_hook(offset, length)`` with the location of the data after
+    the prefix in `packed` is used instead.
+    """
+    cdef template_context ctx
+    cdef size_t off
+    cdef int ret
+
+    cdef char* buf
+    cdef Py_ssize_t buf_len
+    cdef char* cenc = NULL
+    cdef char* cerr = NULL
+
+    PyObject_AsReadBuffer(packed, <const_void_ptr*>&buf, &buf_len)
+    if offset < 0 or offset > buf_len:
+        raise ValueError("offset is outside of the buffer")
+    off = offset
+
+    if encoding is not None:
+        if isinstance(encoding, unicode):
+            encoding = encoding.encode('ascii')
+        cenc = PyBytes_AsString(encoding)
+
+    if unicode_errors is not None:
+        if isinstance(unicode_errors, unicode):
+            unicode_errors = unicode_errors.encode('ascii')
+        cerr = PyBytes_AsString(unicode_errors)
+
+    init_ctx(&ctx, object_hook, object_pairs_hook, list_hook, use_list, cenc, cerr)
+    if raw_view_hook is not None:
+        if not PyCallable_Check(raw_view_hook):
+            raise TypeError("raw_view_hook must be a callable.")
+        if not raw_view_prefix:
+            raise ValueError("raw_view_hook requires a raw_view_prefix.")
+        ctx.user.raw_view_hook = <PyObject*>raw_view_hook
+        ctx.user.raw_view_prefix = PyBytes_AsString(raw_view_prefix)
+        ctx.user.raw_view_prefix_len = len(raw_view_prefix)
+
+    ret = template_construct(&ctx, buf, buf_len, &off)
+    if ret == 1:
+        return template_data(&ctx), off
+    elif ret < 0:
+        raise ValueError("Unpack failed: error = %d" % (ret,))
+    else:
+        raise UnpackValueError
+
+
 def unpack(object stream, object object_hook=None, object list_hook=None,
            bint use_list=1, encoding=None, unicode_errors="strict",
            object_pairs_hook=None,
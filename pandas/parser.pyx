@@ -38,6 +38,11 @@ cnp.import_array()
 
 from khash cimport *
 
+from datetime cimport (pandas_datetimestruct, PANDAS_FR_ns,
+                       pandas_datetimestruct_to_datetime, _cstring_to_dts,
+                       days_per_month_table, is_leapyear)
+
+import re
 import sys
 
 cdef bint PY3 = (sys.version_info[0] >= 3)
@@ -167,6 +172,9 @@ cdef extern from "parser/tokenizer.h":
 
         int skip_empty_lines
 
+        char *usecols
+        int usecols_len
+
     ctypedef struct coliter_t:
         char **words
         int *line_start
@@ -180,6 +188,10 @@ cdef extern from "parser/tokenizer.h":
     int parser_init(parser_t *self) nogil
     void parser_free(parser_t *self) nogil
     int parser_add_skiprow(parser_t *self, int64_t row)
+    int parser_set_usecols(parser_t *self, char *usecols, int usecols_len,
+                           int start_line)
+    int parser_set_colspecs(parser_t *self, int *starts, int *ends,
+                            int nfields, char *fill, int utf8)
 
     void parser_set_default_options(parser_t *self)
 
@@ -189,8 +201,8 @@ cdef extern from "parser/tokenizer.h":
 
     void debug_print_parser(parser_t *self)
 
-    int tokenize_all_rows(parser_t *self)
-    int tokenize_nrows(parser_t *self, size_t nrows)
+    int tokenize_all_rows(parser_t *self) nogil
+    int tokenize_nrows(parser_t *self, size_t nrows) nogil
 
     int64_t str_to_int64(char *p_item, int64_t int_min,
                          int64_t int_max, int *error, char tsep)
@@ -216,6 +228,7 @@ cdef extern from "parser/io.h":
     int del_mmap(void *src)
     void* buffer_mmap_bytes(void *source, size_t nbytes,
                             size_t *bytes_read, int *status)
+    int mmap_set_byte_range(void *src, int64_t start, int64_t stop)
 
     void *new_file_source(char *fname, size_t buffer_size)
 
@@ -224,12 +237,24 @@ cdef extern from "parser/io.h":
     int del_file_source(void *src)
     int del_rd_source(void *src)
 
+    int file_source_set_byte_range(void *src, int64_t start, int64_t stop)
+
     void* buffer_file_bytes(void *source, size_t nbytes,
                             size_t *bytes_read, int *status)
 
     void* buffer_rd_bytes(void *source, size_t nbytes,
                           size_t *bytes_read, int *status)
 
+    void *new_gzip_source(char *fname, size_t buffer_size)
+    int del_gzip_source(void *src)
+    void* buffer_gzip_bytes(void *source, size_t nbytes,
+                            size_t *bytes_read, int *status)
+
+    void *new_bz2_source(char *fname, size_t buffer_size)
+    int del_bz2_source(void *src)
+    void* buffer_bz2_bytes(void *source, size_t nbytes,
+                           size_t *bytes_read, int *status)
+
 
 DEFAULT_CHUNKSIZE = 256 * 1024
 
@@ -252,7 +277,7 @@ cdef class TextReader:
         parser_t *parser
         object file_handle, na_fvalues
         bint na_filter, verbose, has_usecols, has_mi_columns
-        int parser_start
+        int parser_start, usecols_width
         list clocks
         char *c_encoding
 
@@ -274,6 +299,8 @@ cdef class TextReader:
         object mangle_dupe_cols
         object tupleize_cols
         set noconvert, usecols
+        dict date_formats
+        bint defer_dates
 
     def __cinit__(self, source,
                   delimiter=b',',
@@ -285,8 +312,10 @@ cdef class TextReader:
                   names=None,
 
                   memory_map=False,
+                  byte_range=None,
                   tokenize_chunksize=DEFAULT_CHUNKSIZE,
                   delim_whitespace=False,
+                  colspecs=None,
 
                   compression=None,
 
@@ -344,11 +373,15 @@ cdef class TextReader:
         self.memory_map = memory_map
 
         self._setup_parser_source(source)
+        if byte_range is not None:
+            self._set_byte_range(byte_range)
         parser_set_default_options(self.parser)
 
         parser_init(self.parser)
 
-        if delim_whitespace:
+        if colspecs is not None:
+            self._setup_colspecs(colspecs, delimiter, encoding)
+        elif delim_whitespace:
             self.parser.delim_whitespace = delim_whitespace
         else:
             if len(delimiter) > 1:
@@ -447,14 +480,20 @@ cdef class TextReader:
 
         self.encoding = encoding
 
+        from pandas.core.common import is_categorical_dtype
+
         if isinstance(dtype, dict):
             conv = {}
             for k in dtype:
                 v = dtype[k]
-                if isinstance(v, basestring):
+                if is_categorical_dtype(v):
+                    v = 'category'
+                elif isinstance(v, basestring):
                     v = np.dtype(v)
                 conv[k] = v
             dtype = conv
+        elif is_categorical_dtype(dtype):
+            dtype = 'category'
         elif dtype is not None:
             dtype = np.dtype(dtype)
 
@@ -462,6 +501,8 @@ cdef class TextReader:
 
         # XXX
         self.noconvert = set()
+        self.date_formats = {}
+        self.defer_dates = False
 
         self.index_col = index_col
 
@@ -507,6 +548,9 @@ cdef class TextReader:
         if not self.table_width:
             raise ValueError("No columns to parse from file")
 
+        if self.has_usecols:
+            self._setup_usecols()
+
         # compute buffer_lines as function of table width
         heuristic = 2**20 // self.table_width
         self.buffer_lines = 1
@@ -529,6 +573,81 @@ cdef class TextReader:
         for i in self.skiprows:
             parser_add_skiprow(self.parser, i)
 
+    cdef _setup_colspecs(self, colspecs, delimiter, encoding):
+        # fixed-width fields, delimiter holds the filler characters
+        cdef:
+            Py_ssize_t i, n = len(colspecs)
+            ndarray starts, ends
+            int status
+            bint utf8
+
+        starts = np.empty(n, dtype=np.intc)
+        ends = np.empty(n, dtype=np.intc)
+        for i in range(n):
+            start, end = colspecs[i]
+            if (start is not None and start < 0) or (end is not None and
+                                                     end < 0):
+                raise ValueError('negative positions are not supported '
+                                 'in colspecs')
+            starts[i] = 0 if start is None else start
+            ends[i] = -1 if end is None else end
+
+        fill = '\r\n' + delimiter if delimiter else '\n\r\t '
+        if not isinstance(fill, bytes):
+            fill = fill.encode('utf-8')
+
+        if isinstance(encoding, bytes):
+            encoding = encoding.decode('ascii')
+
+        # positions count characters, as when slicing decoded lines
+        utf8 = PY3 and (encoding is None or
+                        encoding.lower() in ('utf-8', 'utf8'))
+
+        status = parser_set_colspecs(self.parser, <int*> starts.data,
+                                     <int*> ends.data, n, fill, utf8)
+        if status != 0:
+            raise MemoryError()
+
+    cdef _setup_usecols(self):
+        # tell the tokenizer which fields are needed, so that the others
+        # are skipped over instead of being stored
+        cdef:
+            Py_ssize_t i, nused = 0
+            int status
+            list used = []
+
+        for i in range(self.table_width):
+            if i < self.leading_cols:
+                used.append(i)
+                continue
+            elif self.usecols and nused == len(self.usecols):
+                break
+
+            try:
+                name = self._get_column_name(i, nused)
+            except IndexError:
+                # leave it to _convert_column_data to complain
+                return
+
+            if i in self.usecols or name in self.usecols:
+                nused += 1
+                used.append(i)
+
+        if not used:
+            return
+
+        mask = bytearray(max(used) + 1)
+        for i in used:
+            mask[i] = 1
+        mask = bytes(mask)
+
+        status = parser_set_usecols(self.parser, mask, len(mask),
+                                    self.parser_start)
+        if status != 0:
+            raise MemoryError()
+
+        self.usecols_width = len(used)
+
     cdef _setup_parser_source(self, source):
         cdef:
             int status
@@ -537,6 +656,12 @@ cdef class TextReader:
         self.parser.cb_io = NULL
         self.parser.cb_cleanup = NULL
 
+        if self.compression and isinstance(source, basestring):
+            # decompress in C straight into the tokenizer buffer if pandas
+            # was built against zlib / bzip2
+            if self._setup_compressed_source(source):
+                return
+
         if self.compression:
             if self.compression == 'gzip':
                 import gzip
@@ -596,6 +721,50 @@ cdef class TextReader:
             raise IOError('Expected file path name or file-like object,'
                           ' got %s type' % type(source))
 
+    cdef bint _setup_compressed_source(self, source) except -1:
+        cdef:
+            void *ptr
+
+        if not isinstance(source, bytes):
+            source = source.encode(sys.getfilesystemencoding() or 'utf-8')
+
+        if self.compression == 'gzip':
+            ptr = new_gzip_source(source, self.parser.chunksize)
+            if ptr == NULL:
+                return 0
+            self.parser.cb_io = &buffer_gzip_bytes
+            self.parser.cb_cleanup = &del_gzip_source
+        elif self.compression == 'bz2':
+            ptr = new_bz2_source(source, self.parser.chunksize)
+            if ptr == NULL:
+                return 0
+            self.parser.cb_io = &buffer_bz2_bytes
+            self.parser.cb_cleanup = &del_bz2_source
+        else:
+            return 0
+
+        self.parser.source = ptr
+        return 1
+
+    cdef _set_byte_range(self, byte_range):
+        cdef:
+            int status
+            int64_t start, stop
+
+        start, stop = byte_range
+
+        if self.parser.cb_io == &buffer_mmap_bytes:
+            status = mmap_set_byte_range(self.parser.source, start, stop)
+        elif self.parser.cb_io == &buffer_file_bytes:
+            status = file_source_set_byte_range(self.parser.source,
+                                                start, stop)
+        else:
+            raise ValueError('byte_range is only supported when reading '
+                             'from an uncompressed file path')
+
+        if status < 0:
+            raise IOError('Invalid byte range: (%d, %d)' % (start, stop))
+
     cdef _get_header(self):
         # header is now a list of lists, so field_count should use header[0]
 
@@ -770,42 +939,52 @@ cdef class TextReader:
             size_t rows_read = 0
             chunks = []
 
-        if rows is None:
-            while True:
-                try:
-                    chunk = self._read_rows(self.buffer_lines, 0)
-                    if len(chunk) == 0:
+        # the date columns are converted once all the chunks are read, so
+        # that the result does not depend on where the chunks end
+        self.defer_dates = True
+        try:
+            if rows is None:
+                while True:
+                    try:
+                        chunk = self._read_rows(self.buffer_lines, 0)
+                        if len(chunk) == 0:
+                            break
+                    except StopIteration:
                         break
-                except StopIteration:
-                    break
-                else:
-                    chunks.append(chunk)
-        else:
-            while rows_read < rows:
-                try:
-                    crows = min(self.buffer_lines, rows - rows_read)
+                    else:
+                        chunks.append(chunk)
+            else:
+                while rows_read < rows:
+                    try:
+                        crows = min(self.buffer_lines, rows - rows_read)
 
-                    chunk = self._read_rows(crows, 0)
-                    if len(chunk) == 0:
-                        break
+                        chunk = self._read_rows(crows, 0)
+                        if len(chunk) == 0:
+                            break
 
-                    rows_read += len(list(chunk.values())[0])
-                except StopIteration:
-                    break
-                else:
-                    chunks.append(chunk)
+                        rows_read += len(list(chunk.values())[0])
+                    except StopIteration:
+                        break
+                    else:
+                        chunks.append(chunk)
+        finally:
+            self.defer_dates = False
 
         parser_trim_buffers(self.parser)
 
         if len(chunks) == 0:
             raise StopIteration
 
+        date_formats = dict((i, fmt) for i, fmt in self.date_formats.items()
+                            if fmt is not False)
+
         # destructive to chunks
-        return _concatenate_chunks(chunks)
+        return _concatenate_chunks(chunks, date_formats)
 
     cdef _tokenize_rows(self, size_t nrows):
         cdef int status
-        status = tokenize_nrows(self.parser, nrows)
+        with nogil:
+            status = tokenize_nrows(self.parser, nrows)
 
         if self.parser.warn_msg != NULL:
             print >> sys.stderr, self.parser.warn_msg
@@ -819,6 +998,7 @@ cdef class TextReader:
         cdef:
             int buffered_lines
             int irows, footer = 0
+            int status
 
         self._start_clock()
 
@@ -832,7 +1012,8 @@ cdef class TextReader:
                 raise ValueError('skip_footer can only be used to read '
                                  'the whole file')
         else:
-            status = tokenize_all_rows(self.parser)
+            with nogil:
+                status = tokenize_all_rows(self.parser)
 
             if self.parser.warn_msg != NULL:
                 print >> sys.stderr, self.parser.warn_msg
@@ -880,6 +1061,17 @@ cdef class TextReader:
     def set_noconvert(self, i):
         self.noconvert.add(i)
 
+    def set_date_format(self, i, date_format=None):
+        """
+        Try to convert column i straight to datetime64[ns] while parsing,
+        either as ISO 8601 or using the strptime-style ``date_format``.
+        Columns which can't be converted this way are returned as strings.
+        """
+        if date_format is not None and not _native_date_format(date_format):
+            date_format = False
+        self.noconvert.add(i)
+        self.date_formats[i] = date_format
+
     def remove_noconvert(self, i):
         self.noconvert.remove(i)
 
@@ -915,7 +1107,12 @@ cdef class TextReader:
             num_cols = (num_cols < self.parser.line_fields[i]) * self.parser.line_fields[i] +\
                 (num_cols >= self.parser.line_fields[i]) * num_cols
 
-        if self.table_width - self.leading_cols > num_cols:
+        if self.parser.usecols != NULL:
+            # only the requested columns are stored
+            if self.usecols_width > num_cols:
+                raise CParserError("Too many columns specified: expected %s and found %s" %
+                    (self.usecols_width, num_cols))
+        elif self.table_width - self.leading_cols > num_cols:
             raise CParserError("Too many columns specified: expected %s and found %s" %
                 (self.table_width - self.leading_cols, num_cols))
 
@@ -989,6 +1186,8 @@ cdef class TextReader:
                     col_dtype = self.dtype[name]
                 elif i in self.dtype:
                     col_dtype = self.dtype[i]
+            elif isinstance(self.dtype, basestring):
+                col_dtype = self.dtype
             else:
                 if self.dtype.names:
                     col_dtype = self.dtype.descr[i][1]
@@ -996,6 +1195,11 @@ cdef class TextReader:
                     col_dtype = self.dtype
 
             if col_dtype is not None:
+                if isinstance(col_dtype, basestring) and col_dtype == 'category':
+                    return _to_categorical(self.parser, i, start, end,
+                                           na_filter, na_hashset,
+                                           self.c_encoding)
+
                 if not isinstance(col_dtype, basestring):
                     if isinstance(col_dtype, np.dtype):
                         col_dtype = col_dtype.str
@@ -1006,6 +1210,17 @@ cdef class TextReader:
                                                 na_filter, 1, na_hashset, na_flist)
 
         if i in self.noconvert:
+            date_format = self.date_formats.get(i, False)
+            if date_format is not False and not self.defer_dates:
+                col_res, na_count = _try_datetime64(self.parser, i, start, end,
+                                                    na_filter, na_hashset,
+                                                    date_format)
+                if col_res is not None:
+                    return col_res, na_count
+
+                # don't keep trying on later chunks
+                self.date_formats[i] = False
+
             return self._string_convert(i, start, end, na_filter, na_hashset)
         else:
             col_res = None
@@ -1408,6 +1623,92 @@ cdef _string_box_decode(parser_t *parser, int col,
 
     return result, na_count
 
+cdef _to_categorical(parser_t *parser, int col,
+                     int line_start, int line_end,
+                     bint na_filter, kh_str_t *na_hashset,
+                     char *encoding):
+    # factorize the tokens, only the distinct values are boxed
+    cdef:
+        int na_count = 0
+        Py_ssize_t i, size, ncats = 0
+        size_t lines
+        coliter_t it
+        char *word
+        ndarray[int64_t] codes
+
+        int ret = 0
+        kh_str_t *table
+
+        char *errors = "strict"
+        list cats = []
+
+        khiter_t k
+
+    from pandas.core.categorical import Categorical
+
+    table = kh_init_str()
+    lines = line_end - line_start
+    codes = np.empty(lines, dtype=np.int64)
+    coliter_setup(&it, parser, col, line_start)
+
+    for i in range(lines):
+        word = COLITER_NEXT(it)
+
+        if na_filter:
+            k = kh_get_str(na_hashset, word)
+            # in the hash table
+            if k != na_hashset.n_buckets:
+                na_count += 1
+                codes[i] = -1
+                continue
+
+        k = kh_get_str(table, word)
+
+        if k == table.n_buckets:
+            if encoding != NULL:
+                size = strlen(word)
+                cats.append(PyUnicode_Decode(word, size, encoding, errors))
+            elif PY3:
+                cats.append(PyUnicode_FromString(word))
+            else:
+                cats.append(PyBytes_FromString(word))
+
+            k = kh_put_str(table, word, &ret)
+            table.vals[k] = ncats
+            ncats += 1
+
+        codes[i] = table.vals[k]
+
+    kh_destroy_str(table)
+
+    categories, codes = _sort_categories(cats, codes)
+    return Categorical.from_codes(codes, categories), na_count
+
+
+def _sort_categories(list cats, ndarray[int64_t] codes):
+    # categories in sorted order, as astype('category') gives them
+    cdef:
+        ndarray categories, indexer, recode
+        ndarray[uint8_t, cast=True] mask
+
+    categories = np.empty(len(cats), dtype=object)
+    categories[:] = cats
+
+    if len(categories) == 0:
+        return categories, codes
+
+    indexer = categories.argsort(kind='mergesort')
+    categories = categories.take(indexer)
+
+    recode = np.empty(len(indexer), dtype=np.int64)
+    recode[indexer] = np.arange(len(indexer))
+
+    mask = codes == -1
+    codes = recode.take(codes)
+    codes[mask] = -1
+
+    return categories, codes
+
 
 cdef _to_fw_string(parser_t *parser, int col, int line_start,
                    int line_end, size_t width):
@@ -1658,6 +1959,218 @@ cdef _try_bool_flex(parser_t *parser, int col, int line_start, int line_end,
 
     return result.view(np.bool_), na_count
 
+# strptime directives handled by _parse_date_format
+_native_date_directives = re.compile('%[YmdHMSf%]')
+
+
+def _native_date_format(date_format):
+    return '%' not in _native_date_directives.sub('', date_format)
+
+
+cdef char* cnat = b'NaT'
+
+cdef int _parse_date_word(char *word, char *fmt, int64_t *value):
+    """
+    Parse word as ISO 8601, or using fmt if it is not NULL, to nanoseconds
+    since the epoch. Returns -1 on failure.
+    """
+    cdef:
+        int status, out_local = 0, out_tzoffset = 0
+        pandas_datetimestruct dts
+
+    if fmt != NULL:
+        status = _parse_date_format(word, fmt, &dts)
+    else:
+        status = _cstring_to_dts(word, strlen(word), &dts,
+                                 &out_local, &out_tzoffset)
+
+    # leave anything unparseable or out of the nanosecond bounds to the
+    # slower, more thorough python-level conversion
+    if status < 0 or dts.year < 1678 or dts.year > 2261:
+        return -1
+
+    value[0] = pandas_datetimestruct_to_datetime(PANDAS_FR_ns, &dts)
+
+    if out_local == 1:
+        # to UTC
+        value[0] -= out_tzoffset * 60000000000LL
+
+    return 0
+
+
+cdef _try_datetime64(parser_t *parser, int col, int line_start, int line_end,
+                     bint na_filter, kh_str_t *na_hashset,
+                     object date_format):
+    cdef:
+        int na_count = 0
+        size_t i, lines
+        coliter_t it
+        char *word
+        char *fmt = NULL
+        int64_t *data
+        ndarray result
+
+        int64_t NaT = INT64_MIN
+        khiter_t k
+
+    if date_format is not None:
+        date_format = _ensure_encoded([date_format])[0]
+        fmt = date_format
+
+    lines = line_end - line_start
+    result = np.empty(lines, dtype=np.int64)
+    data = <int64_t *> result.data
+    coliter_setup(&it, parser, col, line_start)
+
+    for i in range(lines):
+        word = COLITER_NEXT(it)
+
+        if na_filter:
+            k = kh_get_str(na_hashset, word)
+            # in the hash table
+            if k != na_hashset.n_buckets:
+                na_count += 1
+                data[i] = NaT
+                continue
+
+        if word[0] == 0 or strcmp(word, cnat) == 0:
+            na_count += 1
+            data[i] = NaT
+            continue
+
+        if _parse_date_word(word, fmt, &data[i]) < 0:
+            return None, None
+
+    return result.view('M8[ns]'), na_count
+
+
+def _try_datetime64_objects(ndarray[object] values, object date_format):
+    """
+    Convert the strings of a date column read in chunks the way the
+    tokenizer converts a whole column, or return None if a value can't be
+    """
+    cdef:
+        Py_ssize_t i, n = len(values)
+        char *fmt = NULL
+        int64_t *data
+        ndarray result
+        object val
+
+        int64_t NaT = INT64_MIN
+
+    if date_format is not None:
+        if not _native_date_format(date_format):
+            return None
+        date_format = _ensure_encoded([date_format])[0]
+        fmt = date_format
+
+    result = np.empty(n, dtype=np.int64)
+    data = <int64_t *> result.data
+
+    for i in range(n):
+        val = values[i]
+
+        # the missing values of the string conversion
+        if val is None or (isinstance(val, float) and val != val):
+            data[i] = NaT
+            continue
+
+        if PyUnicode_Check(val):
+            val = PyUnicode_AsUTF8String(val)
+        elif not PyBytes_Check(val):
+            return None
+
+        if len(val) == 0 or val == b'NaT':
+            data[i] = NaT
+            continue
+
+        if _parse_date_word(PyBytes_AsString(val), fmt, &data[i]) < 0:
+            return None
+
+    return result.view('M8[ns]')
+
+
+cdef int _parse_date_format(char *word, char *fmt,
+                            pandas_datetimestruct *dts):
+    """
+    Parse word using a strptime-style format made up of literal characters
+    and the %Y, %m, %d, %H, %M, %S, %f and %% directives. Returns -1 on
+    failure.
+    """
+    cdef:
+        char directive
+        int value, ndigits, maxdigits
+
+    dts.year = 1970
+    dts.month = dts.day = 1
+    dts.hour = dts.min = dts.sec = dts.us = 0
+    dts.ps = dts.as = 0
+
+    while fmt[0] != 0:
+        if fmt[0] != c'%':
+            if word[0] != fmt[0]:
+                return -1
+            word += 1
+            fmt += 1
+            continue
+
+        directive = fmt[1]
+        fmt += 2
+
+        if directive == c'%':
+            if word[0] != c'%':
+                return -1
+            word += 1
+            continue
+        elif directive == c'Y':
+            maxdigits = 4
+        elif directive == c'f':
+            maxdigits = 6
+        else:
+            maxdigits = 2
+
+        value = ndigits = 0
+        while ndigits < maxdigits and c'0' <= word[0] <= c'9':
+            value = value * 10 + (word[0] - c'0')
+            word += 1
+            ndigits += 1
+
+        if ndigits == 0:
+            return -1
+
+        if directive == c'Y':
+            dts.year = value
+        elif directive == c'm':
+            dts.month = value
+        elif directive == c'd':
+            dts.day = value
+        elif directive == c'H':
+            dts.hour = value
+        elif directive == c'M':
+            dts.min = value
+        elif directive == c'S':
+            dts.sec = value
+        elif directive == c'f':
+            # fraction of a second, right-padded to microseconds
+            while ndigits < 6:
+                value *= 10
+                ndigits += 1
+            dts.us = value
+        else:
+            return -1
+
+    # trailing characters
+    if word[0] != 0:
+        return -1
+
+    if (dts.month < 1 or dts.month > 12 or dts.day < 1 or
+        dts.day > days_per_month_table[is_leapyear(dts.year)][dts.month - 1] or
+        dts.hour > 23 or dts.min > 59 or dts.sec > 59):
+        return -1
+
+    return 0
+
+
 cdef _get_na_mask(parser_t *parser, int col, int line_start, int line_end,
                   kh_str_t *na_hashset):
     cdef:
@@ -1798,7 +2311,12 @@ def downcast_int64(ndarray[int64_t] arr, bint use_unsigned=0):
     return arr
 
 
-def _concatenate_chunks(list chunks):
+def _concatenate_chunks(list chunks, dict date_formats=None):
+    """
+    Concatenate the columns of chunks read separately. date_formats maps
+    the date columns, read as strings, to the format to convert them with
+    once they are whole; columns which can't be converted stay strings.
+    """
     cdef:
         list names = list(chunks[0].keys())
         object name
@@ -1806,10 +2324,16 @@ def _concatenate_chunks(list chunks):
         object warning_names
         object common_type
 
+    if date_formats is None:
+        date_formats = {}
+
     result = {}
     warning_columns = list()
     for name in names:
         arrs = [chunk.pop(name) for chunk in chunks]
+        if any(_is_categorical(a) for a in arrs):
+            result[name] = _concatenate_categoricals(arrs)
+            continue
         # Check each arr for consistent types.
         dtypes = set([a.dtype for a in arrs])
         if len(dtypes) > 1:
@@ -1818,6 +2342,11 @@ def _concatenate_chunks(list chunks):
                 warning_columns.append(str(name))
         result[name] = np.concatenate(arrs)
 
+        if name in date_formats and result[name].dtype == np.object_:
+            dates = _try_datetime64_objects(result[name], date_formats[name])
+            if dates is not None:
+                result[name] = dates
+
     if warning_columns:
         warning_names = ','.join(warning_columns)
         warning_message = " ".join(["Columns (%s) have mixed types." % warning_names,
@@ -1826,6 +2355,32 @@ def _concatenate_chunks(list chunks):
         warnings.warn(warning_message, DtypeWarning)
     return result
 
+
+cdef inline bint _is_categorical(object arr):
+    return getattr(arr.dtype, 'name', None) == 'category'
+
+
+def _concatenate_categoricals(list arrs):
+    # merge the category sets of the chunks and recode each chunk
+    from pandas.core.categorical import Categorical
+
+    categories = np.unique(np.concatenate([np.asarray(a.categories,
+                                                      dtype=object)
+                                           for a in arrs]))
+
+    codes = []
+    for a in arrs:
+        recode = categories.searchsorted(np.asarray(a.categories,
+                                                    dtype=object))
+        chunk_codes = np.asarray(a.codes, dtype=np.int64)
+        if len(recode):
+            mask = chunk_codes == -1
+            chunk_codes = recode.take(chunk_codes)
+            chunk_codes[mask] = -1
+        codes.append(chunk_codes)
+
+    return Categorical.from_codes(np.concatenate(codes), categories)
+
 #----------------------------------------------------------------------
 
 # NA values
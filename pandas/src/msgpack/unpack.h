@@ -26,6 +26,9 @@ typedef struct unpack_user {
     PyObject *list_hook;
     const char *encoding;
     const char *unicode_errors;
+    PyObject *raw_view_hook;
+    const char *raw_view_prefix;
+    Py_ssize_t raw_view_prefix_len;
 } unpack_user;
 
 
@@ -221,7 +224,14 @@ static inline int template_callback_map_end(unpack_user* u, msgpack_unpack_objec
 static inline int template_callback_raw(unpack_user* u, const char* b, const char* p, unsigned int l, msgpack_unpack_object* o)
 {
     PyObject *py;
-    if(u->encoding) {
+    if(u->raw_view_hook && (Py_ssize_t)l >= u->raw_view_prefix_len &&
+       memcmp(p, u->raw_view_prefix, u->raw_view_prefix_len) == 0) {
+        /* pass the location of the data in the buffer to the hook, which
+           returns a view of it instead of a copy */
+        py = PyObject_CallFunction(u->raw_view_hook, "nn",
+                                   (Py_ssize_t)(p - b) + u->raw_view_prefix_len,
+                                   (Py_ssize_t)l - u->raw_view_prefix_len);
+    } else if(u->encoding) {
         py = PyUnicode_Decode(p, l, u->encoding, u->unicode_errors);
     } else {
         py = PyBytes_FromStringAndSize(p, l);
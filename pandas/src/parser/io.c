@@ -16,6 +16,8 @@ void *new_file_source(char *fname, size_t buffer_size) {
     setbuf(fs->fp, NULL);
 
     fs->initial_file_pos = ftell(fs->fp);
+    fs->position = fs->initial_file_pos;
+    fs->end_pos = -1;
 
     // Only allocate this heap memory if we are not memory-mapping the file
     fs->buffer = (char*) malloc((buffer_size + 1) * sizeof(char));
@@ -83,6 +85,30 @@ int del_rd_source(void *rds) {
     return 0;
 }
 
+/*
+
+  Restrict a source to the half-open byte range [start, stop), so that
+  several parsers can tokenize disjoint pieces of the same file
+
+ */
+
+int file_source_set_byte_range(void *source, int64_t start, int64_t stop) {
+    file_source *src = FS(source);
+
+    if (start < 0 || stop < start) {
+        return -1;
+    }
+
+    if (fseek(src->fp, (long) start, SEEK_SET) != 0) {
+        return -1;
+    }
+
+    src->position = (off_t) start;
+    src->end_pos = (off_t) stop;
+
+    return 0;
+}
+
 /*
 
   IO callbacks
@@ -94,8 +120,14 @@ void* buffer_file_bytes(void *source, size_t nbytes,
                         size_t *bytes_read, int *status) {
     file_source *src = FS(source);
 
+    if (src->end_pos >= 0 && src->position + (off_t) nbytes > src->end_pos) {
+        // fewer than nbytes remaining in the byte range
+        nbytes = src->end_pos - src->position;
+    }
+
     *bytes_read = fread((void*) src->buffer, sizeof(char), nbytes,
                         src->fp);
+    src->position += *bytes_read;
 
     if (*bytes_read == 0) {
         *status = REACHED_EOF;
@@ -118,11 +150,14 @@ void* buffer_rd_bytes(void *source, size_t nbytes,
     size_t length;
     rd_source *src = RDS(source);
 
+    /* the tokenizer may have released the GIL */
+    state = PyGILState_Ensure();
+
     /* delete old object */
     Py_XDECREF(src->buffer);
+    src->buffer = NULL;
     args = Py_BuildValue("(i)", nbytes);
 
-    state = PyGILState_Ensure();
     func = PyObject_GetAttrString(src->obj, "read");
     /* printf("%s\n", PyBytes_AsString(PyObject_Repr(func))); */
 
@@ -165,6 +200,269 @@ void* buffer_rd_bytes(void *source, size_t nbytes,
 }
 
 
+/*
+
+  On-disk FILE, gzip compressed
+
+ */
+
+#ifdef HAVE_ZLIB
+
+void *new_gzip_source(char *fname, size_t buffer_size) {
+    gzip_source *gzs = (gzip_source *) malloc(sizeof(gzip_source));
+
+    if (gzs == NULL) {
+        return NULL;
+    }
+
+    gzs->gz = gzopen(fname, "rb");
+
+    if (gzs->gz == NULL) {
+        free(gzs);
+        return NULL;
+    }
+
+    /* gzread passes anything without a gzip header through as is; leave
+       those files to GzipFile, which rejects them */
+    if (gzdirect(gzs->gz)) {
+        gzclose(gzs->gz);
+        free(gzs);
+        return NULL;
+    }
+
+    gzs->buffer = (char*) malloc((buffer_size + 1) * sizeof(char));
+
+    if (gzs->buffer == NULL) {
+        gzclose(gzs->gz);
+        free(gzs);
+        return NULL;
+    }
+
+    gzs->buffer[buffer_size] = '\0';
+
+    return (void *) gzs;
+}
+
+int del_gzip_source(void *gzs) {
+    if (gzs == NULL)
+        return 0;
+
+    free(GZS(gzs)->buffer);
+    gzclose(GZS(gzs)->gz);
+    free(gzs);
+
+    return 0;
+}
+
+void* buffer_gzip_bytes(void *source, size_t nbytes,
+                        size_t *bytes_read, int *status) {
+    gzip_source *src = GZS(source);
+    int nread, errnum;
+
+    /* gzread transparently handles concatenated gzip members */
+    nread = gzread(src->gz, (void*) src->buffer, (unsigned) nbytes);
+
+    if (nread < 0) {
+        *bytes_read = 0;
+        *status = DECOMPRESSION_FAILED;
+        return NULL;
+    }
+
+    *bytes_read = (size_t) nread;
+
+    if (nread == 0) {
+        /* a truncated stream returns what it could decompress, then ends
+           with Z_BUF_ERROR ("unexpected end of file") */
+        gzerror(src->gz, &errnum);
+        if (errnum != Z_OK) {
+            *status = DECOMPRESSION_FAILED;
+            return NULL;
+        }
+        *status = REACHED_EOF;
+    } else {
+        *status = 0;
+    }
+
+    return (void*) src->buffer;
+}
+
+#else
+
+void *new_gzip_source(char *fname, size_t buffer_size) {
+    return NULL;
+}
+
+int del_gzip_source(void *src) {
+    return 0;
+}
+
+void* buffer_gzip_bytes(void *source, size_t nbytes,
+                        size_t *bytes_read, int *status) {
+    *bytes_read = 0;
+    *status = DECOMPRESSION_FAILED;
+    return NULL;
+}
+
+#endif
+
+
+/*
+
+  On-disk FILE, bzip2 compressed
+
+ */
+
+#ifdef HAVE_BZLIB
+
+void *new_bz2_source(char *fname, size_t buffer_size) {
+    int bzerror;
+    bz2_source *bzs = (bz2_source *) malloc(sizeof(bz2_source));
+
+    if (bzs == NULL) {
+        return NULL;
+    }
+
+    bzs->fp = fopen(fname, "rb");
+
+    if (bzs->fp == NULL) {
+        free(bzs);
+        return NULL;
+    }
+
+    bzs->bzf = BZ2_bzReadOpen(&bzerror, bzs->fp, 0, 0, NULL, 0);
+    if (bzerror != BZ_OK) {
+        BZ2_bzReadClose(&bzerror, bzs->bzf);
+        fclose(bzs->fp);
+        free(bzs);
+        return NULL;
+    }
+
+    bzs->buffer = (char*) malloc((buffer_size + 1) * sizeof(char));
+
+    if (bzs->buffer == NULL) {
+        BZ2_bzReadClose(&bzerror, bzs->bzf);
+        fclose(bzs->fp);
+        free(bzs);
+        return NULL;
+    }
+
+    bzs->buffer[buffer_size] = '\0';
+    bzs->eof = 0;
+
+    return (void *) bzs;
+}
+
+int del_bz2_source(void *bzs) {
+    int bzerror;
+
+    if (bzs == NULL)
+        return 0;
+
+    if (BZS(bzs)->bzf != NULL) {
+        BZ2_bzReadClose(&bzerror, BZS(bzs)->bzf);
+    }
+    free(BZS(bzs)->buffer);
+    fclose(BZS(bzs)->fp);
+    free(bzs);
+
+    return 0;
+}
+
+/*
+  Start decompressing the next stream of a multi-stream file (as written by
+  e.g. pbzip2), returns 1 if there is none.
+ */
+
+static int bz2_next_stream(bz2_source *src, int *bzerror) {
+    void *unused;
+    int nunused, c;
+    char unused_copy[BZ_MAX_UNUSED];
+
+    BZ2_bzReadGetUnused(bzerror, src->bzf, &unused, &nunused);
+    if (*bzerror != BZ_OK) {
+        return -1;
+    }
+
+    memcpy(unused_copy, unused, nunused);
+    BZ2_bzReadClose(bzerror, src->bzf);
+    src->bzf = NULL;
+
+    if (nunused == 0) {
+        c = fgetc(src->fp);
+        if (c == EOF) {
+            return 1;
+        }
+        ungetc(c, src->fp);
+    }
+
+    src->bzf = BZ2_bzReadOpen(bzerror, src->fp, 0, 0, unused_copy, nunused);
+    if (*bzerror != BZ_OK) {
+        return -1;
+    }
+
+    return 0;
+}
+
+void* buffer_bz2_bytes(void *source, size_t nbytes,
+                       size_t *bytes_read, int *status) {
+    bz2_source *src = BZS(source);
+    int bzerror, nread, result;
+    size_t total = 0;
+
+    while (total < nbytes && !src->eof) {
+        nread = BZ2_bzRead(&bzerror, src->bzf, src->buffer + total,
+                           (int) (nbytes - total));
+
+        if (bzerror != BZ_OK && bzerror != BZ_STREAM_END) {
+            *bytes_read = 0;
+            *status = DECOMPRESSION_FAILED;
+            return NULL;
+        }
+
+        total += nread;
+
+        if (bzerror == BZ_STREAM_END) {
+            result = bz2_next_stream(src, &bzerror);
+            if (result < 0) {
+                *bytes_read = 0;
+                *status = DECOMPRESSION_FAILED;
+                return NULL;
+            }
+            src->eof = result;
+        }
+    }
+
+    *bytes_read = total;
+
+    if (total == 0) {
+        *status = REACHED_EOF;
+    } else {
+        *status = 0;
+    }
+
+    return (void*) src->buffer;
+}
+
+#else
+
+void *new_bz2_source(char *fname, size_t buffer_size) {
+    return NULL;
+}
+
+int del_bz2_source(void *src) {
+    return 0;
+}
+
+void* buffer_bz2_bytes(void *source, size_t nbytes,
+                       size_t *bytes_read, int *status) {
+    *bytes_read = 0;
+    *status = DECOMPRESSION_FAILED;
+    return NULL;
+}
+
+#endif
+
+
 #ifdef HAVE_MMAP
 
 #include <sys/stat.h>
@@ -259,6 +557,19 @@ void* buffer_mmap_bytes(void *source, size_t nbytes,
     return retval;
 }
 
+int mmap_set_byte_range(void *source, int64_t start, int64_t stop) {
+    memory_map *src = MM(source);
+
+    if (start < 0 || stop < start || stop > src->size) {
+        return -1;
+    }
+
+    src->position = (off_t) start;
+    src->last_pos = (off_t) stop;
+
+    return 0;
+}
+
 #else
 
 /* kludgy */
@@ -278,4 +589,8 @@ void* buffer_mmap_bytes(void *source, size_t nbytes,
   return NULL;
 }
 
+int mmap_set_byte_range(void *source, int64_t start, int64_t stop) {
+  return -1;
+}
+
 #endif
@@ -25,6 +25,12 @@ typedef struct _file_source {
     /* Pointer to the buffer. */
     // char *buffer;
 
+    /* Current offset in the file. */
+    off_t position;
+
+    /* Offset at which to stop reading, or -1 to read until EOF. */
+    off_t end_pos;
+
 } file_source;
 
 #define FS(source) ((file_source *)source)
@@ -61,6 +67,8 @@ int del_mmap(void *src);
 void* buffer_mmap_bytes(void *source, size_t nbytes,
                         size_t *bytes_read, int *status);
 
+int mmap_set_byte_range(void *src, int64_t start, int64_t stop);
+
 
 typedef struct _rd_source {
     PyObject* obj;
@@ -77,9 +85,52 @@ void *new_rd_source(PyObject *obj);
 int del_file_source(void *src);
 int del_rd_source(void *src);
 
+int file_source_set_byte_range(void *src, int64_t start, int64_t stop);
+
 void* buffer_file_bytes(void *source, size_t nbytes,
                         size_t *bytes_read, int *status);
 
 void* buffer_rd_bytes(void *source, size_t nbytes,
                       size_t *bytes_read, int *status);
 
+
+/*
+  On-disk compressed FILE, decompressed natively. Only available when
+  compiled with HAVE_ZLIB / HAVE_BZLIB, otherwise the constructors return
+  NULL and the caller has to fall back to decompressing in Python.
+ */
+
+#ifdef HAVE_ZLIB
+#include <zlib.h>
+
+typedef struct _gzip_source {
+    gzFile gz;
+    char *buffer;
+} gzip_source;
+
+#define GZS(source) ((gzip_source *)source)
+#endif
+
+#ifdef HAVE_BZLIB
+#include <bzlib.h>
+
+typedef struct _bz2_source {
+    FILE *fp;
+    BZFILE *bzf;
+    char *buffer;
+    int eof;
+} bz2_source;
+
+#define BZS(source) ((bz2_source *)source)
+#endif
+
+void *new_gzip_source(char *fname, size_t buffer_size);
+int del_gzip_source(void *src);
+void* buffer_gzip_bytes(void *source, size_t nbytes,
+                        size_t *bytes_read, int *status);
+
+void *new_bz2_source(char *fname, size_t buffer_size);
+int del_bz2_source(void *src);
+void* buffer_bz2_bytes(void *source, size_t nbytes,
+                       size_t *bytes_read, int *status);
+
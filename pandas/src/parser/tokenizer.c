@@ -68,6 +68,9 @@ static void *safe_realloc(void *buffer, size_t size) {
 
 void coliter_setup(coliter_t *self, parser_t *parser, int i, int start) {
     // column i, starting at 0
+    if (parser->usecols != NULL && i < parser->usecols_len) {
+        i = parser->usecols_map[i];
+    }
     self->words = parser->words;
     self->col = i;
     self->line_start = parser->line_start + start;
@@ -157,6 +160,21 @@ void parser_set_default_options(parser_t *self) {
 
     self->skipset = NULL;
     self->skip_footer = 0;
+
+    self->usecols = NULL;
+    self->usecols_len = 0;
+    self->usecols_map = NULL;
+
+    self->fw_nfields = 0;
+    self->fw_starts = NULL;
+    self->fw_ends = NULL;
+    self->fw_utf8 = 0;
+    self->fw_fill = NULL;
+    self->fw_line = NULL;
+    self->fw_line_len = 0;
+    self->fw_line_cap = 0;
+    self->fw_offsets = NULL;
+    self->fw_offsets_cap = 0;
 }
 
 int get_parser_memory_footprint(parser_t *self) {
@@ -199,6 +217,23 @@ int parser_cleanup(parser_t *self) {
     if (self->skipset != NULL)
         kh_destroy_int64((kh_int64_t*) self->skipset);
 
+    free_if_not_null(self->usecols);
+    free_if_not_null(self->usecols_map);
+    self->usecols = NULL;
+    self->usecols_map = NULL;
+
+    free_if_not_null(self->fw_starts);
+    free_if_not_null(self->fw_ends);
+    free_if_not_null(self->fw_fill);
+    free_if_not_null(self->fw_line);
+    free_if_not_null(self->fw_offsets);
+    self->fw_starts = NULL;
+    self->fw_ends = NULL;
+    self->fw_fill = NULL;
+    self->fw_line = NULL;
+    self->fw_offsets = NULL;
+    self->fw_nfields = 0;
+
     return 0;
 }
 
@@ -241,6 +276,8 @@ int parser_init(parser_t *self) {
     self->lines_cap = sz;
     self->lines = 0;
     self->file_lines = 0;
+    self->raw_fields = 0;
+    self->prev_raw_fields = 0;
 
     if (self->stream == NULL || self->words == NULL ||
         self->word_starts == NULL || self->line_start == NULL ||
@@ -383,9 +420,18 @@ static int push_char(parser_t *self, char c) {
 }
 
 static int P_INLINE end_field(parser_t *self) {
+    int col = self->raw_fields++;
+
     // XXX cruft
     self->numeric_field = 0;
 
+    if (self->usecols != NULL &&
+        (col >= self->usecols_len || !self->usecols[col])) {
+        // not a selected column, drop the token from the stream
+        self->stream_len = self->word_start;
+        return 0;
+    }
+
     // null terminate token
     push_char(self, '\0');
 
@@ -427,20 +473,24 @@ static void append_warning(parser_t *self, const char *msg) {
 }
 
 static int end_line(parser_t *self) {
-    int fields;
+    int fields, raw_fields;
     khiter_t k;  /* for hash set detection */
     int ex_fields = self->expected_fields;
     char *msg;
 
+    // fields stored for this line, and all the fields seen on it (these
+    // only differ when usecols is set)
     fields = self->line_fields[self->lines];
+    raw_fields = self->raw_fields;
+    self->raw_fields = 0;
 
-    TRACE(("Line end, nfields: %d\n", fields));
+    TRACE(("Line end, nfields: %d\n", raw_fields));
 
     if (self->lines > 0) {
         if (self->expected_fields >= 0) {
             ex_fields = self->expected_fields;
         } else {
-            ex_fields = self->line_fields[self->lines - 1];
+            ex_fields = self->prev_raw_fields;
         }
     }
 
@@ -464,7 +514,7 @@ static int end_line(parser_t *self) {
     /* printf("Line: %d, Fields: %d, Ex-fields: %d\n", self->lines, fields, ex_fields); */
 
     if (!(self->lines <= self->header_end + 1)
-        && (self->expected_fields < 0 && fields > ex_fields)) {
+        && (self->expected_fields < 0 && raw_fields > ex_fields)) {
         // increment file line count
         self->file_lines++;
 
@@ -479,9 +529,9 @@ static int end_line(parser_t *self) {
         if (self->error_bad_lines) {
             self->error_msg = (char*) malloc(100);
             sprintf(self->error_msg, "Expected %d fields in line %d, saw %d\n",
-                    ex_fields, self->file_lines, fields);
+                    ex_fields, self->file_lines, raw_fields);
 
-            TRACE(("Error at line %d, %d fields\n", self->file_lines, fields));
+            TRACE(("Error at line %d, %d fields\n", self->file_lines, raw_fields));
 
             return -1;
         } else {
@@ -490,7 +540,7 @@ static int end_line(parser_t *self) {
                 // pass up error message
                 msg = (char*) malloc(100);
                 sprintf(msg, "Skipping line %d: expected %d fields, saw %d\n",
-                        self->file_lines, ex_fields, fields);
+                        self->file_lines, ex_fields, raw_fields);
                 append_warning(self, msg);
                 free(msg);
             }
@@ -498,21 +548,27 @@ static int end_line(parser_t *self) {
     }
     else {
         /* missing trailing delimiters */
-        if ((self->lines >= self->header_end + 1) && fields < ex_fields) {
+        if ((self->lines >= self->header_end + 1) && raw_fields < ex_fields) {
 
             /* Might overrun the buffer when closing fields */
-            if (make_stream_space(self, ex_fields - fields) < 0) {
+            if (make_stream_space(self, ex_fields - raw_fields) < 0) {
                 self->error_msg = "out of memory";
                 return -1;
             }
 
-            while (fields < ex_fields){
+            self->raw_fields = raw_fields;
+            while (raw_fields < ex_fields){
                 end_field(self);
                 /* printf("Prior word: %s\n", self->words[self->words_len - 2]); */
-                fields++;
+                raw_fields++;
             }
+            self->raw_fields = 0;
+
+            fields = self->line_fields[self->lines];
         }
 
+        self->prev_raw_fields = raw_fields;
+
         // increment both line counts
         self->file_lines++;
 
@@ -539,6 +595,87 @@ static int end_line(parser_t *self) {
 
 
 
+/*
+  Only store the fields j with usecols[j] != 0 from now on. Lines from
+  start_line onwards which have already been tokenized are compacted in
+  place, earlier (header) lines are kept as they are.
+ */
+
+int parser_set_usecols(parser_t *self, char *usecols, int usecols_len,
+                       int start_line) {
+    int i, j, n, start, word, nstored;
+
+    self->usecols = (char*) malloc(usecols_len * sizeof(char));
+    self->usecols_map = (int*) malloc(usecols_len * sizeof(int));
+    if (self->usecols == NULL || self->usecols_map == NULL) {
+        free_if_not_null(self->usecols);
+        free_if_not_null(self->usecols_map);
+        self->usecols = NULL;
+        self->usecols_map = NULL;
+        return PARSER_OUT_OF_MEMORY;
+    }
+
+    memcpy(self->usecols, usecols, usecols_len);
+    self->usecols_len = usecols_len;
+
+    nstored = 0;
+    for (j = 0; j < usecols_len; ++j) {
+        self->usecols_map[j] = usecols[j] ? nstored++ : -1;
+    }
+
+    if (start_line > self->lines) {
+        return 0;
+    }
+
+    // including the line in progress
+    word = self->line_start[start_line];
+    for (i = start_line; i <= self->lines; ++i) {
+        start = self->line_start[i];
+        n = self->line_fields[i];
+
+        self->line_start[i] = word;
+        nstored = 0;
+
+        for (j = 0; j < n && j < usecols_len; ++j) {
+            if (usecols[j]) {
+                self->words[word] = self->words[start + j];
+                self->word_starts[word] = self->word_starts[start + j];
+                word++;
+                nstored++;
+            }
+        }
+
+        self->line_fields[i] = nstored;
+    }
+
+    self->words_len = word;
+
+    return 0;
+}
+
+/*
+  Switch the parser to fixed-width mode, see the fw_* fields of parser_t
+ */
+
+int parser_set_colspecs(parser_t *self, int *starts, int *ends, int nfields,
+                        char *fill, int utf8) {
+    self->fw_starts = (int*) malloc(nfields * sizeof(int));
+    self->fw_ends = (int*) malloc(nfields * sizeof(int));
+    self->fw_fill = strdup(fill);
+
+    if (self->fw_starts == NULL || self->fw_ends == NULL ||
+        self->fw_fill == NULL) {
+        return PARSER_OUT_OF_MEMORY;
+    }
+
+    memcpy(self->fw_starts, starts, nfields * sizeof(int));
+    memcpy(self->fw_ends, ends, nfields * sizeof(int));
+    self->fw_nfields = nfields;
+    self->fw_utf8 = utf8;
+
+    return 0;
+}
+
 int parser_add_skiprow(parser_t *self, int64_t row) {
     khiter_t k;
     kh_int64_t *set;
@@ -572,6 +709,8 @@ static int parser_buffer_bytes(parser_t *self, size_t nbytes) {
         if (status == CALLING_READ_FAILED) {
             sprintf(self->error_msg, ("Calling read(nbytes) on source failed. "
                                       "Try engine='python'."));
+        } else if (status == DECOMPRESSION_FAILED) {
+            sprintf(self->error_msg, "Error decompressing data from source");
         } else {
             sprintf(self->error_msg, "Unknown error in IO callback");
         }
@@ -1532,8 +1671,202 @@ linelimit:
 }
 
 
+/*
+
+  Fixed-width mode: a line is collected in fw_line, and cut into fields
+  when it ends.
+
+*/
+
+static int fw_push_char(parser_t *self, char c) {
+    int cap;
+    char *line;
+
+    if (self->fw_line_len == self->fw_line_cap) {
+        cap = self->fw_line_cap ? 2 * self->fw_line_cap : 128;
+        line = (char*) safe_realloc((void*) self->fw_line, cap);
+        if (line == NULL) {
+            self->error_msg = "out of memory";
+            return -1;
+        }
+        self->fw_line = line;
+        self->fw_line_cap = cap;
+    }
+
+    self->fw_line[self->fw_line_len++] = c;
+    return 0;
+}
+
+#define IS_FILL(c) (c != '\0' && strchr(self->fw_fill, c) != NULL)
+
+// bounds of field i in the line, a comment ends the row within the field
+// it appears in
+static int fw_field_bounds(parser_t *self, int i, int nchars,
+                           int *pstart, int *pend) {
+    int start, end, comment = 0;
+    char *line = self->fw_line;
+    char *p;
+
+    start = self->fw_starts[i];
+    end = self->fw_ends[i];
+    if (end < 0 || end > nchars)
+        end = nchars;
+    if (start > end)
+        start = end;
+    if (self->fw_utf8) {
+        start = self->fw_offsets[start];
+        end = self->fw_offsets[end];
+    }
+
+    if (self->commentchar != '\0' && end > start) {
+        p = (char*) memchr(line + start, self->commentchar, end - start);
+        if (p != NULL) {
+            end = p - line;
+            comment = 1;
+        }
+    }
+
+    while (start < end && IS_FILL(line[start]))
+        start++;
+    while (end > start && IS_FILL(line[end - 1]))
+        end--;
+
+    *pstart = start;
+    *pend = end;
+    return comment;
+}
+
+static int fw_end_line(parser_t *self) {
+    int i, j, start, end, nchars, comment;
+    int len = self->fw_line_len;
+    char *line = self->fw_line;
+    int *offsets;
+
+    self->fw_line_len = 0;
+
+    if (self->fw_utf8) {
+        // byte offset of each character, and of the end of the line
+        if (len + 1 > self->fw_offsets_cap) {
+            offsets = (int*) safe_realloc((void*) self->fw_offsets,
+                                          (len + 1) * sizeof(int));
+            if (offsets == NULL) {
+                self->error_msg = "out of memory";
+                return -1;
+            }
+            self->fw_offsets = offsets;
+            self->fw_offsets_cap = len + 1;
+        }
+
+        nchars = 0;
+        for (j = 0; j < len; ++j) {
+            if ((line[j] & 0xC0) != 0x80) {
+                self->fw_offsets[nchars++] = j;
+            }
+        }
+        self->fw_offsets[nchars] = len;
+    } else {
+        nchars = len;
+    }
+
+    // as with the python parser, a blank row is only dropped when it
+    // consists of a single field
+    if (self->skip_empty_lines) {
+        comment = fw_field_bounds(self, 0, nchars, &start, &end);
+        if (start == end && (comment || self->fw_nfields == 1)) {
+            self->file_lines++;
+            return 0;
+        }
+    }
+
+    for (i = 0; i < self->fw_nfields; ++i) {
+        comment = fw_field_bounds(self, i, nchars, &start, &end);
+
+        if (make_stream_space(self, end - start + 1) < 0) {
+            self->error_msg = "out of memory";
+            return -1;
+        }
+
+        for (j = start; j < end; ++j)
+            push_char(self, line[j]);
+
+        if (end_field(self) < 0)
+            return -1;
+
+        if (comment)
+            break;
+    }
+
+    return end_line(self);
+}
+
+int tokenize_fixed_width(parser_t *self, size_t line_limit)
+{
+    int i, start_lines;
+    char c;
+    char *buf = self->data + self->datapos;
+
+    start_lines = self->lines;
+
+    for (i = self->datapos; i < self->datalen; ++i)
+    {
+        // Next character in file
+        c = *buf++;
+
+        TRACE(("Iter: %d Char: %c Line %d field_count %d, state %d\n",
+               i, c, self->file_lines + 1, self->line_fields[self->lines],
+               self->state));
+
+        switch(self->state) {
+
+        case EAT_CRNL_NOP:
+            self->state = START_RECORD;
+            if (c == '\n')
+                break;
+            /* fallthru */
+
+        case START_RECORD:
+        case IN_FIELD:
+            if (c == '\n' || c == '\r') {
+                if (fw_end_line(self) < 0)
+                    goto parsingerror;
+
+                self->state = (c == '\r') ? EAT_CRNL_NOP : START_RECORD;
+                if (line_limit > 0 && self->lines == start_lines + line_limit)
+                    goto linelimit;
+            } else {
+                if (fw_push_char(self, c) < 0)
+                    goto parsingerror;
+                self->state = IN_FIELD;
+            }
+            break;
+
+        default:
+            break;
+        }
+    }
+
+    self->datapos = i;
+    return 0;
+
+parsingerror:
+    self->datapos = i + 1;
+    return -1;
+
+linelimit:
+    self->datapos = i + 1;
+    return 0;
+}
+
+
 static int parser_handle_eof(parser_t *self) {
     TRACE(("handling eof, datalen: %d, pstate: %d\n", self->datalen, self->state))
+    if (self->fw_nfields > 0 && self->datalen == 0) {
+        // close out a last line without a line terminator
+        if (self->state == IN_FIELD)
+            return fw_end_line(self);
+        return 0;
+    }
+
     if (self->datalen == 0 && (self->state != START_RECORD)) {
         // test cases needed here
         // TODO: empty field at end of line
@@ -1577,8 +1910,14 @@ int parser_consume_rows(parser_t *self, size_t nrows) {
 
     /* cannot guarantee that nrows + 1 has been observed */
     word_deletions = self->line_start[nrows - 1] + self->line_fields[nrows - 1];
-    char_count = (self->word_starts[word_deletions - 1] +
-                  strlen(self->words[word_deletions - 1]) + 1);
+
+    /* lines may have no stored fields when usecols is set */
+    if (word_deletions > 0) {
+        char_count = (self->word_starts[word_deletions - 1] +
+                      strlen(self->words[word_deletions - 1]) + 1);
+    } else {
+        char_count = 0;
+    }
 
     TRACE(("Deleting %d words, %d chars\n", word_deletions, char_count));
 
@@ -1703,7 +2042,9 @@ int _tokenize_helper(parser_t *self, size_t nrows, int all) {
     int status = 0;
     int start_lines = self->lines;
 
-    if (self->delim_whitespace) {
+    if (self->fw_nfields > 0) {
+        tokenize_bytes = tokenize_fixed_width;
+    } else if (self->delim_whitespace) {
         tokenize_bytes = tokenize_whitespace;
     } else if (self->lineterminator == '\0') {
         tokenize_bytes = tokenize_delimited;
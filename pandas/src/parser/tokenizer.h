@@ -42,6 +42,7 @@ See LICENSE for the license
 
 #define REACHED_EOF 1
 #define CALLING_READ_FAILED 2
+#define DECOMPRESSION_FAILED 3
 
 #ifndef P_INLINE
   #if defined(__GNUC__)
@@ -164,7 +165,7 @@ typedef struct parser_t {
     int word_start;       // position start of current field
 
     int *line_start;      // position in words for start of line
-    int *line_fields;     // Number of fields in each line
+    int *line_fields;     // Number of (stored) fields in each line
     int lines;            // Number of (good) lines observed
     int file_lines;       // Number of file lines observed (including bad or skipped)
     int lines_cap;        // Vector capacity
@@ -211,6 +212,30 @@ typedef struct parser_t {
     char *error_msg;
 
     int skip_empty_lines;
+
+    // column projection: when usecols is set only the fields j with
+    // usecols[j] != 0 are stored, the others are scanned and dropped
+    char *usecols;
+    int usecols_len;
+    int *usecols_map;     // file column -> index among the stored fields
+
+    int raw_fields;       // fields seen in the current line, stored or not
+    int prev_raw_fields;  // fields seen in the last good line
+
+    // fixed-width mode: field i is made of the characters
+    // [fw_starts[i], fw_ends[i]) of the line, fw_ends[i] < 0 meaning
+    // until the end of the line
+    int fw_nfields;
+    int *fw_starts;
+    int *fw_ends;
+    int fw_utf8;          // positions count utf-8 characters, not bytes
+    char *fw_fill;        // characters stripped from both ends of a field
+
+    char *fw_line;        // the line being collected
+    int fw_line_len;
+    int fw_line_cap;
+    int *fw_offsets;      // byte offset of each character of the line
+    int fw_offsets_cap;
 } parser_t;
 
 
@@ -240,6 +265,12 @@ int parser_trim_buffers(parser_t *self);
 
 int parser_add_skiprow(parser_t *self, int64_t row);
 
+int parser_set_usecols(parser_t *self, char *usecols, int usecols_len,
+                       int start_line);
+
+int parser_set_colspecs(parser_t *self, int *starts, int *ends, int nfields,
+                        char *fill, int utf8);
+
 void parser_free(parser_t *self);
 
 void parser_set_default_options(parser_t *self);
@@ -257,6 +257,10 @@ typedef struct __JSONObjectEncoder
   int heap;
   int level;
 
+  /*
+  If true the top level array is written without brackets, one element per line (line-delimited JSON) */
+  int lineDelimited;
+
 } JSONObjectEncoder;
 
 
@@ -666,6 +666,7 @@ void encode(JSOBJ obj, JSONObjectEncoder *enc, const char *name, size_t cbName)
   const char *value;
   char *objName;
   int count;
+  int lines;
   JSOBJ iterObj;
   size_t szlen;
   JSONTypeContext tc;
@@ -729,18 +730,30 @@ void encode(JSOBJ obj, JSONObjectEncoder *enc, const char *name, size_t cbName)
       case JT_ARRAY:
       {
         count = 0;
+        lines = enc->lineDelimited && enc->level == 0;
         enc->iterBegin(obj, &tc);
 
-        Buffer_AppendCharUnchecked (enc, '[');
+        if (!lines)
+        {
+          Buffer_AppendCharUnchecked (enc, '[');
+        }
 
         while (enc->iterNext(obj, &tc))
         {
           if (count > 0)
           {
-            Buffer_AppendCharUnchecked (enc, ',');
+            if (lines)
+            {
+              Buffer_Reserve (enc, 1);
+              Buffer_AppendCharUnchecked (enc, '\n');
+            }
+            else
+            {
+              Buffer_AppendCharUnchecked (enc, ',');
 #ifndef JSON_NO_EXTRA_WHITESPACE
-            Buffer_AppendCharUnchecked (buffer, ' ');
+              Buffer_AppendCharUnchecked (buffer, ' ');
 #endif
+            }
           }
 
           iterObj = enc->iterGetValue(obj, &tc);
@@ -751,7 +764,10 @@ void encode(JSOBJ obj, JSONObjectEncoder *enc, const char *name, size_t cbName)
       }
 
       enc->iterEnd(obj, &tc);
-      Buffer_AppendCharUnchecked (enc, ']');
+      if (!lines)
+      {
+        Buffer_AppendCharUnchecked (enc, ']');
+      }
       break;
   }
 
@@ -1853,7 +1853,7 @@ char *Object_iterGetName(JSOBJ obj, JSONTypeContext *tc, size_t *outLen)
 
 PyObject* objToJSON(PyObject* self, PyObject *args, PyObject *kwargs)
 {
-  static char *kwlist[] = { "obj", "ensure_ascii", "double_precision", "encode_html_chars", "orient", "date_unit", "iso_dates", "default_handler", NULL};
+  static char *kwlist[] = { "obj", "ensure_ascii", "double_precision", "encode_html_chars", "orient", "date_unit", "iso_dates", "default_handler", "lines", NULL};
 
   char buffer[65536];
   char *ret;
@@ -1866,6 +1866,7 @@ PyObject* objToJSON(PyObject* self, PyObject *args, PyObject *kwargs)
   char *sdateFormat = NULL;
   PyObject *oisoDates = 0;
   PyObject *odefHandler = 0;
+  PyObject *olines = NULL;
 
   PyObjectEncoder pyEncoder =
   {
@@ -1903,7 +1904,7 @@ PyObject* objToJSON(PyObject* self, PyObject *args, PyObject *kwargs)
 
   PRINTMARK();
 
-  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|OiOssOO", kwlist, &oinput, &oensureAscii, &idoublePrecision, &oencodeHTMLChars, &sOrient, &sdateFormat, &oisoDates, &odefHandler))
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|OiOssOOO", kwlist, &oinput, &oensureAscii, &idoublePrecision, &oencodeHTMLChars, &sOrient, &sdateFormat, &oisoDates, &odefHandler, &olines))
   {
     return NULL;
   }
@@ -1918,6 +1919,12 @@ PyObject* objToJSON(PyObject* self, PyObject *args, PyObject *kwargs)
     encoder->encodeHTMLChars = 1;
   }
 
+  encoder->lineDelimited = 0;
+  if (olines != NULL && PyObject_IsTrue(olines))
+  {
+    encoder->lineDelimited = 1;
+  }
+
   if (idoublePrecision > JSON_DOUBLE_MAX_DECIMALS || idoublePrecision < 0)
   {
       PyErr_Format (
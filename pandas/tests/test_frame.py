@@ -16,7 +16,7 @@ from distutils.version import LooseVersion
 
 from pandas.compat import(
     map, zip, range, long, lrange, lmap, lzip,
-    OrderedDict, u, StringIO
+    OrderedDict, u, StringIO, BytesIO
 )
 from pandas import compat
 
@@ -6571,6 +6571,51 @@ class TestDataFrame(tm.TestCase, CheckIndexing,
             expected = 'A\nhello\n{"hello"}\n'
             self.assertEqual(result, expected)
 
+    def test_to_csv_native_writer(self):
+        # rows formatted by lib.CSVWriter match the csv module output
+        df = DataFrame({'float': [1.5, np.nan, 1e-20, -np.inf],
+                        'int': np.array([1, -2, 3, 4], dtype=np.int32),
+                        'bool': [True, False, True, False],
+                        'date': [Timestamp('2013-01-01'), pd.NaT,
+                                 Timestamp('2013-01-01 00:00:00.000001'),
+                                 Timestamp('2013-01-01 00:00:00.000000001')],
+                        'str': ['a,b', 'say "hi"', None, 'line\nbreak']},
+                       columns=['float', 'int', 'bool', 'date', 'str'],
+                       index=Index(['x', 'y', 'z', 'w'], name='key'))
+
+        options = [{},
+                   dict(na_rep='NA', float_format='%.3f'),
+                   dict(float_format='%.1f%%'),
+                   dict(date_format='%Y%m%d %H:%M:%S.%f'),
+                   dict(date_format='%b %Y'),
+                   dict(quoting=csv.QUOTE_ALL, sep=';'),
+                   dict(quoting=csv.QUOTE_NONNUMERIC, float_format='%.2e'),
+                   dict(quoting=csv.QUOTE_NONE, escapechar='\\'),
+                   dict(doublequote=False, escapechar='\\', index=False),
+                   dict(line_terminator='\r\n', index=False)]
+
+        for kwargs in options:
+            result = StringIO()
+            formatter = fmt.CSVFormatter(df, result, **kwargs)
+            formatter.save()
+            if 'date_format' not in kwargs:
+                self.assertTrue(formatter.native_writer is not None)
+
+            expected = StringIO()
+            formatter = fmt.CSVFormatter(df, expected, **kwargs)
+            formatter._can_write_native = lambda: False
+            formatter.save()
+            self.assertEqual(result.getvalue(), expected.getvalue())
+
+        # a lone empty field is quoted, as the csv module does
+        df = DataFrame({'A': ['a', '', np.nan]})
+        buf = StringIO()
+        df.to_csv(buf, index=False)
+        self.assertEqual(buf.getvalue(), 'A\na\n""\n""\n')
+
+        with tm.assertRaises(csv.Error):
+            df.to_csv(StringIO(), index=False, quoting=csv.QUOTE_NONE)
+
     def test_to_csv_index_no_leading_comma(self):
         df = DataFrame({'A': [1, 2, 3], 'B': [4, 5, 6]},
                        index=['one', 'two', 'three'])
@@ -6632,6 +6677,54 @@ class TestDataFrame(tm.TestCase, CheckIndexing,
         recons = pd.read_csv(StringIO(csv_str), index_col=0)
         assert_frame_equal(self.frame, recons)
 
+    def test_to_csv_compression(self):
+        import gzip
+        import bz2
+        df = DataFrame([[0.123456, 0.234567, 0.567567],
+                        [12.32112, 123123.2, 321321.2]],
+                       index=['A', 'B'], columns=['X', 'Y', 'Z'])
+        expected = df.to_csv()
+
+        openers = {'gzip': gzip.open, 'bz2': bz2.BZ2File}
+        for compression, opener in compat.iteritems(openers):
+            with ensure_clean() as path:
+                df.to_csv(path, compression=compression)
+
+                f = opener(path, 'rb')
+                try:
+                    text = f.read().decode('utf-8')
+                finally:
+                    f.close()
+                self.assertEqual(text, expected)
+
+                result = read_csv(path, index_col=0,
+                                  compression=compression)
+                assert_frame_equal(result, df)
+
+            # any writable stream receives the compressed bytes
+            buf = BytesIO()
+            df.to_csv(buf, compression=compression, chunksize=1)
+            with ensure_clean() as path:
+                with open(path, 'wb') as f:
+                    f.write(buf.getvalue())
+                f = opener(path, 'rb')
+                try:
+                    text = f.read().decode('utf-8')
+                finally:
+                    f.close()
+                self.assertEqual(text, expected)
+
+        with tm.assertRaises(ValueError):
+            df.to_csv(BytesIO(), compression='zip')
+        with tm.assertRaises(ValueError):
+            df.to_csv(compression='gzip')
+
+        # uncompressed text goes through to binary streams encoded
+        if compat.PY3:
+            buf = BytesIO()
+            df.to_csv(buf)
+            self.assertEqual(buf.getvalue().decode('utf-8'), expected)
+
     def test_info(self):
         io = StringIO()
         self.frame.info(buf=io)
@@ -447,6 +447,24 @@ tseries_depends = ['pandas/src/datetime/np_datetime.h',
 # some linux distros require it
 libraries = ['m'] if 'win32' not in sys.platform else []
 
+
+def _have_header(header):
+    from distutils import sysconfig
+    dirs = [sysconfig.get_config_var('INCLUDEDIR'),
+            '/usr/include', '/usr/local/include', '/opt/local/include']
+    return any(os.path.exists(pjoin(d, header)) for d in dirs if d)
+
+# native decompression in the C parser, if the headers are available;
+# otherwise the parser falls back to decompressing through Python
+parser_macros = []
+parser_libraries = []
+if 'win32' not in sys.platform:
+    for header, lib, macro in [('zlib.h', 'z', 'HAVE_ZLIB'),
+                               ('bzlib.h', 'bz2', 'HAVE_BZLIB')]:
+        if _have_header(header):
+            parser_macros.append((macro, '1'))
+            parser_libraries.append(lib)
+
 ext_data = dict(
     lib={'pyxfile': 'lib',
          'pxdfiles': [],
@@ -467,9 +485,13 @@ ext_data = dict(
     parser=dict(pyxfile='parser',
                 depends=['pandas/src/parser/tokenizer.h',
                          'pandas/src/parser/io.h',
-                         'pandas/src/numpy_helper.h'],
+                         'pandas/src/numpy_helper.h'] + tseries_depends,
                 sources=['pandas/src/parser/tokenizer.c',
-                         'pandas/src/parser/io.c'])
+                         'pandas/src/parser/io.c',
+                         'pandas/src/datetime/np_datetime.c',
+                         'pandas/src/datetime/np_datetime_strings.c'],
+                macros=parser_macros,
+                libraries=parser_libraries)
 )
 
 extensions = []
@@ -487,7 +509,9 @@ for name, data in ext_data.items():
     obj = Extension('pandas.%s' % name,
                     sources=sources,
                     depends=data.get('depends', []),
-                    include_dirs=include)
+                    include_dirs=include,
+                    define_macros=data.get('macros', []),
+                    libraries=data.get('libraries', []))
 
     extensions.append(obj)
 